@@ -104,6 +104,8 @@ def main():
         except Exception as e:
             print(f"Error loading game: {e}")
             return
+        finally:
+            save_manager.close()
     
     # Run the application (initialization happens in on_ready)
     app.run()
@@ -7,6 +7,7 @@ Manages game events, notifications, and event-driven gameplay mechanics.
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 import logging
+import uuid
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -59,7 +60,6 @@ class GameEvent:
     def __post_init__(self):
         """Validate event after creation."""
         if not self.id:
-            import uuid
             self.id = str(uuid.uuid4())
 
 
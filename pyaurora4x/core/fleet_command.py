@@ -7,6 +7,7 @@ and logistics for comprehensive fleet management and tactical gameplay.
 
 from typing import Dict, List, Optional, Any, Union, Tuple
 from pydantic import BaseModel, Field
+import itertools
 import uuid
 from datetime import datetime
 
@@ -17,10 +18,26 @@ from pyaurora4x.core.enums import (
 from pyaurora4x.core.models import Vector3D
 
 
+# Orders and engagements are created every tick, so they get sequential IDs
+# instead of a uuid4 each. The per-process prefix keeps IDs from different
+# runs apart.
+_RUN_ID = uuid.uuid4().hex[:8]
+_ORDER_IDS = itertools.count(1)
+_ENGAGEMENT_IDS = itertools.count(1)
+
+
+def _next_order_id() -> str:
+    return f"order-{_RUN_ID}-{next(_ORDER_IDS)}"
+
+
+def _next_engagement_id() -> str:
+    return f"engagement-{_RUN_ID}-{next(_ENGAGEMENT_IDS)}"
+
+
 class FleetOrder(BaseModel):
     """Represents a fleet order with parameters and execution details."""
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_next_order_id)
     fleet_id: str
     order_type: OrderType
     priority: OrderPriority = OrderPriority.NORMAL
@@ -32,6 +49,7 @@ class FleetOrder(BaseModel):
     target_fleet_id: Optional[str] = None
     target_system_id: Optional[str] = None
     target_planet_id: Optional[str] = None
+    formation_template_id: Optional[str] = None  # For form-up and change-formation orders
     
     # Execution details
     created_time: float = 0.0
@@ -237,7 +255,7 @@ class LogisticsRequirements(BaseModel):
 class CombatEngagement(BaseModel):
     """Represents an active combat engagement between fleets."""
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_next_engagement_id)
     
     # Participants
     attacking_fleets: List[str] = Field(default_factory=list)
@@ -283,6 +301,7 @@ class FleetCommandState(BaseModel):
     
     # Formation state
     formation_state: Optional[FleetFormationState] = None
+    # Fleet-specific templates; empty while the fleet uses the shared ones
     formation_templates: Dict[str, FormationTemplate] = Field(default_factory=dict)
     
     # Combat capabilities
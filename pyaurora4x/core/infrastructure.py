@@ -135,6 +135,7 @@ class ColonyInfrastructureState(BaseModel):
     total_power_consumption: float = 0.0
     total_population_capacity: int = 1000  # Default capacity
     total_defense_value: float = 0.0
+    assigned_population: int = 0  # Population required by existing buildings
     
     # Efficiency factors
     overall_efficiency: float = 1.0
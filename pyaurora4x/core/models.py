@@ -4,8 +4,8 @@ Core data models for PyAurora 4X
 Defines the main game entities using Pydantic for validation and serialization.
 """
 
-from typing import List, Dict, Optional, Any
-from pydantic import BaseModel, Field
+from typing import List, Dict, Optional, Any, Union
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from datetime import datetime
 import uuid
 
@@ -40,6 +40,10 @@ class Vector3D(BaseModel):
         """Calculate the magnitude of the vector."""
         return (self.x**2 + self.y**2 + self.z**2) ** 0.5
 
+    def magnitude_squared(self) -> float:
+        """Calculate the squared magnitude, avoiding the square root."""
+        return self.x * self.x + self.y * self.y + self.z * self.z
+
     def normalize(self) -> "Vector3D":
         """Return a normalized version of this vector."""
         mag = self.magnitude()
@@ -49,7 +53,13 @@ class Vector3D(BaseModel):
 
 
 class Technology(BaseModel):
-    """Represents a technology that can be researched."""
+    """
+    Represents a technology that can be researched.
+
+    Research progress is stored on the instance, so each empire holds its
+    own shallow copies of the tech tree's technologies. The copies share
+    the prerequisite and unlock lists, which are never modified.
+    """
 
     id: str
     name: str
@@ -62,7 +72,14 @@ class Technology(BaseModel):
 
 
 class ShipComponent(BaseModel):
-    """Represents a ship component/module."""
+    """
+    Represents a ship component/module.
+
+    Components are catalog entries shared by every design and manager that
+    uses them, so they are immutable once created.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     id: str
     name: str
@@ -74,6 +91,53 @@ class ShipComponent(BaseModel):
     tech_requirements: List[str] = Field(default_factory=list)
     attributes: Dict[str, Any] = Field(default_factory=dict)
 
+    # Attributes read on every design validation, promoted to fields. They
+    # are filled from ``attributes`` unless given explicitly, and accept
+    # whatever the free-form attributes of modded catalogs hold.
+    power_output: float = 0.0
+    crew_capacity: Union[int, float] = 0
+    fuel_consumption: float = 0.0
+    fuel_type: Optional[str] = None
+
+    @field_validator("power_output", "crew_capacity", "fuel_consumption", mode="before")
+    @classmethod
+    def _lenient_number(cls, value: Any) -> Any:
+        """Read numeric strings as numbers and treat anything else as 0."""
+        if isinstance(value, (int, float)):
+            return value
+        for convert in (int, float):
+            try:
+                return convert(value)
+            except (TypeError, ValueError):
+                pass
+        return 0
+
+    @field_validator("fuel_type", mode="before")
+    @classmethod
+    def _lenient_fuel_type(cls, value: Any) -> Optional[str]:
+        """Store any non-null fuel type as a string."""
+        return None if value is None else str(value)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _promote_attributes(cls, data: Any) -> Any:
+        """Copy the promoted values out of ``attributes``."""
+        if isinstance(data, dict):
+            attributes = data.get("attributes") or {}
+            promoted = {
+                name: attributes[name]
+                for name in (
+                    "power_output",
+                    "crew_capacity",
+                    "fuel_consumption",
+                    "fuel_type",
+                )
+                if name in attributes and name not in data
+            }
+            if promoted:
+                data = {**data, **promoted}
+        return data
+
 
 class ShipDesign(BaseModel):
     """Represents a ship design template."""
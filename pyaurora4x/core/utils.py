@@ -5,14 +5,22 @@ Common mathematical and helper functions used throughout the game.
 """
 
 import math
-from typing import List, Tuple, Any, Dict
+from bisect import bisect_right
+from typing import List, Tuple, Any, Dict, Sequence
 import random
 import logging
+import uuid
+
+import numpy as np
+from numpy.typing import ArrayLike
 
 from pyaurora4x.core.models import Vector3D
 
 logger = logging.getLogger(__name__)
 
+GRAVITATIONAL_CONSTANT = 6.67430e-11  # m^3 kg^-1 s^-2
+TWO_PI = 2.0 * math.pi
+
 
 def distance_3d(pos1: Vector3D, pos2: Vector3D) -> float:
     """
@@ -43,17 +51,45 @@ def angle_between_vectors(v1: Vector3D, v2: Vector3D) -> float:
         Angle between vectors in radians
     """
     dot_product = v1.x * v2.x + v1.y * v2.y + v1.z * v2.z
-    mag1 = v1.magnitude()
-    mag2 = v2.magnitude()
+    mag_sq_product = v1.magnitude_squared() * v2.magnitude_squared()
     
-    if mag1 == 0 or mag2 == 0:
+    if mag_sq_product == 0:
         return 0.0
     
-    cos_angle = dot_product / (mag1 * mag2)
+    cos_angle = dot_product / math.sqrt(mag_sq_product)
     cos_angle = max(-1.0, min(1.0, cos_angle))  # Clamp to valid range
     return math.acos(cos_angle)
 
 
+def within_angle(v1: Vector3D, v2: Vector3D, max_angle: float) -> bool:
+    """
+    Check whether the angle between two vectors is at most ``max_angle``.
+    
+    Equivalent to ``angle_between_vectors(v1, v2) <= max_angle`` but
+    compares ``dot²`` against ``cos²θ·|v1|²·|v2|²`` so detection loops
+    need neither ``sqrt`` nor ``acos``.
+    
+    Args:
+        v1: First vector
+        v2: Second vector
+        max_angle: Threshold angle in radians
+        
+    Returns:
+        True if the vectors are within the threshold angle
+    """
+    dot_product = v1.x * v2.x + v1.y * v2.y + v1.z * v2.z
+    mag_sq_product = v1.magnitude_squared() * v2.magnitude_squared()
+    
+    if mag_sq_product == 0:
+        return True
+    
+    cos_max = math.cos(max_angle)
+    threshold = cos_max * cos_max * mag_sq_product
+    if cos_max >= 0:
+        return dot_product >= 0 and dot_product * dot_product >= threshold
+    return dot_product >= 0 or dot_product * dot_product <= threshold
+
+
 def vector_add(v1: Vector3D, v2: Vector3D) -> Vector3D:
     """Add two vectors."""
     return Vector3D(x=v1.x + v2.x, y=v1.y + v2.y, z=v1.z + v2.z)
@@ -81,13 +117,22 @@ def dot_product(v1: Vector3D, v2: Vector3D) -> float:
     return v1.x * v2.x + v1.y * v2.y + v1.z * v2.z
 
 
+def cross_product_raw(
+    x1: float, y1: float, z1: float, x2: float, y2: float, z2: float
+) -> Tuple[float, float, float]:
+    """
+    Cross product of two vectors given as plain components.
+
+    Returns an ``(x, y, z)`` tuple without building a ``Vector3D``, for
+    physics code that feeds the result straight into further arithmetic.
+    """
+    return (y1 * z2 - z1 * y2, z1 * x2 - x1 * z2, x1 * y2 - y1 * x2)
+
+
 def cross_product(v1: Vector3D, v2: Vector3D) -> Vector3D:
     """Calculate the cross product of two vectors."""
-    return Vector3D(
-        x=v1.y * v2.z - v1.z * v2.y,
-        y=v1.z * v2.x - v1.x * v2.z,
-        z=v1.x * v2.y - v1.y * v2.x
-    )
+    x, y, z = cross_product_raw(v1.x, v1.y, v1.z, v2.x, v2.y, v2.z)
+    return Vector3D(x=x, y=y, z=z)
 
 
 def lerp(a: float, b: float, t: float) -> float:
@@ -147,6 +192,35 @@ def radians_to_degrees(radians: float) -> float:
     return radians * 180.0 / math.pi
 
 
+# Formatter lookup tables: a value below ``thresholds[i]`` is rendered with
+# ``table[i]``; anything at or beyond the last threshold uses the final entry.
+_TIME_THRESHOLDS = (60.0, 3600.0, 86400.0, 31536000.0)
+_TIME_TABLE = (
+    (1.0, "{:.1f}s"),
+    (60.0, "{:.1f}m"),
+    (3600.0, "{:.1f}h"),
+    (86400.0, "{:.1f}d"),
+    (31536000.0, "{:.1f}y"),
+)
+
+_DISTANCE_THRESHOLDS = (1000.0, 1e6, 1.496e8)
+_DISTANCE_TABLE = (
+    (1.0, "{:.1f} km"),
+    (1000.0, "{:.1f} Mm"),
+    (1e6, "{:.1f} Gm"),
+    (1.496e8, "{:.2f} AU"),
+)
+
+_EARTH_MASS = 5.972e24
+_SOLAR_MASS = 1.989e30
+_MASS_THRESHOLDS = (_EARTH_MASS, 0.1 * _SOLAR_MASS)
+_MASS_TABLE = (
+    (_EARTH_MASS, "{:.2f} M⊕"),
+    (_EARTH_MASS, "{:.1f} M⊕"),
+    (_SOLAR_MASS, "{:.2f} M☉"),
+)
+
+
 def format_time(seconds: float) -> str:
     """
     Format time in seconds to a human-readable string.
@@ -157,20 +231,8 @@ def format_time(seconds: float) -> str:
     Returns:
         Formatted time string
     """
-    if seconds < 60:
-        return f"{seconds:.1f}s"
-    elif seconds < 3600:
-        minutes = seconds / 60
-        return f"{minutes:.1f}m"
-    elif seconds < 86400:
-        hours = seconds / 3600
-        return f"{hours:.1f}h"
-    elif seconds < 31536000:
-        days = seconds / 86400
-        return f"{days:.1f}d"
-    else:
-        years = seconds / 31536000
-        return f"{years:.1f}y"
+    divisor, fmt = _TIME_TABLE[bisect_right(_TIME_THRESHOLDS, seconds)]
+    return fmt.format(seconds / divisor)
 
 
 def format_distance(distance_km: float) -> str:
@@ -183,15 +245,8 @@ def format_distance(distance_km: float) -> str:
     Returns:
         Formatted distance string
     """
-    if distance_km < 1000:
-        return f"{distance_km:.1f} km"
-    elif distance_km < 1e6:
-        return f"{distance_km/1000:.1f} Mm"
-    elif distance_km < 1.496e8:
-        return f"{distance_km/1e6:.1f} Gm"
-    else:
-        au = distance_km / 1.496e8
-        return f"{au:.2f} AU"
+    divisor, fmt = _DISTANCE_TABLE[bisect_right(_DISTANCE_THRESHOLDS, distance_km)]
+    return fmt.format(distance_km / divisor)
 
 
 def format_mass(mass_kg: float) -> str:
@@ -204,18 +259,8 @@ def format_mass(mass_kg: float) -> str:
     Returns:
         Formatted mass string
     """
-    earth_mass = 5.972e24
-    
-    if mass_kg < earth_mass:
-        ratio = mass_kg / earth_mass
-        return f"{ratio:.2f} M⊕"
-    else:
-        solar_mass = 1.989e30
-        ratio = mass_kg / solar_mass
-        if ratio < 0.1:
-            return f"{mass_kg/earth_mass:.1f} M⊕"
-        else:
-            return f"{ratio:.2f} M☉"
+    divisor, fmt = _MASS_TABLE[bisect_right(_MASS_THRESHOLDS, mass_kg)]
+    return fmt.format(mass_kg / divisor)
 
 
 def weighted_random_choice(choices: List[Tuple[Any, float]]) -> Any:
@@ -245,8 +290,7 @@ def weighted_random_choice(choices: List[Tuple[Any, float]]) -> Any:
 
 def generate_uuid() -> str:
     """Generate a unique identifier string."""
-    import uuid
-    return str(uuid.uuid4())
+    return uuid.uuid4().hex
 
 
 def deep_merge_dicts(dict1: Dict, dict2: Dict) -> Dict:
@@ -301,6 +345,38 @@ def calculate_travel_time(distance: float, max_speed: float, acceleration: float
         return 2 * time_to_max + cruise_time
 
 
+def calculate_travel_times(
+    distances: ArrayLike, max_speed: float, acceleration: float = None
+) -> np.ndarray:
+    """
+    Vectorized :func:`calculate_travel_time` for many candidate targets.
+    
+    Intended for planners that score every destination at once; the square
+    roots for the triangular velocity profile are taken in a single NumPy
+    call. Single-fleet queries should keep using the scalar version.
+    
+    Args:
+        distances: Distances to travel
+        max_speed: Maximum speed
+        acceleration: Acceleration (optional, for more realistic calculation)
+        
+    Returns:
+        Array of travel times matching ``distances``
+    """
+    d = np.asarray(distances, dtype=float)
+    if acceleration is None or acceleration <= 0:
+        if max_speed <= 0:
+            return np.full(d.shape, float('inf'))
+        return d / max_speed
+    
+    time_to_max = max_speed / acceleration
+    distance_to_max = 0.5 * acceleration * time_to_max ** 2
+    
+    triangular = 2 * np.sqrt(d / acceleration)
+    trapezoidal = 2 * time_to_max + (d - 2 * distance_to_max) / max_speed
+    return np.where(d <= 2 * distance_to_max, triangular, trapezoidal)
+
+
 def orbital_period(semi_major_axis: float, central_mass: float) -> float:
     """
     Calculate orbital period using Kepler's third law.
@@ -312,8 +388,37 @@ def orbital_period(semi_major_axis: float, central_mass: float) -> float:
     Returns:
         Orbital period in seconds
     """
-    G = 6.67430e-11  # Gravitational constant
-    return 2 * math.pi * math.sqrt(semi_major_axis**3 / (G * central_mass))
+    a = semi_major_axis
+    return TWO_PI * a * math.sqrt(a / (GRAVITATIONAL_CONSTANT * central_mass))
+
+
+class StarKepler:
+    """
+    Kepler's third law specialised for a single central mass.
+
+    ``G * M`` is constant for every body orbiting the same star, so its
+    inverse square root is computed once and each period reduces to
+    ``2π · a · sqrt(a) / sqrt(GM)``.
+    """
+
+    __slots__ = ("inv_sqrt_mu",)
+
+    def __init__(self, central_mass: float):
+        """
+        Args:
+            central_mass: Central mass in kilograms
+        """
+        self.inv_sqrt_mu = 1.0 / math.sqrt(GRAVITATIONAL_CONSTANT * central_mass)
+
+    def period(self, semi_major_axis: float) -> float:
+        """Orbital period in seconds for a semi-major axis in meters."""
+        a = semi_major_axis
+        return TWO_PI * a * math.sqrt(a) * self.inv_sqrt_mu
+
+    def periods(self, semi_major_axes: Sequence[float]) -> np.ndarray:
+        """Orbital periods in seconds for many semi-major axes at once."""
+        a = np.asarray(semi_major_axes, dtype=float)
+        return TWO_PI * a * np.sqrt(a) * self.inv_sqrt_mu
 
 
 def escape_velocity(mass: float, radius: float) -> float:
@@ -327,8 +432,7 @@ def escape_velocity(mass: float, radius: float) -> float:
     Returns:
         Escape velocity in m/s
     """
-    G = 6.67430e-11  # Gravitational constant
-    return math.sqrt(2 * G * mass / radius)
+    return math.sqrt(2 * GRAVITATIONAL_CONSTANT * mass / radius)
 
 
 def safe_divide(numerator: float, denominator: float, default: float = 0.0) -> float:
@@ -374,3 +478,36 @@ def sigmoid(x: float, steepness: float = 1.0, midpoint: float = 0.0) -> float:
         Sigmoid output (0 to 1)
     """
     return 1.0 / (1.0 + math.exp(-steepness * (x - midpoint)))
+
+
+def exponential_decay_arr(
+    initial_values: ArrayLike, decay_rate: ArrayLike, time: ArrayLike
+) -> np.ndarray:
+    """
+    Vectorized :func:`exponential_decay` for many values at once.
+
+    Arguments broadcast against each other, so a single rate or time can be
+    applied to a whole array of initial values.
+    """
+    return np.asarray(initial_values, dtype=float) * np.exp(
+        -np.asarray(decay_rate, dtype=float) * np.asarray(time, dtype=float)
+    )
+
+
+def sigmoid_arr(
+    x: ArrayLike, steepness: float = 1.0, midpoint: float = 0.0
+) -> np.ndarray:
+    """
+    Vectorized :func:`sigmoid` for many values at once.
+
+    Evaluated as ``0.5 * (1 + tanh(z / 2))`` so large inputs saturate to
+    0 or 1 instead of overflowing ``exp``.
+    """
+    z = steepness * (np.asarray(x, dtype=float) - midpoint)
+    return 0.5 * (1.0 + np.tanh(0.5 * z))
+
+
+def lerp_arr(a: ArrayLike, b: ArrayLike, t: ArrayLike) -> np.ndarray:
+    """Vectorized :func:`lerp` over broadcastable arrays."""
+    a = np.asarray(a, dtype=float)
+    return a + (np.asarray(b, dtype=float) - a) * np.asarray(t, dtype=float)
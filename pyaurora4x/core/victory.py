@@ -47,7 +47,7 @@ class VictoryProgress(BaseModel):
 class GameEndCondition(BaseModel):
     """Defines conditions that can end the game."""
     
-    condition_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    condition_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     name: str
     description: str
     
@@ -128,7 +128,7 @@ class VictoryStatistics(BaseModel):
 class GameResult(BaseModel):
     """Represents the final result of a completed game."""
     
-    game_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    game_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     
     # Game information
     game_start_time: float
@@ -221,7 +221,7 @@ def get_default_victory_config() -> VictoryConditionConfig:
 class VictoryAchievement(BaseModel):
     """Represents a special achievement or milestone."""
     
-    achievement_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    achievement_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     name: str
     description: str
     category: str  # "military", "economic", "scientific", "diplomatic", "exploration"
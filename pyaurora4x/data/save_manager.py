@@ -6,8 +6,15 @@ Handles game state serialization and persistence using DuckDB, TinyDB or JSON.
 
 import copy
 import json
+import mmap
 import os
-from typing import Any, Dict, List, Optional
+import re
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from operator import attrgetter, methodcaller
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -29,8 +36,108 @@ except ImportError:
     TINYDB_AVAILABLE = False
     logging.warning("TinyDB not available - using JSON fallback for saves")
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    ZSTD_AVAILABLE = False
+
+try:
+    import ijson
+
+    # Only the C backend beats re-decoding the header with the json module
+    IJSON_AVAILABLE = ijson.backend == "yajl2_c"
+except ImportError:  # pragma: no cover - optional dependency
+    IJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Listing saves only decodes the metadata block at the top of each file
+_METADATA_PREFIX = re.compile(rb'\s*\{\s*"metadata"\s*:\s*')
+_METADATA_READ_SIZE = 4096
+_JSON_DECODER = json.JSONDecoder()
+
+# Directory scans and file deletes use a thread pool past this many files
+_PARALLEL_FILE_THRESHOLD = 8
+_MAX_FILE_WORKERS = 8
+
+# File extension used by the file backend for each save format
+SAVE_FORMAT_SUFFIXES = {"json": ".json", "msgpack": ".msgpack"}
+
+# Extra extension for zstd-compressed save files, e.g. ``name.json.zst``
+COMPRESSED_SUFFIX = ".zst"
+_ZSTD_LEVEL = 3
+
+# zstd contexts are costly to create and not thread-safe, so each thread
+# keeps its own and reuses it across saves and loads
+_ZSTD_CONTEXTS = threading.local()
+
+
+def _zstd_compressor() -> Any:
+    """This thread's reusable zstd compression context."""
+    compressor = getattr(_ZSTD_CONTEXTS, "compressor", None)
+    if compressor is None:
+        compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+        _ZSTD_CONTEXTS.compressor = compressor
+    return compressor
+
+
+def _zstd_decompressor() -> Any:
+    """This thread's reusable zstd decompression context."""
+    decompressor = getattr(_ZSTD_CONTEXTS, "decompressor", None)
+    if decompressor is None:
+        decompressor = zstandard.ZstdDecompressor()
+        _ZSTD_CONTEXTS.decompressor = decompressor
+    return decompressor
+
+
+# Per-type converters used by SaveManager._json_serializer
+_SERIALIZER_CACHE: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _resolve_serializer(obj: Any) -> Callable[[Any], Any]:
+    """Pick the JSON conversion for ``obj``'s type; cached by the caller."""
+    if isinstance(obj, Enum):
+        return attrgetter("value")
+    if hasattr(obj, "model_dump"):
+        return methodcaller("model_dump")
+    if hasattr(obj, "__dict__"):
+        return attrgetter("__dict__")
+    if isinstance(obj, datetime):
+        return methodcaller("isoformat")
+    return str
+
+
+def _write_abandoned_saves(save_directory: Path, pending_saves: Dict[str, tuple]) -> None:
+    """
+    Write DuckDB saves a batching manager still had queued.
+
+    Registered with ``weakref.finalize``, so it runs when the manager is
+    garbage collected or at interpreter exit, and only holds the queue
+    itself rather than the manager.
+    """
+    if not pending_saves:
+        return
+    writer = SaveManager(save_directory=str(save_directory), use_duckdb=True)
+    writer._pending_saves.update(pending_saves)
+    pending_saves.clear()
+    writer.close()
+
 
 class SaveManager:
     """
@@ -41,7 +148,15 @@ class SaveManager:
     """
 
     def __init__(
-        self, save_directory: Optional[str] = None, *, use_duckdb: Optional[bool] = None
+        self,
+        save_directory: Optional[str] = None,
+        *,
+        use_duckdb: Optional[bool] = None,
+        batch_duckdb_saves: bool = False,
+        save_format: str = "json",
+        compress_saves: bool = False,
+        async_file_writes: bool = False,
+        normalized_state: bool = False,
     ):
         """
         Initialize the save manager.
@@ -52,6 +167,30 @@ class SaveManager:
                 when set. Otherwise defaults to ``"saves"``.
             use_duckdb: Force use of DuckDB if True or disable if False. If None,
                 uses DuckDB when available.
+            batch_duckdb_saves: Queue DuckDB saves in memory and write them in
+                a single transaction on :meth:`flush` (or before the next
+                load, list or delete). Intended for frequent autosaves.
+                Saves still queued when the manager is garbage collected or
+                the interpreter exits are written then.
+            save_format: Encoding for file-based saves, ``"json"`` or
+                ``"msgpack"``. MessagePack stores numbers in binary and needs
+                the optional ``msgpack`` package; saves in either format can
+                always be loaded.
+            compress_saves: Compress file-based saves with zstd, which needs
+                the optional ``zstandard`` package. Compressed and plain
+                saves can be mixed in one directory.
+            async_file_writes: Encode file-based saves on the calling thread
+                but write them to disk on a background thread, so autosaves
+                do not stall the game loop. Pending writes finish before the
+                next load, list or delete, and on :meth:`await_pending_saves`.
+                Write errors are logged when they happen and raised from the
+                next :meth:`flush`, :meth:`close` or
+                :meth:`await_pending_saves`.
+            normalized_state: Promise that saved game states contain only
+                JSON-native values (e.g. already passed through
+                ``model_dump(mode="json")``). The encoders then run without
+                the per-object fallback serializer and raise ``TypeError``
+                on anything they cannot encode natively.
         """
         if save_directory is None:
             save_directory = os.getenv("PYAURORA_SAVE_DIR", "saves")
@@ -67,9 +206,49 @@ class SaveManager:
 
         self.use_tinydb = (not self.use_duckdb) and TINYDB_AVAILABLE
 
+        if save_format not in SAVE_FORMAT_SUFFIXES:
+            raise ValueError(f"Unknown save format: {save_format}")
+        if save_format == "msgpack" and not MSGPACK_AVAILABLE:
+            logger.warning("msgpack not available - writing JSON save files")
+            save_format = "json"
+        self.save_format = save_format
+
+        if compress_saves and not ZSTD_AVAILABLE:
+            logger.warning("zstandard not available - writing uncompressed saves")
+            compress_saves = False
+        self.compress_saves = compress_saves
+
+        # Background writer for file saves; one worker keeps writes ordered
+        self.async_file_writes = async_file_writes
+        self._writer_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_writes: List[Future] = []
+        # Errors from finished background writes, raised on the next flush
+        self._write_errors: List[BaseException] = []
+
+        # Pre-normalized states never need the Python fallback serializer
+        self.normalized_state = normalized_state
+        self._default = None if normalized_state else self._json_serializer
+
         self.duckdb_path = self.save_directory / "saves.duckdb"
         self.saves_db_path = self.save_directory / "saves.db"
 
+        # Pending DuckDB rows keyed by save name when batching is enabled
+        self.batch_duckdb_saves = batch_duckdb_saves
+        self._pending_saves: Dict[str, tuple] = {}
+        self._duckdb_blob_state = True
+        if self.use_duckdb and batch_duckdb_saves:
+            weakref.finalize(
+                self, _write_abandoned_saves, self.save_directory, self._pending_saves
+            )
+
+        # Backend handles are opened on first use and reused until close()
+        self._duckdb_conn: Optional[Any] = None
+        self._tinydb: Optional[Any] = None
+
+        # save_name -> [(backend, metadata)] from the last listing, reset
+        # whenever this manager writes or deletes a save
+        self._save_index: Optional[Dict[str, List[Tuple[str, Dict[str, Any]]]]] = None
+
         if self.use_duckdb:
             logger.info("Using DuckDB for save management")
         elif self.use_tinydb:
@@ -86,37 +265,141 @@ class SaveManager:
             save_name: Name for the save file
 
         Returns:
-            Path to the saved file
+            Path to the saved file. With ``batch_duckdb_saves`` the save is
+            only queued and this is the database it will be written to on
+            :meth:`flush`; with ``async_file_writes`` the file is written
+            in the background.
         """
-        # Prepare save metadata
-        save_metadata = {
-            "save_name": save_name,
-            "save_date": datetime.now().isoformat(),
-            "game_version": "0.1.0",
-            "save_format_version": "1.0",
-        }
+        self._save_index = None
 
         # Create complete save data
-        save_data = {"metadata": save_metadata, "game_state": game_state}
+        save_data = {
+            "metadata": self._save_metadata(save_name),
+            "game_state": game_state,
+        }
 
         if self.use_duckdb:
+            if self.batch_duckdb_saves:
+                self._pending_saves[save_name] = self._duckdb_row(save_data)
+                return str(self.duckdb_path)
             return self._save_with_duckdb(save_data, save_name)
         if self.use_tinydb:
             return self._save_with_tinydb(save_data, save_name)
         return self._save_with_json(save_data, save_name)
 
+    def close(self) -> None:
+        """Flush queued saves and close any open database handles."""
+        try:
+            self.flush()
+        finally:
+            if self._writer_pool is not None:
+                self._writer_pool.shutdown(wait=True)
+                self._writer_pool = None
+            if self._duckdb_conn is not None:
+                self._duckdb_conn.close()
+                self._duckdb_conn = None
+            if self._tinydb is not None:
+                self._tinydb.close()
+                self._tinydb = None
+
+    def __enter__(self) -> "SaveManager":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _get_duckdb_conn(self) -> Any:
+        """Return the cached DuckDB connection, opening it on first use."""
+        if self._duckdb_conn is None:
+            conn = duckdb.connect(str(self.duckdb_path))
+            self._ensure_duckdb_schema(conn)
+            self._duckdb_conn = conn
+        return self._duckdb_conn
+
+    def _get_tinydb_table(self) -> Any:
+        """Return the TinyDB ``saves`` table, opening the database once."""
+        if self._tinydb is None:
+            self._tinydb = TinyDB(self.saves_db_path)
+        return self._tinydb.table("saves")
+
+    def _save_metadata(self, save_name: str) -> Dict[str, Any]:
+        """Build the metadata block stored alongside a new save."""
+        return {
+            "save_name": save_name,
+            "save_date": datetime.now().isoformat(),
+            "game_version": "0.1.0",
+            "save_format_version": "1.0",
+        }
+
+    def flush(self) -> None:
+        """
+        Write any queued DuckDB saves in one transaction and finish file writes.
+
+        Raises:
+            Exception: The first error raised by a background file write
+                since the last flush, if any
+        """
+        self._sync_pending_saves()
+        self._raise_write_errors()
+
+    def _sync_pending_saves(self) -> None:
+        """
+        Make queued saves visible before a read, list or delete.
+
+        Background write errors are logged and kept for the next explicit
+        flush, so they do not surface from unrelated reads.
+        """
+        if self._pending_saves:
+            self._flush_duckdb_saves()
+        self._collect_pending_writes()
+
+    def _collect_pending_writes(self) -> None:
+        """Wait for background file writes, logging and storing any errors."""
+        pending, self._pending_writes = self._pending_writes, []
+        for future in pending:
+            error = future.exception()
+            if error is not None:
+                logger.error(f"Error saving to JSON: {error}")
+                self._write_errors.append(error)
+
+    def _raise_write_errors(self) -> None:
+        """Raise the first stored background write error, if any."""
+        if self._write_errors:
+            errors, self._write_errors = self._write_errors, []
+            raise errors[0]
+
+    def _flush_duckdb_saves(self) -> None:
+        """Write the queued DuckDB rows, falling back to files on failure."""
+        rows = list(self._pending_saves.values())
+        self._pending_saves.clear()
+        try:
+            self._write_duckdb_rows(rows)
+            logger.info(f"Flushed {len(rows)} saves to DuckDB")
+        except Exception as e:  # pragma: no cover - runtime safety
+            logger.error(f"Error flushing saves to DuckDB: {e}")
+            for row in rows:
+                save_data = {
+                    "metadata": {
+                        "save_name": row[0],
+                        "save_date": row[1],
+                        "game_version": row[2],
+                        "save_format_version": row[3],
+                    },
+                    "game_state": self._json_loads(row[4]),
+                }
+                self._save_with_json(save_data, row[0])
+
     def _save_with_tinydb(self, save_data: Dict[str, Any], save_name: str) -> str:
         """Save using TinyDB."""
         try:
-            with TinyDB(self.saves_db_path) as db:
-                saves_table = db.table("saves")
+            saves_table = self._get_tinydb_table()
 
-                # Remove existing save with same name
-                SaveQuery = Query()
-                saves_table.remove(SaveQuery.metadata.save_name == save_name)
+            # Remove existing save with same name
+            SaveQuery = Query()
+            saves_table.remove(SaveQuery.metadata.save_name == save_name)
 
-                # Insert new save
-                saves_table.insert(self._convert_keys_to_strings(save_data))
+            # Insert new save
+            saves_table.insert(self._convert_keys_to_strings(save_data))
 
             logger.info(f"Game saved to TinyDB: {save_name}")
             return str(self.saves_db_path)
@@ -129,28 +412,7 @@ class SaveManager:
     def _save_with_duckdb(self, save_data: Dict[str, Any], save_name: str) -> str:
         """Save using DuckDB."""
         try:
-            with duckdb.connect(str(self.duckdb_path)) as conn:
-                conn.execute(
-                    "CREATE TABLE IF NOT EXISTS saves ("
-                    "save_name TEXT, save_date TEXT, game_version TEXT, "
-                    "save_format_version TEXT, game_state JSON)"
-                )
-                conn.execute("DELETE FROM saves WHERE save_name = ?", [save_name])
-                meta = save_data["metadata"]
-                game_json = json.dumps(
-                    self._convert_keys_to_strings(save_data["game_state"]),
-                    default=self._json_serializer,
-                )
-                conn.execute(
-                    "INSERT INTO saves VALUES (?, ?, ?, ?, ?)",
-                    [
-                        meta["save_name"],
-                        meta["save_date"],
-                        meta["game_version"],
-                        meta["save_format_version"],
-                        game_json,
-                    ],
-                )
+            self._write_duckdb_rows([self._duckdb_row(save_data)])
             logger.info(f"Game saved to DuckDB: {save_name}")
             return str(self.duckdb_path)
         except Exception as e:  # pragma: no cover - runtime safety
@@ -159,26 +421,129 @@ class SaveManager:
                 return self._save_with_tinydb(save_data, save_name)
             return self._save_with_json(save_data, save_name)
 
+    def _duckdb_row(self, save_data: Dict[str, Any]) -> tuple:
+        """Serialize ``save_data`` into a row for the DuckDB ``saves`` table."""
+        meta = save_data["metadata"]
+        return (
+            meta["save_name"],
+            meta["save_date"],
+            meta["game_version"],
+            meta["save_format_version"],
+            self._json_dumps(save_data["game_state"]),
+        )
+
+    def _ensure_duckdb_schema(self, conn: Any) -> None:
+        """
+        Create the ``saves`` table if needed and detect its storage type.
+
+        Runs once per connection. Existing databases only need the catalog
+        lookup; the DDL is issued only when the table is missing.
+
+        New databases store ``game_state`` as a BLOB of encoded JSON bytes,
+        which DuckDB keeps as-is instead of re-parsing the document on
+        insert. Databases created with the older JSON column keep working.
+        """
+        column_type = self._duckdb_state_column_type(conn)
+        if column_type is None:
+            try:
+                conn.execute(
+                    "CREATE TABLE saves ("
+                    "save_name TEXT, save_date TEXT, game_version TEXT, "
+                    "save_format_version TEXT, game_state BLOB)"
+                )
+            except duckdb.CatalogException:
+                # Another process created the table in the meantime
+                pass
+            column_type = self._duckdb_state_column_type(conn)
+        self._duckdb_blob_state = column_type == "BLOB"
+
+    @staticmethod
+    def _duckdb_state_column_type(conn: Any) -> Optional[str]:
+        """Type of the ``saves.game_state`` column, or None if there is no table."""
+        row = conn.execute(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = 'saves' AND column_name = 'game_state'"
+        ).fetchone()
+        return row[0] if row else None
+
+    def _write_duckdb_rows(self, rows: List[tuple]) -> None:
+        """Replace saves with ``rows`` using one DELETE and one INSERT."""
+        names = [row[0] for row in rows]
+        conn = self._get_duckdb_conn()
+        if not self._duckdb_blob_state:
+            rows = [row[:4] + (row[4].decode("utf-8"),) for row in rows]
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            conn.execute(
+                "DELETE FROM saves WHERE save_name IN "
+                f"({', '.join('?' for _ in names)})",
+                names,
+            )
+            conn.execute(
+                "INSERT INTO saves VALUES "
+                + ", ".join("(?, ?, ?, ?, ?)" for _ in rows),
+                [value for row in rows for value in row],
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
     def _save_with_json(self, save_data: Dict[str, Any], save_name: str) -> str:
-        """Save using JSON files."""
-        save_file = self.save_directory / f"{save_name}.json"
+        """Save using JSON (or MessagePack) files."""
+        save_file = self._save_file_candidates(save_name)[0]
 
         try:
-            with open(save_file, "w") as f:
-                json.dump(
-                    self._convert_keys_to_strings(save_data),
-                    f,
-                    indent=2,
-                    default=self._json_serializer,
+            if self.save_format == "msgpack":
+                payload = msgpack.packb(
+                    self._convert_keys_to_strings(save_data, msgpack_keys=True),
+                    default=self._default,
+                    use_bin_type=True,
                 )
-
-            logger.info(f"Game saved to JSON: {save_file}")
+            else:
+                payload = self._json_dumps(save_data, indent=not self.compress_saves)
+            if self.compress_saves:
+                payload = _zstd_compressor().compress(payload)
+
+            if self.async_file_writes:
+                if self._writer_pool is None:
+                    self._writer_pool = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="save-writer"
+                    )
+                self._pending_writes.append(
+                    self._writer_pool.submit(
+                        self._write_save_file, save_file, save_name, payload
+                    )
+                )
+            else:
+                self._write_save_file(save_file, save_name, payload)
             return str(save_file)
 
         except Exception as e:
             logger.error(f"Error saving to JSON: {e}")
             raise
 
+    def _write_save_file(self, save_file: Path, save_name: str, payload: bytes) -> None:
+        """Write an encoded save and remove copies of it in other formats."""
+        self._write_file_atomic(save_file, payload)
+
+        # Drop copies of this save left behind in other formats
+        for other_file in self._save_file_candidates(save_name)[1:]:
+            other_file.unlink(missing_ok=True)
+
+        logger.info(f"Game saved to {self.save_format.upper()}: {save_file}")
+
+    def await_pending_saves(self) -> None:
+        """
+        Block until background file writes have finished.
+
+        Raises:
+            Exception: The first error raised by a background write since
+                the last flush, if any
+        """
+        self._collect_pending_writes()
+        self._raise_write_errors()
+
     def load_game(self, save_identifier: str) -> Dict[str, Any]:
         """
         Load a game state.
@@ -189,6 +554,8 @@ class SaveManager:
         Returns:
             Game state dictionary
         """
+        self._sync_pending_saves()
+
         if self.use_duckdb:
             try:
                 return self._load_with_duckdb(save_identifier)
@@ -205,37 +572,34 @@ class SaveManager:
 
     def _load_with_tinydb(self, save_name: str) -> Dict[str, Any]:
         """Load using TinyDB."""
-        with TinyDB(self.saves_db_path) as db:
-            saves_table = db.table("saves")
-            SaveQuery = Query()
+        saves_table = self._get_tinydb_table()
+        SaveQuery = Query()
 
-            save_records = saves_table.search(SaveQuery.metadata.save_name == save_name)
+        save_records = saves_table.search(SaveQuery.metadata.save_name == save_name)
 
-            if not save_records:
-                raise FileNotFoundError(f"Save '{save_name}' not found in database")
+        if not save_records:
+            raise FileNotFoundError(f"Save '{save_name}' not found in database")
 
-            # Get the most recent save if multiple exist
-            save_data = save_records[-1]
+        # Get the most recent save if multiple exist
+        save_data = save_records[-1]
 
         logger.info(f"Game loaded from TinyDB: {save_name}")
         return self._migrate_save_data(save_data["game_state"])
 
     def _load_with_duckdb(self, save_name: str) -> Dict[str, Any]:
         """Load using DuckDB."""
-        with duckdb.connect(str(self.duckdb_path)) as conn:
-            conn.execute(
-                "CREATE TABLE IF NOT EXISTS saves ("
-                "save_name TEXT, save_date TEXT, game_version TEXT, "
-                "save_format_version TEXT, game_state JSON)"
-            )
-            row = conn.execute(
-                "SELECT game_state FROM saves WHERE save_name = ? ORDER BY save_date DESC LIMIT 1",
-                [save_name],
-            ).fetchone()
+        conn = self._get_duckdb_conn()
+        # Fetch raw bytes for both column types so no Python str is built
+        column = "game_state" if self._duckdb_blob_state else "encode(game_state::TEXT)"
+        row = conn.execute(
+            f"SELECT {column} FROM saves WHERE save_name = ? "
+            "ORDER BY save_date DESC LIMIT 1",
+            [save_name],
+        ).fetchone()
         if not row:
             raise FileNotFoundError(f"Save '{save_name}' not found in database")
         logger.info(f"Game loaded from DuckDB: {save_name}")
-        return self._migrate_save_data(json.loads(row[0]))
+        return self._migrate_save_data(self._json_loads(row[0]), copy_state=False)
 
     def _load_with_json(self, save_identifier: str) -> Dict[str, Any]:
         """Load using JSON files."""
@@ -244,14 +608,20 @@ class SaveManager:
 
         # If not a valid file, try as save name
         if not save_file.exists():
-            save_file = self.save_directory / f"{save_identifier}.json"
+            save_file = next(
+                (
+                    candidate
+                    for candidate in self._save_file_candidates(save_identifier)
+                    if candidate.exists()
+                ),
+                save_file,
+            )
 
         if not save_file.exists():
             raise FileNotFoundError(f"Save file not found: {save_identifier}")
 
         try:
-            with open(save_file, "r") as f:
-                save_data = json.load(f)
+            save_data = self._read_save_file(save_file)
 
             logger.info(f"Game loaded from JSON: {save_file}")
 
@@ -262,7 +632,7 @@ class SaveManager:
                 game_state = save_data
             
             # Apply migrations if needed
-            return self._migrate_save_data(game_state)
+            return self._migrate_save_data(game_state, copy_state=False)
 
         except Exception as e:
             logger.error(f"Error loading from JSON: {e}")
@@ -275,15 +645,26 @@ class SaveManager:
         Returns:
             List of save metadata dictionaries
         """
+        self._sync_pending_saves()
         saves = []
+        index: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
 
+        listings = []
         if self.use_duckdb and self.duckdb_path.exists():
-            saves.extend(self._list_duckdb_saves())
+            listings.append(("duckdb", self._list_duckdb_saves()))
 
         if self.use_tinydb and self.saves_db_path.exists():
-            saves.extend(self._list_tinydb_saves())
+            listings.append(("tinydb", self._list_tinydb_saves()))
 
-        saves.extend(self._list_json_saves())
+        listings.append(("file", self._list_json_saves()))
+
+        for backend, backend_saves in listings:
+            for metadata in backend_saves:
+                index.setdefault(metadata.get("save_name"), []).append(
+                    (backend, metadata)
+                )
+            saves.extend(backend_saves)
+        self._save_index = index
 
         # Sort by save date (newest first)
         saves.sort(key=lambda x: x.get("save_date", ""), reverse=True)
@@ -295,12 +676,9 @@ class SaveManager:
         saves = []
 
         try:
-            with TinyDB(self.saves_db_path) as db:
-                saves_table = db.table("saves")
-
-                for record in saves_table.all():
-                    if "metadata" in record:
-                        saves.append(record["metadata"])
+            for record in self._get_tinydb_table().all():
+                if "metadata" in record:
+                    saves.append(record["metadata"])
 
         except Exception as e:
             logger.error(f"Error listing TinyDB saves: {e}")
@@ -311,15 +689,9 @@ class SaveManager:
         """List saves stored in DuckDB."""
         saves = []
         try:
-            with duckdb.connect(str(self.duckdb_path)) as conn:
-                conn.execute(
-                    "CREATE TABLE IF NOT EXISTS saves ("
-                    "save_name TEXT, save_date TEXT, game_version TEXT, "
-                    "save_format_version TEXT, game_state JSON)"
-                )
-                rows = conn.execute(
-                    "SELECT save_name, save_date, game_version, save_format_version FROM saves"
-                ).fetchall()
+            rows = self._get_duckdb_conn().execute(
+                "SELECT save_name, save_date, game_version, save_format_version FROM saves"
+            ).fetchall()
             for row in rows:
                 saves.append(
                     {
@@ -336,33 +708,66 @@ class SaveManager:
 
     def _list_json_saves(self) -> List[Dict[str, Any]]:
         """List saves from JSON files."""
-        saves = []
+        suffixes = [SAVE_FORMAT_SUFFIXES["json"]]
+        if MSGPACK_AVAILABLE:
+            suffixes.append(SAVE_FORMAT_SUFFIXES["msgpack"])
+        if ZSTD_AVAILABLE:
+            suffixes += [suffix + COMPRESSED_SUFFIX for suffix in suffixes]
+        suffixes = tuple(suffixes)
+
+        # One directory pass; DirEntry caches the type and stat results
+        with os.scandir(self.save_directory) as entries:
+            save_files = [
+                entry
+                for entry in entries
+                if entry.name.endswith(suffixes) and entry.is_file()
+            ]
+
+        # Reading is I/O bound, so larger directories are scanned in parallel
+        if len(save_files) >= _PARALLEL_FILE_THRESHOLD:
+            with self._file_pool(len(save_files)) as pool:
+                results = list(pool.map(self._read_file_save_listing, save_files))
+        else:
+            results = [self._read_file_save_listing(f) for f in save_files]
 
-        for save_file in self.save_directory.glob("*.json"):
-            try:
-                with open(save_file, "r") as f:
-                    save_data = json.load(f)
+        return [metadata for metadata in results if metadata is not None]
+
+    def _read_file_save_listing(
+        self, entry: os.DirEntry
+    ) -> Optional[Dict[str, Any]]:
+        """Build the listing entry for one save file, or None if unreadable."""
+        save_file = Path(entry.path)
+        try:
+            metadata = self._read_save_metadata(save_file)
+            if metadata is None:
+                save_data = self._read_save_file(save_file)
 
                 if "metadata" in save_data:
                     metadata = save_data["metadata"]
                 else:
                     # Create metadata for old format saves
                     metadata = {
-                        "save_name": save_file.stem,
+                        "save_name": self._save_name_from_path(save_file),
                         "save_date": datetime.fromtimestamp(
-                            save_file.stat().st_mtime
+                            entry.stat().st_mtime
                         ).isoformat(),
                         "game_version": "unknown",
                         "save_format_version": "legacy",
                     }
 
-                metadata["file_path"] = str(save_file)
-                saves.append(metadata)
+            metadata["file_path"] = str(save_file)
+            return metadata
 
-            except Exception as e:
-                logger.warning(f"Error reading save file {save_file}: {e}")
+        except Exception as e:
+            logger.warning(f"Error reading save file {save_file}: {e}")
+            return None
 
-        return saves
+    @staticmethod
+    def _file_pool(task_count: int) -> ThreadPoolExecutor:
+        """Thread pool for independent per-file work."""
+        return ThreadPoolExecutor(
+            max_workers=min(_MAX_FILE_WORKERS, os.cpu_count() or 1, task_count)
+        )
 
     def delete_save(self, save_identifier: str) -> bool:
         """
@@ -374,55 +779,84 @@ class SaveManager:
         Returns:
             True if deletion was successful
         """
-        success = False
+        return bool(self._delete_saves([save_identifier]))
 
-        if self.use_duckdb:
-            success = self._delete_from_duckdb(save_identifier) or success
+    def _delete_saves(self, save_identifiers: List[str]) -> int:
+        """
+        Delete several saves, issuing one statement per database backend.
 
-        if self.use_tinydb:
-            success = self._delete_from_tinydb(save_identifier) or success
+        Returns:
+            Number of identifiers that were deleted from at least one backend
+        """
+        self._sync_pending_saves()
+        deleted = set()
+        if not save_identifiers:
+            return 0
 
-        success = self._delete_json_save(save_identifier) or success
+        # Names found by the last listing only go to the backends holding
+        # them; file paths and unknown names are tried everywhere
+        index = self._save_index or {}
+        targets: Dict[str, List[str]] = {"duckdb": [], "tinydb": [], "file": []}
+        for identifier in save_identifiers:
+            entries = index.get(identifier)
+            backends = {b for b, _ in entries} if entries else targets.keys()
+            for backend in backends:
+                targets[backend].append(identifier)
+        self._save_index = None
+
+        if self.use_duckdb and targets["duckdb"]:
+            deleted |= self._delete_from_duckdb(targets["duckdb"])
+
+        if self.use_tinydb and targets["tinydb"]:
+            deleted |= self._delete_from_tinydb(targets["tinydb"])
+
+        file_names = targets["file"]
+        if len(file_names) >= _PARALLEL_FILE_THRESHOLD:
+            with self._file_pool(len(file_names)) as pool:
+                removed = list(pool.map(self._delete_json_save, file_names))
+        else:
+            removed = [self._delete_json_save(name) for name in file_names]
+        deleted.update(
+            name for name, was_removed in zip(file_names, removed) if was_removed
+        )
 
-        return success
+        return len(deleted)
 
-    def _delete_from_tinydb(self, save_name: str) -> bool:
-        """Delete save from TinyDB."""
+    def _delete_from_tinydb(self, save_names: List[str]) -> set:
+        """Delete saves from TinyDB, returning the names that were removed."""
         try:
-            with TinyDB(self.saves_db_path) as db:
-                saves_table = db.table("saves")
-                SaveQuery = Query()
-
-                removed = saves_table.remove(SaveQuery.metadata.save_name == save_name)
+            saves_table = self._get_tinydb_table()
+            SaveQuery = Query()
 
-                if removed:
+            records = saves_table.search(SaveQuery.metadata.save_name.one_of(save_names))
+            if records:
+                saves_table.remove(doc_ids=[record.doc_id for record in records])
+                removed = {record["metadata"]["save_name"] for record in records}
+                for save_name in removed:
                     logger.info(f"Deleted save from TinyDB: {save_name}")
-                    return True
+                return removed
 
         except Exception as e:
             logger.error(f"Error deleting from TinyDB: {e}")
 
-        return False
+        return set()
 
-    def _delete_from_duckdb(self, save_name: str) -> bool:
-        """Delete save from DuckDB."""
+    def _delete_from_duckdb(self, save_names: List[str]) -> set:
+        """Delete saves from DuckDB, returning the names that were removed."""
         try:
-            with duckdb.connect(str(self.duckdb_path)) as conn:
-                conn.execute(
-                    "CREATE TABLE IF NOT EXISTS saves ("
-                    "save_name TEXT, save_date TEXT, game_version TEXT, "
-                    "save_format_version TEXT, game_state JSON)"
-                )
-                result = conn.execute(
-                    "DELETE FROM saves WHERE save_name = ?", [save_name]
-                ).rowcount
-            if result:
+            rows = self._get_duckdb_conn().execute(
+                "DELETE FROM saves WHERE save_name IN "
+                f"({', '.join('?' for _ in save_names)}) RETURNING save_name",
+                save_names,
+            ).fetchall()
+            removed = {row[0] for row in rows}
+            for save_name in removed:
                 logger.info(f"Deleted save from DuckDB: {save_name}")
-                return True
+            return removed
         except Exception as e:  # pragma: no cover - runtime safety
             logger.error(f"Error deleting from DuckDB: {e}")
 
-        return False
+        return set()
 
     def _delete_json_save(self, save_identifier: str) -> bool:
         """Delete JSON save file."""
@@ -430,18 +864,24 @@ class SaveManager:
         save_file = Path(save_identifier)
 
         # If not a valid file, try as save name
-        if not save_file.exists():
-            save_file = self.save_directory / f"{save_identifier}.json"
-
         if save_file.exists():
+            save_files = [save_file]
+        else:
+            save_files = self._save_file_candidates(save_identifier)
+
+        deleted = False
+        for save_file in save_files:
             try:
                 save_file.unlink()
-                logger.info(f"Deleted JSON save: {save_file}")
-                return True
+            except FileNotFoundError:
+                continue
             except Exception as e:
-                logger.error(f"Error deleting JSON save: {e}")
+                logger.error(f"Error deleting save file: {e}")
+            else:
+                logger.info(f"Deleted save file: {save_file}")
+                deleted = True
 
-        return False
+        return deleted
 
     def export_save(self, save_identifier: str, export_path: str) -> str:
         """
@@ -476,10 +916,7 @@ class SaveManager:
                     "export_name TEXT, export_date TEXT, game_version TEXT, "
                     "save_format_version TEXT, game_state JSON)"
                 )
-                data_json = json.dumps(
-                    self._convert_keys_to_strings(export_data["game_state"]),
-                    default=self._json_serializer,
-                )
+                data_json = self._json_dumps(export_data["game_state"]).decode("utf-8")
                 conn.execute(
                     "INSERT INTO exports VALUES (?, ?, ?, ?, ?)",
                     [
@@ -491,8 +928,9 @@ class SaveManager:
                     ],
                 )
         else:
-            with open(export_file, "w") as f:
-                json.dump(export_data, f, indent=2, default=self._json_serializer)
+            self._write_file_atomic(
+                export_file, self._json_dumps(export_data, indent=True)
+            )
 
         logger.info(f"Save exported to: {export_file}")
         return str(export_file)
@@ -513,8 +951,15 @@ class SaveManager:
         if not import_file.exists():
             raise FileNotFoundError(f"Import file not found: {import_path}")
 
-        with open(import_file, "r") as f:
-            import_data = json.load(f)
+        # Generate save name if not provided
+        if not save_name:
+            save_name = f"imported_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        if self.use_duckdb and self._import_with_duckdb(import_file, save_name):
+            logger.info(f"Save imported as: {save_name}")
+            return save_name
+
+        import_data = self._read_json_file(import_file)
 
         # Extract game state
         if "game_state" in import_data:
@@ -522,16 +967,59 @@ class SaveManager:
         else:
             game_state = import_data
 
-        # Generate save name if not provided
-        if not save_name:
-            save_name = f"imported_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-
         # Save the imported game
         self.save_game(game_state, save_name)
 
         logger.info(f"Save imported as: {save_name}")
         return save_name
 
+    def _import_with_duckdb(self, import_file: Path, save_name: str) -> bool:
+        """
+        Import a JSON file straight into the DuckDB ``saves`` table.
+
+        DuckDB reads and parses the file itself, so the game state is never
+        materialized as Python objects. Returns False if the file could not
+        be imported this way and the regular path should be used instead.
+        """
+        # read_text() treats these characters as glob patterns
+        if any(char in str(import_file) for char in "*?[{"):
+            return False
+
+        self._sync_pending_saves()
+        self._save_index = None
+        meta = self._save_metadata(save_name)
+        try:
+            conn = self._get_duckdb_conn()
+            state_sql = (
+                "CASE WHEN json_exists(content, '$.game_state') "
+                "THEN json_extract(content, '$.game_state') "
+                "ELSE content::JSON END"
+            )
+            if self._duckdb_blob_state:
+                state_sql = f"encode(CAST({state_sql} AS TEXT))"
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                conn.execute("DELETE FROM saves WHERE save_name = ?", [save_name])
+                conn.execute(
+                    f"INSERT INTO saves SELECT ?, ?, ?, ?, {state_sql} "
+                    "FROM read_text(?)",
+                    [
+                        meta["save_name"],
+                        meta["save_date"],
+                        meta["game_version"],
+                        meta["save_format_version"],
+                        str(import_file),
+                    ],
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except Exception as e:
+            logger.debug(f"DuckDB import failed, parsing in Python: {e}")
+            return False
+        return True
+
     def cleanup_old_saves(self, keep_count: int = 10) -> int:
         """
         Clean up old save files, keeping only the most recent ones.
@@ -555,36 +1043,247 @@ class SaveManager:
         else:
             saves_to_delete = saves[keep_count:]
 
-        deleted_count = 0
-        for save_metadata in saves_to_delete:
-            save_name = save_metadata["save_name"]
-            if self.delete_save(save_name):
-                deleted_count += 1
+        deleted_count = self._delete_saves(
+            list(dict.fromkeys(save["save_name"] for save in saves_to_delete))
+        )
 
         logger.info(f"Cleaned up {deleted_count} old saves")
         return deleted_count
 
+    def _json_dumps(self, obj: Any, *, indent: bool = False) -> bytes:
+        """
+        Encode ``obj`` as UTF-8 JSON, using orjson when it is installed.
+
+        Both encoders stringify primitive non-string dictionary keys
+        themselves, so the recursive key conversion pass only runs if one
+        rejects a key (a tuple, for example).
+        """
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(obj, default=self._default, option=option)
+            except TypeError:
+                return orjson.dumps(
+                    self._convert_keys_to_strings(obj),
+                    default=self._default,
+                    option=option,
+                )
+        indent_level = 2 if indent else None
+        try:
+            encoded = json.dumps(obj, indent=indent_level, default=self._default)
+        except TypeError:
+            encoded = json.dumps(
+                self._convert_keys_to_strings(obj),
+                indent=indent_level,
+                default=self._default,
+            )
+        return encoded.encode("utf-8")
+
+    def _json_loads(self, data: Any) -> Any:
+        """Decode JSON from ``bytes`` or ``str``."""
+        if ORJSON_AVAILABLE:
+            return orjson.loads(data)
+        return json.loads(data)
+
+    def _write_file_atomic(self, path: Path, payload: bytes) -> None:
+        """
+        Write ``payload`` to ``path`` in a single call, atomically.
+
+        The data goes to a temporary sibling file that then replaces the
+        target, so a crash mid-write never leaves a truncated save behind.
+        """
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _read_json_file(self, path: Path) -> Any:
+        """
+        Decode a JSON file.
+
+        With orjson the file is memory-mapped and parsed in place, skipping
+        the intermediate ``bytes`` copy of the whole file.
+        """
+        with open(path, "rb") as f:
+            if ORJSON_AVAILABLE:
+                try:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:  # empty files cannot be mapped
+                    pass
+                else:
+                    with mapped, memoryview(mapped) as view:
+                        return orjson.loads(view)
+            return self._json_loads(f.read())
+
+    def _save_file_candidates(self, save_name: str) -> List[Path]:
+        """Possible save file paths for ``save_name``, preferred format first."""
+        preferred = SAVE_FORMAT_SUFFIXES[self.save_format]
+        suffixes = sorted(
+            SAVE_FORMAT_SUFFIXES.values(), key=lambda suffix: suffix != preferred
+        )
+        compressed = [suffix + COMPRESSED_SUFFIX for suffix in suffixes]
+        if self.compress_saves:
+            suffixes = compressed + suffixes
+        else:
+            suffixes = suffixes + compressed
+        return [self.save_directory / (save_name + suffix) for suffix in suffixes]
+
+    @staticmethod
+    def _save_name_from_path(path: Path) -> str:
+        """Strip the format and compression extensions from a save file name."""
+        name = path.name
+        if name.endswith(COMPRESSED_SUFFIX):
+            name = name[: -len(COMPRESSED_SUFFIX)]
+        for suffix in SAVE_FORMAT_SUFFIXES.values():
+            if name.endswith(suffix):
+                return name[: -len(suffix)]
+        return path.stem
+
+    @staticmethod
+    def _is_msgpack_file(path: Path) -> bool:
+        """Whether ``path`` holds a MessagePack save, compressed or not."""
+        name = path.name
+        if name.endswith(COMPRESSED_SUFFIX):
+            name = name[: -len(COMPRESSED_SUFFIX)]
+        return name.endswith(SAVE_FORMAT_SUFFIXES["msgpack"])
+
+    @staticmethod
+    @contextmanager
+    def _open_save_stream(path: Path) -> Iterator[BinaryIO]:
+        """Open a save file for reading, decompressing ``.zst`` files on the fly."""
+        with open(path, "rb") as f:
+            if path.suffix != COMPRESSED_SUFFIX:
+                yield f
+                return
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError(f"zstandard is required to read {path}")
+            with _zstd_decompressor().stream_reader(f) as reader:
+                yield reader
+
+    def _read_save_file(self, path: Path) -> Any:
+        """Decode a JSON or MessagePack save file based on its extension."""
+        if path.suffix == COMPRESSED_SUFFIX:
+            with self._open_save_stream(path) as stream:
+                data = stream.read()
+            if self._is_msgpack_file(path):
+                return msgpack.unpackb(data, raw=False, strict_map_key=False)
+            return self._json_loads(data)
+        if self._is_msgpack_file(path):
+            with open(path, "rb") as f:
+                return msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+        return self._read_json_file(path)
+
+    def _read_save_metadata(self, save_file: Path) -> Optional[Dict[str, Any]]:
+        """Decode only the leading metadata block of a JSON or MessagePack save."""
+        if not self._is_msgpack_file(save_file):
+            return self._read_json_metadata(save_file)
+
+        with self._open_save_stream(save_file) as f:
+            unpacker = msgpack.Unpacker(f, raw=False, strict_map_key=False)
+            try:
+                if not unpacker.read_map_header() or unpacker.unpack() != "metadata":
+                    return None
+                metadata = unpacker.unpack()
+            except (msgpack.UnpackException, ValueError, StopIteration):
+                return None
+        return metadata if isinstance(metadata, dict) else None
+
+    def _read_json_metadata(self, save_file: Path) -> Optional[Dict[str, Any]]:
+        """
+        Decode only the leading ``metadata`` object of a save file.
+
+        Saves are written with metadata as the first key, so listing them
+        only needs a small prefix of each file rather than the full game
+        state. The prefix is read forward in growing chunks until the
+        metadata object fits, which also works on compressed streams. With
+        ijson's C backend installed the header is stream-parsed instead.
+        Returns ``None`` if the file does not start with a metadata object.
+        """
+        read_size = _METADATA_READ_SIZE
+        with self._open_save_stream(save_file) as f:
+            if IJSON_AVAILABLE:
+                return self._stream_json_metadata(f)
+
+            head = f.read(read_size)
+            while True:
+                match = _METADATA_PREFIX.match(head)
+                if not match:
+                    return None
+                try:
+                    metadata, _ = _JSON_DECODER.raw_decode(
+                        head[match.end():].decode("utf-8", errors="ignore")
+                    )
+                except json.JSONDecodeError:
+                    chunk = f.read(read_size)
+                    if not chunk:
+                        return None
+                    head += chunk
+                    read_size *= 4
+                    continue
+                return metadata if isinstance(metadata, dict) else None
+
+    @staticmethod
+    def _stream_json_metadata(stream: BinaryIO) -> Optional[Dict[str, Any]]:
+        """Parse events from ``stream`` only until the leading metadata ends."""
+        events = ijson.parse(stream, use_float=True)
+        try:
+            if next(events)[1] != "start_map" or next(events)[1:] != (
+                "map_key",
+                "metadata",
+            ):
+                return None
+            metadata = next(ijson.items(events, "metadata"), None)
+        except (ijson.JSONError, StopIteration):
+            return None
+        return metadata if isinstance(metadata, dict) else None
+
     def _json_serializer(self, obj):
         """Custom JSON serializer for complex objects."""
-        if isinstance(obj, Enum):
-            return obj.value
-        elif hasattr(obj, "model_dump"):
-            return obj.model_dump()
-        elif hasattr(obj, "__dict__"):
-            return obj.__dict__
-        elif isinstance(obj, datetime):
-            return obj.isoformat()
-        else:
-            return str(obj)
+        converter = _SERIALIZER_CACHE.get(type(obj))
+        if converter is None:
+            converter = _SERIALIZER_CACHE[type(obj)] = _resolve_serializer(obj)
+        return converter(obj)
+
+    def _convert_keys_to_strings(self, obj: Any, msgpack_keys: bool = False) -> Any:
+        """
+        Recursively convert dictionary keys to strings for JSON.
 
-    def _convert_keys_to_strings(self, obj: Any) -> Any:
-        """Recursively convert dictionary keys to strings for JSON."""
+        Keys the json module already handles are left alone and enum keys
+        use their value, matching orjson's ``OPT_NON_STR_KEYS`` output.
+        With ``msgpack_keys`` those keys are also written as the strings
+        JSON would produce, so a save loads the same in either format.
+        """
         if isinstance(obj, dict):
-            return {str(k): self._convert_keys_to_strings(v) for k, v in obj.items()}
+            convert_key = self._msgpack_key if msgpack_keys else self._json_key
+            return {
+                convert_key(k): self._convert_keys_to_strings(v, msgpack_keys)
+                for k, v in obj.items()
+            }
         if isinstance(obj, list):
-            return [self._convert_keys_to_strings(v) for v in obj]
+            return [self._convert_keys_to_strings(v, msgpack_keys) for v in obj]
         return obj
 
+    @staticmethod
+    def _json_key(key: Any) -> Any:
+        """Map a dictionary key to one the json module can encode."""
+        if isinstance(key, (str, int, float, bool)) or key is None:
+            return key
+        if isinstance(key, Enum):
+            return str(key.value)
+        return str(key)
+
+    @classmethod
+    def _msgpack_key(cls, key: Any) -> str:
+        """Map a dictionary key to the string a JSON save would store."""
+        key = cls._json_key(key)
+        return key if isinstance(key, str) else json.dumps(key)
+
     def get_save_info(self, save_identifier: str) -> Dict[str, Any]:
         """
         Get detailed information about a save.
@@ -595,27 +1294,52 @@ class SaveManager:
         Returns:
             Save information dictionary
         """
-        saves = self.list_saves()
-
-        for save_metadata in saves:
-            if (
-                save_metadata["save_name"] == save_identifier
-                or save_metadata.get("file_path") == save_identifier
-            ):
-                return save_metadata
+        cached = self._save_index is not None
+        if not cached:
+            self.list_saves()
+
+        metadata = self._find_indexed_save(save_identifier)
+        if metadata is None and cached:
+            # Another manager may have written the save since the last listing
+            self.list_saves()
+            metadata = self._find_indexed_save(save_identifier)
+        if metadata is not None:
+            return metadata
 
         raise FileNotFoundError(f"Save not found: {save_identifier}")
 
-    def _migrate_save_data(self, game_state: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply migrations to save data for backward compatibility."""
+    def _find_indexed_save(self, save_identifier: str) -> Optional[Dict[str, Any]]:
+        """Newest indexed metadata matching a save name or file path."""
+        entries = self._save_index.get(save_identifier)
+        if not entries:
+            entries = [
+                entry
+                for name_entries in self._save_index.values()
+                for entry in name_entries
+                if entry[1].get("file_path") == save_identifier
+            ]
+        if not entries:
+            return None
+        _, metadata = max(entries, key=lambda entry: entry[1].get("save_date", ""))
+        return dict(metadata)
+
+    def _migrate_save_data(
+        self, game_state: Dict[str, Any], *, copy_state: bool = True
+    ) -> Dict[str, Any]:
+        """Apply migrations to save data for backward compatibility.
+
+        ``copy_state`` may be False when ``game_state`` was freshly decoded
+        and is not shared with anything else, skipping a deep copy of the
+        entire save.
+        """
 
         if not self._looks_like_full_game_state(game_state):
             # The save system is sometimes used in tests for generic data. In those
             # cases we should avoid mutating the original payload so round-trips
             # preserve equality.
-            return copy.deepcopy(game_state)
+            return copy.deepcopy(game_state) if copy_state else game_state
 
-        migrated_state = copy.deepcopy(game_state)
+        migrated_state = copy.deepcopy(game_state) if copy_state else game_state
 
         # Check save format version
         version = migrated_state.get("save_format_version", "legacy")
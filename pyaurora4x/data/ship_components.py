@@ -5,15 +5,420 @@ Manages ship components, designs, and construction systems.
 """
 
 import json
-from typing import Dict, List, Optional
+import os
+import pickle
+import sys
+from collections import Counter
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 from pathlib import Path
 import logging
+from functools import cache, lru_cache
+
+import numpy as np
 
 from pyaurora4x.core.models import ShipComponent, ShipDesign
 from pyaurora4x.core.enums import ShipType
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+
+    # Only the C backend is fast enough to be worth streaming with
+    IJSON_AVAILABLE = ijson.backend == "yajl2_c"
+except ImportError:  # pragma: no cover - optional dependency
+    IJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Parsed components are pickled next to the JSON file and reused while the
+# JSON's mtime is unchanged. Bump the version when ShipComponent changes.
+_COMPONENT_CACHE_SUFFIX = ".pkl"
+_COMPONENT_CACHE_VERSION = 3
+
+# Ship types that are not expected to carry engines
+_UNPROPELLED_SHIP_TYPES = frozenset({ShipType.MINING_SHIP})
+
+# Component files at least this large are stream-parsed with ijson
+_STREAM_PARSE_THRESHOLD = 8 * 1024 * 1024
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as indented UTF-8 JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _write_bytes_atomic(path: Path, payload: bytes) -> None:
+    """
+    Write ``payload`` to ``path`` in one call via a temporary sibling file.
+
+    The temporary file replaces the target only once fully written, so an
+    interrupted save never leaves a truncated data file behind.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings; other values are left for validation to reject."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _build_component(component_id: str, info: Dict[str, Any]) -> ShipComponent:
+    """
+    Build a component from its catalog entry.
+
+    Pydantic's compiled validator is faster than ``model_construct`` for a
+    model this small, so entries are validated rather than trusted. The
+    component type and tech IDs repeat across the catalog and are interned
+    so every component shares one copy of each.
+    """
+    return ShipComponent(
+        id=component_id,
+        name=info.get("name", component_id.replace("_", " ").title()),
+        component_type=_intern(info.get("type", "misc")),
+        mass=info.get("mass", 1.0),
+        cost=info.get("cost", 10),
+        power_requirement=info.get("power_requirement", 0.0),
+        crew_requirement=info.get("crew_requirement", 0),
+        tech_requirements=[_intern(tech) for tech in info.get("tech_requirements", [])],
+        attributes=info.get("attributes", {}),
+    )
+
+
+# Built-in components used when no component file can be loaded
+_DEFAULT_COMPONENT_SPECS = (
+    # Engines
+    {
+        "id": "chemical_engine",
+        "name": "Chemical Engine",
+        "type": "engine",
+        "mass": 50.0,
+        "cost": 100,
+        "power_requirement": 0.0,
+        "crew_requirement": 2,
+        "tech_requirements": ["basic_propulsion"],
+        "attributes": {
+            "thrust": 1000.0,
+            "fuel_efficiency": 0.8,
+            "max_burn_time": 3600
+        }
+    },
+    {
+        "id": "ion_engine",
+        "name": "Ion Engine",
+        "type": "engine",
+        "mass": 30.0,
+        "cost": 200,
+        "power_requirement": 100.0,
+        "crew_requirement": 1,
+        "tech_requirements": ["advanced_propulsion"],
+        "attributes": {
+            "thrust": 100.0,
+            "fuel_efficiency": 5.0,
+            "max_burn_time": 36000
+        }
+    },
+
+    # Power Plants
+    {
+        "id": "solar_panels",
+        "name": "Solar Panels",
+        "type": "power_plant",
+        "mass": 20.0,
+        "cost": 50,
+        "power_requirement": 0.0,
+        "crew_requirement": 0,
+        "tech_requirements": ["basic_energy"],
+        "attributes": {
+            "power_output": 50.0,
+            "efficiency": 0.15,
+            "degradation_rate": 0.01
+        }
+    },
+    {
+        "id": "nuclear_reactor",
+        "name": "Nuclear Reactor",
+        "type": "power_plant",
+        "mass": 100.0,
+        "cost": 500,
+        "power_requirement": 0.0,
+        "crew_requirement": 5,
+        "tech_requirements": ["nuclear_power"],
+        "attributes": {
+            "power_output": 1000.0,
+            "fuel_consumption": 1.0,
+            "heat_generation": 500.0
+        }
+    },
+
+    # Fuel Tanks
+    {
+        "id": "basic_fuel_tank",
+        "name": "Basic Fuel Tank",
+        "type": "fuel_tank",
+        "mass": 10.0,
+        "cost": 20,
+        "power_requirement": 0.0,
+        "crew_requirement": 0,
+        "tech_requirements": [],
+        "attributes": {
+            "fuel_capacity": 1000.0,
+            "fuel_type": "chemical"
+        }
+    },
+    {
+        "id": "advanced_fuel_tank",
+        "name": "Advanced Fuel Tank",
+        "type": "fuel_tank",
+        "mass": 15.0,
+        "cost": 40,
+        "power_requirement": 0.0,
+        "crew_requirement": 0,
+        "tech_requirements": ["fuel_efficiency"],
+        "attributes": {
+            "fuel_capacity": 2000.0,
+            "fuel_type": "any",
+            "self_sealing": True
+        }
+    },
+
+    # Crew Quarters
+    {
+        "id": "basic_crew_quarters",
+        "name": "Basic Crew Quarters",
+        "type": "crew_quarters",
+        "mass": 40.0,
+        "cost": 80,
+        "power_requirement": 10.0,
+        "crew_requirement": 0,
+        "tech_requirements": [],
+        "attributes": {
+            "crew_capacity": 10,
+            "comfort_level": 1.0
+        }
+    },
+    {
+        "id": "luxury_crew_quarters",
+        "name": "Luxury Crew Quarters",
+        "type": "crew_quarters",
+        "mass": 60.0,
+        "cost": 200,
+        "power_requirement": 20.0,
+        "crew_requirement": 0,
+        "tech_requirements": ["advanced_life_support"],
+        "attributes": {
+            "crew_capacity": 10,
+            "comfort_level": 2.0,
+            "morale_bonus": 0.2
+        }
+    },
+
+    # Sensors
+    {
+        "id": "basic_sensors",
+        "name": "Basic Sensor Array",
+        "type": "sensor",
+        "mass": 25.0,
+        "cost": 150,
+        "power_requirement": 50.0,
+        "crew_requirement": 1,
+        "tech_requirements": ["basic_sensors"],
+        "attributes": {
+            "detection_range": 1000000.0,
+            "resolution": 1.0,
+            "scan_time": 60.0
+        }
+    },
+    {
+        "id": "advanced_sensors",
+        "name": "Advanced Sensor Array",
+        "type": "sensor",
+        "mass": 35.0,
+        "cost": 400,
+        "power_requirement": 120.0,
+        "crew_requirement": 2,
+        "tech_requirements": ["advanced_sensors"],
+        "attributes": {
+            "detection_range": 5000000.0,
+            "resolution": 0.1,
+            "scan_time": 30.0,
+            "stealth_detection": True
+        }
+    },
+
+    # Weapons
+    {
+        "id": "laser_cannon",
+        "name": "Laser Cannon",
+        "type": "weapon",
+        "mass": 45.0,
+        "cost": 300,
+        "power_requirement": 200.0,
+        "crew_requirement": 2,
+        "tech_requirements": ["basic_weapons"],
+        "attributes": {
+            "damage": 100.0,
+            "range": 500000.0,
+            "firing_rate": 2.0,
+            "accuracy": 0.8
+        }
+    },
+    {
+        "id": "missile_launcher",
+        "name": "Missile Launcher",
+        "type": "weapon",
+        "mass": 80.0,
+        "cost": 250,
+        "power_requirement": 50.0,
+        "crew_requirement": 3,
+        "tech_requirements": ["missile_systems"],
+        "attributes": {
+            "damage": 300.0,
+            "range": 2000000.0,
+            "firing_rate": 0.5,
+            "accuracy": 0.9,
+            "ammunition_capacity": 20
+        }
+    },
+
+    # Shields
+    {
+        "id": "basic_shields",
+        "name": "Basic Shield Generator",
+        "type": "shield",
+        "mass": 70.0,
+        "cost": 400,
+        "power_requirement": 300.0,
+        "crew_requirement": 2,
+        "tech_requirements": ["basic_shields"],
+        "attributes": {
+            "shield_strength": 500.0,
+            "recharge_rate": 10.0,
+            "power_efficiency": 0.6
+        }
+    },
+
+    # Armor
+    {
+        "id": "titanium_armor",
+        "name": "Titanium Armor Plating",
+        "type": "armor",
+        "mass": 30.0,
+        "cost": 100,
+        "power_requirement": 0.0,
+        "crew_requirement": 0,
+        "tech_requirements": ["advanced_materials"],
+        "attributes": {
+            "armor_value": 200.0,
+            "damage_reduction": 0.3
+        }
+    },
+
+    # Bridge
+    {
+        "id": "standard_bridge",
+        "name": "Standard Bridge",
+        "type": "bridge",
+        "mass": 80.0,
+        "cost": 300,
+        "power_requirement": 100.0,
+        "crew_requirement": 5,
+        "tech_requirements": ["basic_computing"],
+        "attributes": {
+            "command_efficiency": 1.0,
+            "sensor_bonus": 0.1
+        }
+    },
+
+    # Cargo Bay
+    {
+        "id": "cargo_bay",
+        "name": "Cargo Bay",
+        "type": "cargo_bay",
+        "mass": 5.0,
+        "cost": 50,
+        "power_requirement": 5.0,
+        "crew_requirement": 0,
+        "tech_requirements": [],
+        "attributes": {
+            "cargo_capacity": 500.0
+        }
+    },
+)
+
+
+class _ComponentCatalog(dict):
+    """Component dict that counts writes so derived indexes can tell it changed."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: str, value: ShipComponent) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other: Any) -> "_ComponentCatalog":
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def pop(self, *args: Any) -> Any:
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self) -> Tuple[str, ShipComponent]:
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self.version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+
+@cache
+def _build_default_components() -> Dict[str, ShipComponent]:
+    """Build the default catalog once; components are immutable and shared."""
+    return {
+        spec["id"]: _build_component(spec["id"], spec)
+        for spec in _DEFAULT_COMPONENT_SPECS
+    }
+
 
 class ShipComponentManager:
     """
@@ -31,13 +436,60 @@ class ShipComponentManager:
             data_directory: Directory containing component data files
         """
         self.data_directory = Path(data_directory)
-        self.components: Dict[str, ShipComponent] = {}
-        self.designs: Dict[str, ShipDesign] = {}
-        self.components_loaded = False
-        
-        # Try to load component and design data
-        self.load_components()
-        self.load_designs()
+
+        # Component and design data are loaded on first access
+        self._components: Optional[_ComponentCatalog] = None
+        self._designs: Optional[Dict[str, ShipDesign]] = None
+        self._components_loaded = False
+
+        # Bit position per tech ID and the requirement bitmask per component,
+        # rebuilt by _index_components whenever the catalog changes
+        self._indexed_version = -1
+        self._tech_bits: Dict[str, int] = {}
+        self._component_req_masks: Dict[str, int] = {}
+        self._components_by_type: Dict[str, List[ShipComponent]] = {}
+
+        # Requirement masks split into 64-bit words, one row per component,
+        # built on the first batched availability query
+        self._req_mask_words: Optional[np.ndarray] = None
+        self._indexed_components: Optional[np.ndarray] = None
+
+        # Mass, cost and crew per component as columns of one array, with
+        # each component's row, for vectorized design totals
+        self._component_rows: Dict[str, int] = {}
+        self._component_stats = np.zeros((0, 3))
+
+        # Totals and validation per (sorted component IDs, ship type);
+        # cleared whenever the component catalog changes
+        self._design_totals = lru_cache(maxsize=512)(self._compute_design_totals)
+
+        # Designs grouped by ship type, kept in step with self.designs
+        self._designs_by_type: Dict[ShipType, Dict[str, ShipDesign]] = {}
+
+    @property
+    def components(self) -> Dict[str, ShipComponent]:
+        """
+        Component catalog by ID, loaded from disk on first access.
+
+        Components may be added, replaced or removed in place; lookups
+        re-index on their next call.
+        """
+        if self._components is None:
+            self.load_components()
+        return self._components
+
+    @property
+    def designs(self) -> Dict[str, ShipDesign]:
+        """Ship designs by ID, loaded from disk on first access."""
+        if self._designs is None:
+            self.load_designs()
+        return self._designs
+
+    @property
+    def components_loaded(self) -> bool:
+        """Whether the catalog came from the components file."""
+        self.components
+        return self._components_loaded
     
     def load_components(self) -> bool:
         """
@@ -47,19 +499,37 @@ class ShipComponentManager:
             True if loading was successful
         """
         components_file = self.data_directory / "ship_components.json"
+        if self._components is None:
+            self._components = _ComponentCatalog()
         
-        if not components_file.exists():
+        try:
+            source_stat = components_file.stat()
+        except FileNotFoundError:
             logger.warning(f"Components file not found: {components_file}")
             self._create_default_components()
             return False
-        
+
         try:
-            with open(components_file, 'r') as f:
-                component_data = json.load(f)
-            
-            self._load_components_from_data(component_data)
+            source_mtime_ns = source_stat.st_mtime_ns
+            cache_file = components_file.with_name(
+                components_file.name + _COMPONENT_CACHE_SUFFIX
+            )
+            cached = self._read_component_cache(cache_file, source_mtime_ns)
+            if cached is not None:
+                self._components = _ComponentCatalog(cached)
+                self._index_components()
+                self._components_loaded = True
+                logger.info(f"Loaded {len(self.components)} ship components from cache")
+                return True
+
+            if IJSON_AVAILABLE and source_stat.st_size >= _STREAM_PARSE_THRESHOLD:
+                self._load_components_stream(components_file)
+            else:
+                component_data = _json_loads(components_file.read_bytes())
+                self._load_components_from_data(component_data)
+            self._write_component_cache(cache_file, source_mtime_ns)
             
-            self.components_loaded = True
+            self._components_loaded = True
             logger.info(f"Loaded {len(self.components)} ship components")
             return True
             
@@ -68,320 +538,119 @@ class ShipComponentManager:
             self._create_default_components()
             return False
     
+    def _read_component_cache(
+        self, cache_file: Path, source_mtime_ns: int
+    ) -> Optional[Dict[str, ShipComponent]]:
+        """Return cached components if the sidecar matches the JSON's mtime."""
+        try:
+            with open(cache_file, 'rb') as f:
+                version, cached_mtime_ns, components = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable component cache {cache_file}: {e}")
+            return None
+
+        if version != _COMPONENT_CACHE_VERSION or cached_mtime_ns != source_mtime_ns:
+            return None
+        return components
+
+    def _write_component_cache(self, cache_file: Path, source_mtime_ns: int) -> None:
+        """Pickle the loaded components next to their JSON source."""
+        payload = pickle.dumps(
+            (_COMPONENT_CACHE_VERSION, source_mtime_ns, dict(self.components)),
+            protocol=5,
+        )
+        try:
+            _write_bytes_atomic(cache_file, payload)
+        except OSError as e:
+            # A read-only data directory just means no warm-start cache
+            logger.debug(f"Could not write component cache {cache_file}: {e}")
+
     def _load_components_from_data(self, component_data: Dict) -> None:
         """Load components from parsed JSON data."""
+        self._load_component_entries(component_data.get("components", {}).items())
+
+    def _load_components_stream(self, components_file: Path) -> None:
+        """
+        Load components while stream-parsing the file with ijson.
+
+        Entries are built one at a time, so the decoded file is never held
+        in memory alongside the components.
+        """
+        with open(components_file, 'rb') as f:
+            self._load_component_entries(
+                ijson.kvitems(f, "components", use_float=True)
+            )
+
+    def _load_component_entries(
+        self, entries: Iterable[Tuple[str, Dict[str, Any]]]
+    ) -> None:
+        """Replace the catalog with components built from ``(id, info)`` pairs."""
         self.components.clear()
         
-        for component_id, component_info in component_data.get("components", {}).items():
+        for component_id, component_info in entries:
             try:
-                # Create component object
-                component = ShipComponent(
-                    id=component_id,
-                    name=component_info.get("name", component_id.replace("_", " ").title()),
-                    component_type=component_info.get("type", "misc"),
-                    mass=component_info.get("mass", 1.0),
-                    cost=component_info.get("cost", 10),
-                    power_requirement=component_info.get("power_requirement", 0.0),
-                    crew_requirement=component_info.get("crew_requirement", 0),
-                    tech_requirements=component_info.get("tech_requirements", []),
-                    attributes=component_info.get("attributes", {})
+                self.components[component_id] = _build_component(
+                    component_id, component_info
                 )
                 
-                self.components[component_id] = component
-                
             except Exception as e:
                 logger.error(f"Error loading component {component_id}: {e}")
+
+        self._index_components()
     
     def _create_default_components(self) -> None:
         """Create default ship components."""
         logger.info("Creating default ship components")
-        
-        default_components = [
-            # Engines
-            {
-                "id": "chemical_engine",
-                "name": "Chemical Engine",
-                "type": "engine",
-                "mass": 50.0,
-                "cost": 100,
-                "power_requirement": 0.0,
-                "crew_requirement": 2,
-                "tech_requirements": ["basic_propulsion"],
-                "attributes": {
-                    "thrust": 1000.0,
-                    "fuel_efficiency": 0.8,
-                    "max_burn_time": 3600
-                }
-            },
-            {
-                "id": "ion_engine",
-                "name": "Ion Engine",
-                "type": "engine",
-                "mass": 30.0,
-                "cost": 200,
-                "power_requirement": 100.0,
-                "crew_requirement": 1,
-                "tech_requirements": ["advanced_propulsion"],
-                "attributes": {
-                    "thrust": 100.0,
-                    "fuel_efficiency": 5.0,
-                    "max_burn_time": 36000
-                }
-            },
-            
-            # Power Plants
-            {
-                "id": "solar_panels",
-                "name": "Solar Panels",
-                "type": "power_plant",
-                "mass": 20.0,
-                "cost": 50,
-                "power_requirement": 0.0,
-                "crew_requirement": 0,
-                "tech_requirements": ["basic_energy"],
-                "attributes": {
-                    "power_output": 50.0,
-                    "efficiency": 0.15,
-                    "degradation_rate": 0.01
-                }
-            },
-            {
-                "id": "nuclear_reactor",
-                "name": "Nuclear Reactor",
-                "type": "power_plant",
-                "mass": 100.0,
-                "cost": 500,
-                "power_requirement": 0.0,
-                "crew_requirement": 5,
-                "tech_requirements": ["nuclear_power"],
-                "attributes": {
-                    "power_output": 1000.0,
-                    "fuel_consumption": 1.0,
-                    "heat_generation": 500.0
-                }
-            },
-            
-            # Fuel Tanks
-            {
-                "id": "basic_fuel_tank",
-                "name": "Basic Fuel Tank",
-                "type": "fuel_tank",
-                "mass": 10.0,
-                "cost": 20,
-                "power_requirement": 0.0,
-                "crew_requirement": 0,
-                "tech_requirements": [],
-                "attributes": {
-                    "fuel_capacity": 1000.0,
-                    "fuel_type": "chemical"
-                }
-            },
-            {
-                "id": "advanced_fuel_tank",
-                "name": "Advanced Fuel Tank",
-                "type": "fuel_tank",
-                "mass": 15.0,
-                "cost": 40,
-                "power_requirement": 0.0,
-                "crew_requirement": 0,
-                "tech_requirements": ["fuel_efficiency"],
-                "attributes": {
-                    "fuel_capacity": 2000.0,
-                    "fuel_type": "any",
-                    "self_sealing": True
-                }
-            },
-            
-            # Crew Quarters
-            {
-                "id": "basic_crew_quarters",
-                "name": "Basic Crew Quarters",
-                "type": "crew_quarters",
-                "mass": 40.0,
-                "cost": 80,
-                "power_requirement": 10.0,
-                "crew_requirement": 0,
-                "tech_requirements": [],
-                "attributes": {
-                    "crew_capacity": 10,
-                    "comfort_level": 1.0
-                }
-            },
-            {
-                "id": "luxury_crew_quarters",
-                "name": "Luxury Crew Quarters",
-                "type": "crew_quarters",
-                "mass": 60.0,
-                "cost": 200,
-                "power_requirement": 20.0,
-                "crew_requirement": 0,
-                "tech_requirements": ["advanced_life_support"],
-                "attributes": {
-                    "crew_capacity": 10,
-                    "comfort_level": 2.0,
-                    "morale_bonus": 0.2
-                }
-            },
-            
-            # Sensors
-            {
-                "id": "basic_sensors",
-                "name": "Basic Sensor Array",
-                "type": "sensor",
-                "mass": 25.0,
-                "cost": 150,
-                "power_requirement": 50.0,
-                "crew_requirement": 1,
-                "tech_requirements": ["basic_sensors"],
-                "attributes": {
-                    "detection_range": 1000000.0,
-                    "resolution": 1.0,
-                    "scan_time": 60.0
-                }
-            },
-            {
-                "id": "advanced_sensors",
-                "name": "Advanced Sensor Array",
-                "type": "sensor",
-                "mass": 35.0,
-                "cost": 400,
-                "power_requirement": 120.0,
-                "crew_requirement": 2,
-                "tech_requirements": ["advanced_sensors"],
-                "attributes": {
-                    "detection_range": 5000000.0,
-                    "resolution": 0.1,
-                    "scan_time": 30.0,
-                    "stealth_detection": True
-                }
-            },
-            
-            # Weapons
-            {
-                "id": "laser_cannon",
-                "name": "Laser Cannon",
-                "type": "weapon",
-                "mass": 45.0,
-                "cost": 300,
-                "power_requirement": 200.0,
-                "crew_requirement": 2,
-                "tech_requirements": ["basic_weapons"],
-                "attributes": {
-                    "damage": 100.0,
-                    "range": 500000.0,
-                    "firing_rate": 2.0,
-                    "accuracy": 0.8
-                }
-            },
-            {
-                "id": "missile_launcher",
-                "name": "Missile Launcher",
-                "type": "weapon",
-                "mass": 80.0,
-                "cost": 250,
-                "power_requirement": 50.0,
-                "crew_requirement": 3,
-                "tech_requirements": ["missile_systems"],
-                "attributes": {
-                    "damage": 300.0,
-                    "range": 2000000.0,
-                    "firing_rate": 0.5,
-                    "accuracy": 0.9,
-                    "ammunition_capacity": 20
-                }
-            },
-            
-            # Shields
-            {
-                "id": "basic_shields",
-                "name": "Basic Shield Generator",
-                "type": "shield",
-                "mass": 70.0,
-                "cost": 400,
-                "power_requirement": 300.0,
-                "crew_requirement": 2,
-                "tech_requirements": ["basic_shields"],
-                "attributes": {
-                    "shield_strength": 500.0,
-                    "recharge_rate": 10.0,
-                    "power_efficiency": 0.6
-                }
-            },
-            
-            # Armor
-            {
-                "id": "titanium_armor",
-                "name": "Titanium Armor Plating",
-                "type": "armor",
-                "mass": 30.0,
-                "cost": 100,
-                "power_requirement": 0.0,
-                "crew_requirement": 0,
-                "tech_requirements": ["advanced_materials"],
-                "attributes": {
-                    "armor_value": 200.0,
-                    "damage_reduction": 0.3
-                }
-            },
-            
-            # Bridge
-            {
-                "id": "standard_bridge",
-                "name": "Standard Bridge",
-                "type": "bridge",
-                "mass": 80.0,
-                "cost": 300,
-                "power_requirement": 100.0,
-                "crew_requirement": 5,
-                "tech_requirements": ["basic_computing"],
-                "attributes": {
-                    "command_efficiency": 1.0,
-                    "sensor_bonus": 0.1
-                }
-            },
-            
-            # Cargo Bay
-            {
-                "id": "cargo_bay",
-                "name": "Cargo Bay",
-                "type": "cargo_bay",
-                "mass": 5.0,
-                "cost": 50,
-                "power_requirement": 5.0,
-                "crew_requirement": 0,
-                "tech_requirements": [],
-                "attributes": {
-                    "cargo_capacity": 500.0
-                }
-            }
-        ]
-        
-        # Convert to ShipComponent objects
-        for comp_data in default_components:
-            component = ShipComponent(
-                id=comp_data["id"],
-                name=comp_data["name"],
-                component_type=comp_data["type"],
-                mass=comp_data["mass"],
-                cost=comp_data["cost"],
-                power_requirement=comp_data["power_requirement"],
-                crew_requirement=comp_data["crew_requirement"],
-                tech_requirements=comp_data["tech_requirements"],
-                attributes=comp_data["attributes"]
+        self.components.update(_build_default_components())
+        self._index_components()
+
+    def _index_components(self) -> None:
+        """Rebuild the lookup structures derived from ``self.components``."""
+        self._indexed_version = self.components.version
+        self._tech_bits = {}
+        self._component_req_masks = {}
+        self._components_by_type = {}
+        self._req_mask_words = None
+        self._design_totals.cache_clear()
+        self._component_rows = {
+            component_id: row for row, component_id in enumerate(self.components)
+        }
+        self._component_stats = np.array(
+            [
+                (component.mass, component.cost, component.crew_requirement)
+                for component in self.components.values()
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        for component_id, component in self.components.items():
+            self._components_by_type.setdefault(component.component_type, []).append(
+                component
             )
-            self.components[comp_data["id"]] = component
+            mask = 0
+            for tech in component.tech_requirements:
+                bit = self._tech_bits.setdefault(tech, len(self._tech_bits))
+                mask |= 1 << bit
+            self._component_req_masks[component_id] = mask
     
+    def _ensure_indexed(self) -> None:
+        """Re-index if the component dict was changed directly."""
+        if self.components.version != self._indexed_version:
+            self._index_components()
+
     def get_component(self, component_id: str) -> Optional[ShipComponent]:
         """Get a component by ID."""
         return self.components.get(component_id)
     
-    def get_all_components(self) -> Dict[str, ShipComponent]:
-        """Get all components."""
-        return self.components.copy()
+    def get_all_components(self) -> Mapping[str, ShipComponent]:
+        """Get a read-only view of all components."""
+        return MappingProxyType(self.components)
     
     def get_components_by_type(self, component_type: str) -> List[ShipComponent]:
         """Get all components of a specific type."""
-        return [comp for comp in self.components.values() if comp.component_type == component_type]
+        self._ensure_indexed()
+        return list(self._components_by_type.get(component_type, ()))
     
     def get_available_components(self, researched_techs: List[str]) -> List[ShipComponent]:
         """
@@ -393,15 +662,73 @@ class ShipComponentManager:
         Returns:
             List of available components
         """
-        available = []
-        researched_set = set(researched_techs)
-        
-        for component in self.components.values():
-            # Check if all tech requirements are met
-            if all(tech in researched_set for tech in component.tech_requirements):
-                available.append(component)
-        
-        return available
+        self._ensure_indexed()
+
+        # A component is available when none of its requirement bits are missing
+        missing = ~self._tech_mask(researched_techs)
+        req_masks = self._component_req_masks
+        return [
+            component
+            for component_id, component in self.components.items()
+            if not req_masks[component_id] & missing
+        ]
+
+    def get_available_components_batch(
+        self, researched_tech_lists: Sequence[Iterable[str]]
+    ) -> List[List[ShipComponent]]:
+        """
+        Get available components for many tech states at once.
+
+        Equivalent to calling :meth:`get_available_components` for each
+        entry, but the requirement checks for all states run as a single
+        NumPy operation. Intended for AI planning over many empires.
+
+        Args:
+            researched_tech_lists: One collection of researched tech IDs per
+                query
+
+        Returns:
+            Available components for each query, in catalog order
+        """
+        self._ensure_indexed()
+        if self._req_mask_words is None:
+            self._indexed_components = np.empty(len(self.components), dtype=object)
+            self._indexed_components[:] = list(self.components.values())
+            self._req_mask_words = self._mask_words(
+                self._component_req_masks.values()
+            )
+
+        researched = self._mask_words(
+            self._tech_mask(techs) for techs in researched_tech_lists
+        )
+        # (queries, components, words): any requirement bit not researched
+        missing = self._req_mask_words[None, :, :] & ~researched[:, None, :]
+        available = ~missing.any(axis=2)
+
+        components = self._indexed_components
+        return [components[row].tolist() for row in available]
+
+    def _tech_mask(self, researched_techs: Iterable[str]) -> int:
+        """Bitmask of the researched techs that some component requires."""
+        # Techs no component requires have no bit and cannot matter
+        mask = 0
+        tech_bits = self._tech_bits
+        for tech in researched_techs:
+            bit = tech_bits.get(tech)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def _mask_words(self, masks: Iterable[int]) -> np.ndarray:
+        """Split int bitmasks into rows of uint64 words covering every tech bit."""
+        word_count = max(1, -(-len(self._tech_bits) // 64))
+        if word_count == 1:
+            return np.fromiter(masks, dtype=np.uint64).reshape(-1, 1)
+        word = (1 << 64) - 1
+        return np.array(
+            [[(mask >> (64 * w)) & word for w in range(word_count)] for mask in masks],
+            dtype=np.uint64,
+        ).reshape(-1, word_count)
     
     def create_ship_design(
         self, 
@@ -422,22 +749,22 @@ class ShipComponentManager:
         Returns:
             Created ship design or None if invalid
         """
-        # Validate components exist
-        components = []
+        self._ensure_indexed()
+
+        # Validate components exist; this also keeps IDs that cannot be
+        # sorted (None, mixed types) out of the cache key below
+        components = self.components
         for comp_id in component_ids:
-            component = self.get_component(comp_id)
-            if not component:
+            if comp_id not in components:
                 logger.error(f"Unknown component: {comp_id}")
                 return None
-            components.append(component)
-        
-        # Calculate totals
-        total_mass = sum(comp.mass for comp in components)
-        total_cost = sum(comp.cost for comp in components)
-        total_crew = sum(comp.crew_requirement for comp in components)
+
+        # Totals and validation ignore component order, so any arrangement
+        # of a previously seen component list reuses the earlier result
+        total_mass, total_cost, total_crew, validation_result = (
+            self._design_totals(tuple(sorted(component_ids)), ship_type)
+        )
         
-        # Validate design
-        validation_result = self._validate_ship_design(components, ship_type)
         if not validation_result["valid"]:
             logger.error(f"Invalid ship design: {validation_result['errors']}")
             return None
@@ -454,56 +781,92 @@ class ShipComponentManager:
             is_obsolete=False
         )
         
-        self.designs[design_id] = design
+        self._add_design(design)
         logger.info(f"Created ship design: {name}")
         return design
     
-    def _validate_ship_design(self, components: List[ShipComponent], ship_type: ShipType) -> Dict:
-        """Validate a ship design for completeness and consistency."""
+    def _compute_design_totals(
+        self, component_ids: Tuple[str, ...], ship_type: ShipType
+    ) -> Tuple[float, int, int, Dict]:
+        """
+        Total mass, cost and crew plus validation for a component list.
+
+        Raises:
+            KeyError: If a component ID is unknown
+        """
+        # Designs repeat components heavily (armor, cargo bays), so work
+        # once per distinct component and scale by its count
+        counts = Counter(component_ids)
+        rows = [self._component_rows[comp_id] for comp_id in counts]
+        multiplicities = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        total_mass, total_cost, total_crew = multiplicities @ self._component_stats[rows]
+
+        components = [self.components[comp_id] for comp_id in counts]
+        validation = self._validate_ship_design(
+            components, ship_type, list(counts.values())
+        )
+        return float(total_mass), int(total_cost), int(total_crew), validation
+
+    def _validate_ship_design(
+        self,
+        components: List[ShipComponent],
+        ship_type: ShipType,
+        multiplicities: Optional[Sequence[int]] = None,
+    ) -> Dict:
+        """
+        Validate a ship design for completeness and consistency.
+
+        Args:
+            components: Components in the design
+            ship_type: Type of ship being designed
+            multiplicities: Optional count for each entry in components;
+                each component is counted once when omitted
+
+        Returns:
+            Dictionary with "valid", "errors" and "warnings"
+        """
         errors = []
         warnings = []
-        
-        # Check for required components
-        component_types = [comp.component_type for comp in components]
+        if multiplicities is None:
+            multiplicities = [1] * len(components)
+
+        # Gather every total and flag in a single pass over the components
+        component_types = set()
+        total_crew = 0
+        crew_capacity = 0
+        power_generation = 0
+        power_consumption = 0
+        has_fuel_consuming_engine = False
+        for comp, count in zip(components, multiplicities):
+            comp_type = comp.component_type
+            component_types.add(comp_type)
+            total_crew += comp.crew_requirement * count
+            power_consumption += comp.power_requirement * count
+            if comp_type == "crew_quarters":
+                crew_capacity += comp.crew_capacity * count
+            elif comp_type == "power_plant":
+                power_generation += comp.power_output * count
+            elif comp_type == "engine" and comp.fuel_consumption > 0:
+                has_fuel_consuming_engine = True
         
         # Every ship needs power
         if "power_plant" not in component_types:
             errors.append("Ship must have at least one power plant")
         
         # Most ships need propulsion
-        if ship_type not in [ShipType.MINING_SHIP] and "engine" not in component_types:
+        if ship_type not in _UNPROPELLED_SHIP_TYPES and "engine" not in component_types:
             warnings.append("Ship has no propulsion system")
         
         # Ships with crew need life support
-        total_crew = sum(comp.crew_requirement for comp in components)
-        crew_capacity = sum(
-            comp.attributes.get("crew_capacity", 0) 
-            for comp in components 
-            if comp.component_type == "crew_quarters"
-        )
-        
         if total_crew > 0 and crew_capacity < total_crew:
             errors.append(f"Insufficient crew quarters: need {total_crew}, have {crew_capacity}")
         
         # Check power balance
-        power_generation = sum(
-            comp.attributes.get("power_output", 0) 
-            for comp in components 
-            if comp.component_type == "power_plant"
-        )
-        power_consumption = sum(comp.power_requirement for comp in components)
-        
         if power_consumption > power_generation:
             errors.append(f"Power deficit: need {power_consumption}, generate {power_generation}")
         
         # Check fuel requirements
-        has_fuel_consuming_engine = any(
-            comp.component_type == "engine" and comp.attributes.get("fuel_consumption", 0) > 0
-            for comp in components
-        )
-        has_fuel_tank = any(comp.component_type == "fuel_tank" for comp in components)
-        
-        if has_fuel_consuming_engine and not has_fuel_tank:
+        if has_fuel_consuming_engine and "fuel_tank" not in component_types:
             warnings.append("Ship has fuel-consuming engines but no fuel tanks")
         
         return {
@@ -512,17 +875,40 @@ class ShipComponentManager:
             "warnings": warnings
         }
     
+    def _add_design(self, design: ShipDesign) -> None:
+        """Store a design, replacing any existing design with the same ID."""
+        self.delete_design(design.id)
+        self.designs[design.id] = design
+        self._designs_by_type.setdefault(design.ship_type, {})[design.id] = design
+
+    def delete_design(self, design_id: str) -> bool:
+        """
+        Remove a ship design.
+
+        Args:
+            design_id: ID of the design to remove
+
+        Returns:
+            True if a design was removed
+        """
+        design = self.designs.pop(design_id, None)
+        if design is None:
+            return False
+        self._designs_by_type.get(design.ship_type, {}).pop(design_id, None)
+        return True
+
     def get_ship_design(self, design_id: str) -> Optional[ShipDesign]:
         """Get a ship design by ID."""
         return self.designs.get(design_id)
     
-    def get_all_designs(self) -> Dict[str, ShipDesign]:
-        """Get all ship designs."""
-        return self.designs.copy()
+    def get_all_designs(self) -> Mapping[str, ShipDesign]:
+        """Get a read-only view of all ship designs."""
+        return MappingProxyType(self.designs)
     
     def get_designs_by_type(self, ship_type: ShipType) -> List[ShipDesign]:
         """Get all designs of a specific ship type."""
-        return [design for design in self.designs.values() if design.ship_type == ship_type]
+        self.designs  # load designs (and the type index) on first use
+        return list(self._designs_by_type.get(ship_type, {}).values())
     
     def calculate_construction_time(self, design: ShipDesign, construction_rate: float = 1.0) -> float:
         """
@@ -578,8 +964,7 @@ class ShipComponentManager:
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Save file
-        with open(file_path, 'w') as f:
-            json.dump(component_data, f, indent=2)
+        _write_bytes_atomic(file_path, _json_dumps(component_data))
         
         logger.info(f"Ship components saved to: {file_path}")
         return str(file_path)
@@ -598,19 +983,19 @@ class ShipComponentManager:
             file_path = self.data_directory / "ship_designs.json"
         else:
             file_path = Path(file_path)
-        
-        if not file_path.exists():
-            logger.info(f"No designs file found: {file_path}")
-            return True  # Not an error - just no designs to load
+        if self._designs is None:
+            self._designs = {}
         
         try:
-            with open(file_path, 'r') as f:
-                design_data = json.load(f)
+            design_data = _json_loads(file_path.read_bytes())
             
             self._load_designs_from_data(design_data)
             logger.info(f"Loaded {len(self.designs)} ship designs")
             return True
             
+        except FileNotFoundError:
+            logger.info(f"No designs file found: {file_path}")
+            return True  # Not an error - just no designs to load
         except Exception as e:
             logger.error(f"Error loading designs: {e}")
             return False
@@ -618,6 +1003,7 @@ class ShipComponentManager:
     def _load_designs_from_data(self, design_data: Dict) -> None:
         """Load designs from parsed JSON data."""
         self.designs.clear()
+        self._designs_by_type.clear()
         
         for design_id, design_info in design_data.get("designs", {}).items():
             try:
@@ -637,7 +1023,7 @@ class ShipComponentManager:
                     is_obsolete=design_info.get("is_obsolete", False)
                 )
                 
-                self.designs[design_id] = design
+                self._add_design(design)
                 
             except Exception as e:
                 logger.error(f"Error loading design {design_id}: {e}")
@@ -704,8 +1090,7 @@ class ShipComponentManager:
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Save file
-        with open(file_path, 'w') as f:
-            json.dump(design_data, f, indent=2)
+        _write_bytes_atomic(file_path, _json_dumps(design_data))
         
         logger.info(f"Ship designs saved to: {file_path}")
         return str(file_path)
@@ -725,8 +1110,7 @@ class ShipComponentManager:
         if not import_file.exists():
             raise FileNotFoundError(f"Import file not found: {import_path}")
         
-        with open(import_file, 'r') as f:
-            import_data = json.load(f)
+        import_data = _json_loads(import_file.read_bytes())
         
         initial_count = len(self.designs)
         self._load_designs_from_data(import_data)
@@ -773,8 +1157,7 @@ class ShipComponentManager:
         export_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Save file
-        with open(export_file, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        _write_bytes_atomic(export_file, _json_dumps(export_data))
         
         logger.info(f"Design '{design.name}' exported to: {export_file}")
         return str(export_file)
@@ -5,15 +5,283 @@ Manages the technology system, prerequisites, and research progression.
 """
 
 import json
-from typing import Dict, List, Optional, Set
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import AbstractSet, Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
 from pathlib import Path
 import logging
 
+from pydantic import TypeAdapter, ValidationError
+
 from pyaurora4x.core.models import Technology
 from pyaurora4x.core.enums import TechnologyType
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+
+    # Only the C backend is fast enough to be worth streaming with
+    IJSON_AVAILABLE = ijson.backend == "yajl2_c"
+except ImportError:  # pragma: no cover - optional dependency
+    IJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Tech files at least this large are stream-parsed with ijson
+_STREAM_PARSE_THRESHOLD = 8 * 1024 * 1024
+
+# Loaded entries are validated this many at a time in one pydantic call
+_VALIDATION_BATCH_SIZE = 512
+_TECHNOLOGY_LIST = TypeAdapter(List[Technology])
+
+# Lower-case type names used in tech files
+_TYPE_MAPPING: Mapping[str, TechnologyType] = MappingProxyType({
+    "propulsion": TechnologyType.PROPULSION,
+    "energy": TechnologyType.ENERGY,
+    "weapons": TechnologyType.WEAPONS,
+    "shields": TechnologyType.SHIELDS,
+    "sensors": TechnologyType.SENSORS,
+    "construction": TechnologyType.CONSTRUCTION,
+    "biology": TechnologyType.BIOLOGY,
+    "physics": TechnologyType.PHYSICS,
+    "engineering": TechnologyType.ENGINEERING,
+    "logistics": TechnologyType.LOGISTICS,
+    "computing": TechnologyType.COMPUTING,
+    "materials": TechnologyType.MATERIALS,
+})
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Encode ``obj`` as UTF-8 JSON, using orjson when it is installed.
+
+    Output is compact unless ``pretty`` asks for two-space indentation.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+@lru_cache(maxsize=32)
+def _parse_tech_type(type_str: str) -> TechnologyType:
+    """Map a tech file type name to its enum, defaulting to engineering."""
+    return _TYPE_MAPPING.get(type_str.lower(), TechnologyType.ENGINEERING)
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings; other values are left for validation to reject."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _technology_fields(tech_id: str, info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Technology fields for a tech file entry, with defaults filled in.
+
+    IDs are interned, so each one is stored once however many
+    prerequisite and unlock lists mention it, and set lookups against
+    them usually succeed on identity.
+    """
+    return dict(
+        id=_intern(tech_id),
+        name=info.get("name", tech_id.replace("_", " ").title()),
+        description=info.get("description", ""),
+        tech_type=_parse_tech_type(info.get("type", "engineering")),
+        research_cost=info.get("research_cost", 100),
+        prerequisites=[_intern(prereq) for prereq in info.get("prerequisites", [])],
+        unlocks=[_intern(unlock) for unlock in info.get("unlocks", [])],
+        is_researched=False
+    )
+
+
+def _build_technology(tech_id: str, info: Dict[str, Any]) -> Technology:
+    """Build a technology from its tech file entry."""
+    return Technology(**_technology_fields(tech_id, info))
+
+
+# Built-in tree used when techs.json is missing or unreadable
+_DEFAULT_TECH_SPECS = (
+    {
+        "id": "basic_propulsion",
+        "name": "Basic Propulsion",
+        "description": "Chemical rockets and basic thrust systems for interplanetary travel.",
+        "type": "propulsion",
+        "research_cost": 100,
+        "prerequisites": [],
+        "unlocks": ["advanced_propulsion", "fuel_efficiency"]
+    },
+    {
+        "id": "advanced_propulsion",
+        "name": "Advanced Propulsion",
+        "description": "Ion drives and nuclear thermal propulsion systems.",
+        "type": "propulsion",
+        "research_cost": 250,
+        "prerequisites": ["basic_propulsion", "basic_energy"],
+        "unlocks": ["fusion_drive"]
+    },
+    {
+        "id": "fusion_drive",
+        "name": "Fusion Drive",
+        "description": "Fusion-powered spacecraft propulsion systems.",
+        "type": "propulsion",
+        "research_cost": 500,
+        "prerequisites": ["advanced_propulsion", "fusion_power"],
+        "unlocks": ["antimatter_drive"]
+    },
+    {
+        "id": "basic_energy",
+        "name": "Basic Energy Systems",
+        "description": "Solar panels and chemical batteries for power generation.",
+        "type": "energy",
+        "research_cost": 80,
+        "prerequisites": [],
+        "unlocks": ["nuclear_power", "energy_storage"]
+    },
+    {
+        "id": "nuclear_power",
+        "name": "Nuclear Power",
+        "description": "Fission reactors for high-output power generation.",
+        "type": "energy",
+        "research_cost": 200,
+        "prerequisites": ["basic_energy"],
+        "unlocks": ["fusion_power"]
+    },
+    {
+        "id": "fusion_power",
+        "name": "Fusion Power",
+        "description": "Fusion reactors for clean, high-efficiency power.",
+        "type": "energy",
+        "research_cost": 400,
+        "prerequisites": ["nuclear_power", "magnetic_confinement"],
+        "unlocks": ["zero_point_energy"]
+    },
+    {
+        "id": "basic_sensors",
+        "name": "Basic Sensors",
+        "description": "Optical and radio telescopes for basic detection.",
+        "type": "sensors",
+        "research_cost": 75,
+        "prerequisites": [],
+        "unlocks": ["advanced_sensors", "deep_space_tracking"]
+    },
+    {
+        "id": "advanced_sensors",
+        "name": "Advanced Sensors",
+        "description": "Gravitational wave detectors and advanced imaging systems.",
+        "type": "sensors",
+        "research_cost": 180,
+        "prerequisites": ["basic_sensors", "basic_computing"],
+        "unlocks": ["quantum_sensors"]
+    },
+    {
+        "id": "basic_computing",
+        "name": "Basic Computing",
+        "description": "Digital computers and basic AI systems.",
+        "type": "computing",
+        "research_cost": 90,
+        "prerequisites": [],
+        "unlocks": ["advanced_computing", "ai_systems"]
+    },
+    {
+        "id": "advanced_computing",
+        "name": "Advanced Computing",
+        "description": "Quantum computers and neural networks.",
+        "type": "computing",
+        "research_cost": 220,
+        "prerequisites": ["basic_computing"],
+        "unlocks": ["quantum_computing"]
+    },
+    {
+        "id": "basic_weapons",
+        "name": "Basic Weapons",
+        "description": "Kinetic projectiles and basic laser systems.",
+        "type": "weapons",
+        "research_cost": 120,
+        "prerequisites": ["basic_energy"],
+        "unlocks": ["missile_systems", "beam_weapons"]
+    },
+    {
+        "id": "missile_systems",
+        "name": "Missile Systems",
+        "description": "Guided missiles and torpedo systems.",
+        "type": "weapons",
+        "research_cost": 200,
+        "prerequisites": ["basic_weapons", "basic_sensors"],
+        "unlocks": ["smart_missiles"]
+    },
+    {
+        "id": "basic_shields",
+        "name": "Basic Shields",
+        "description": "Electromagnetic field generators for deflection.",
+        "type": "shields",
+        "research_cost": 150,
+        "prerequisites": ["basic_energy", "magnetic_confinement"],
+        "unlocks": ["advanced_shields"]
+    },
+    {
+        "id": "magnetic_confinement",
+        "name": "Magnetic Confinement",
+        "description": "Magnetic field manipulation and control systems.",
+        "type": "physics",
+        "research_cost": 160,
+        "prerequisites": ["basic_energy"],
+        "unlocks": ["fusion_power", "basic_shields"]
+    },
+    {
+        "id": "basic_construction",
+        "name": "Basic Construction",
+        "description": "Space-based manufacturing and assembly systems.",
+        "type": "construction",
+        "research_cost": 110,
+        "prerequisites": [],
+        "unlocks": ["automated_construction", "orbital_shipyards"]
+    },
+    {
+        "id": "automated_construction",
+        "name": "Automated Construction",
+        "description": "Robotic construction systems and 3D printing.",
+        "type": "construction",
+        "research_cost": 240,
+        "prerequisites": ["basic_construction", "basic_computing"],
+        "unlocks": ["self_replicating_systems"]
+    },
+)
+
+
+@cache
+def _build_default_technologies() -> Tuple[Technology, ...]:
+    """Build the default tree once; managers copy these before use."""
+    return tuple(_build_technology(spec["id"], spec) for spec in _DEFAULT_TECH_SPECS)
+
+
+@dataclass
+class _ResearchFrontier:
+    """Incrementally maintained research state for one empire."""
+    researched: Set[str]
+    # Unresearched prerequisites left for each technology
+    remaining: Dict[str, int]
+    # Unresearched technologies whose prerequisites are all researched
+    available: Set[str]
+    # The available technologies in tree order, built on first request
+    ordered: Optional[List[Technology]] = None
+
 
 class TechTreeManager:
     """
@@ -31,11 +299,59 @@ class TechTreeManager:
             data_directory: Directory containing tech data files
         """
         self.data_directory = Path(data_directory)
-        self.technologies: Dict[str, Technology] = {}
-        self.tech_tree_loaded = False
-        
-        # Try to load tech tree data
-        self.load_tech_tree()
+
+        # The tree is read from disk on first use rather than here
+        self._technologies: Optional[Dict[str, Technology]] = None
+        self._tech_tree_loaded = False
+
+        # Technology IDs ordered so prerequisites come before dependents
+        self._topo_order: List[str] = []
+        # Every known prerequisite, direct or indirect, in research order
+        self._ancestors: Dict[str, Tuple[str, ...]] = {}
+        # Technologies grouped by type, rebuilt with the other indexes
+        self._by_type: Dict[TechnologyType, List[Technology]] = {}
+        # Prerequisites of each technology as a set for subset checks
+        self._prereq_sets: Dict[str, FrozenSet[str]] = {}
+        # Technologies that list each ID as a prerequisite
+        self._dependents: Dict[str, List[str]] = {}
+        # Position of each technology in self.technologies
+        self._positions: Dict[str, int] = {}
+        # Availability state per empire, advanced as research completes
+        self._frontiers: Dict[Optional[str], _ResearchFrontier] = {}
+        # Result of get_technology_tree_summary until the tree changes
+        self._summary_cache: Optional[Dict[str, Any]] = None
+
+    @property
+    def technologies(self) -> Dict[str, Technology]:
+        """Technologies by ID, loaded from disk on first access."""
+        self._ensure_loaded()
+        return self._technologies
+
+    @technologies.setter
+    def technologies(self, technologies: Dict[str, Technology]) -> None:
+        self._technologies = technologies
+        self._reindex()
+
+    @property
+    def tech_tree_loaded(self) -> bool:
+        """Whether the tree came from the tech file."""
+        self._ensure_loaded()
+        return self._tech_tree_loaded
+
+    def _ensure_loaded(self) -> None:
+        """Load the tech tree if nothing has loaded it yet."""
+        if self._technologies is None:
+            self.load_tech_tree()
+
+    def _ensure_indexed(self) -> None:
+        """Re-index if technologies were added to or removed from the dict directly."""
+        if len(self._positions) != len(self.technologies):
+            self._reindex()
+
+    def _reindex(self) -> None:
+        """Re-derive the research order and every index from the current dict."""
+        self._sort_technologies()
+        self._index_technologies()
     
     def load_tech_tree(self) -> bool:
         """
@@ -45,6 +361,8 @@ class TechTreeManager:
             True if loading was successful
         """
         tech_file = self.data_directory / "techs.json"
+        if self._technologies is None:
+            self._technologies = {}
         
         if not tech_file.exists():
             logger.warning(f"Tech file not found: {tech_file}")
@@ -52,13 +370,15 @@ class TechTreeManager:
             return False
         
         try:
-            with open(tech_file, 'r') as f:
-                tech_data = json.load(f)
-            
-            self._load_technologies_from_data(tech_data)
+            if IJSON_AVAILABLE and tech_file.stat().st_size >= _STREAM_PARSE_THRESHOLD:
+                self._load_technologies_stream(tech_file)
+            else:
+                tech_data = _json_loads(tech_file.read_bytes())
+                self._load_technologies_from_data(tech_data)
             self._validate_tech_tree()
+            self._index_technologies()
             
-            self.tech_tree_loaded = True
+            self._tech_tree_loaded = True
             logger.info(f"Loaded {len(self.technologies)} technologies")
             return True
             
@@ -69,70 +389,92 @@ class TechTreeManager:
     
     def _load_technologies_from_data(self, tech_data: Dict) -> None:
         """Load technologies from parsed JSON data."""
+        self._load_technology_entries(tech_data.get("technologies", {}).items())
+
+    def _load_technologies_stream(self, tech_file: Path) -> None:
+        """
+        Load technologies while stream-parsing the file with ijson.
+
+        Entries are built one at a time, so the decoded file is never held
+        in memory alongside the technologies.
+        """
+        with open(tech_file, 'rb') as f:
+            self._load_technology_entries(ijson.kvitems(f, "technologies"))
+
+    def _load_technology_entries(
+        self, entries: Iterable[Tuple[str, Dict[str, Any]]]
+    ) -> None:
+        """Replace the tree with technologies built from ``(id, info)`` pairs."""
         self.technologies.clear()
         
-        for tech_id, tech_info in tech_data.get("technologies", {}).items():
+        batch: List[Dict[str, Any]] = []
+        for tech_id, tech_info in entries:
             try:
-                # Parse technology type
-                tech_type_str = tech_info.get("type", "engineering")
-                tech_type = self._parse_tech_type(tech_type_str)
-                
-                # Create technology object
-                technology = Technology(
-                    id=tech_id,
-                    name=tech_info.get("name", tech_id.replace("_", " ").title()),
-                    description=tech_info.get("description", ""),
-                    tech_type=tech_type,
-                    research_cost=tech_info.get("research_cost", 100),
-                    prerequisites=tech_info.get("prerequisites", []),
-                    unlocks=tech_info.get("unlocks", []),
-                    is_researched=False
-                )
-                
-                self.technologies[tech_id] = technology
-                
+                batch.append(_technology_fields(tech_id, tech_info))
             except Exception as e:
                 logger.error(f"Error loading technology {tech_id}: {e}")
+                continue
+            if len(batch) >= _VALIDATION_BATCH_SIZE:
+                self._add_technology_batch(batch)
+                batch = []
+        if batch:
+            self._add_technology_batch(batch)
+
+    def _add_technology_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Validate a batch of technology fields and add them to the tree."""
+        try:
+            technologies = _TECHNOLOGY_LIST.validate_python(batch)
+        except ValidationError:
+            # Retry one by one so only the invalid entries are dropped
+            technologies = []
+            for fields in batch:
+                try:
+                    technologies.append(Technology(**fields))
+                except Exception as e:
+                    logger.error(f"Error loading technology {fields['id']}: {e}")
+
+        for technology in technologies:
+            self.technologies[technology.id] = technology
     
     def _parse_tech_type(self, type_str: str) -> TechnologyType:
         """Parse technology type from string."""
-        type_mapping = {
-            "propulsion": TechnologyType.PROPULSION,
-            "energy": TechnologyType.ENERGY,
-            "weapons": TechnologyType.WEAPONS,
-            "shields": TechnologyType.SHIELDS,
-            "sensors": TechnologyType.SENSORS,
-            "construction": TechnologyType.CONSTRUCTION,
-            "biology": TechnologyType.BIOLOGY,
-            "physics": TechnologyType.PHYSICS,
-            "engineering": TechnologyType.ENGINEERING,
-            "logistics": TechnologyType.LOGISTICS,
-            "computing": TechnologyType.COMPUTING,
-            "materials": TechnologyType.MATERIALS,
-        }
-        
-        return type_mapping.get(type_str.lower(), TechnologyType.ENGINEERING)
+        return _parse_tech_type(type_str)
     
     def _validate_tech_tree(self) -> None:
         """Validate the technology tree for consistency."""
         errors = []
         
         # Check for circular dependencies
-        for tech_id in self.technologies:
-            if self._has_circular_dependency(tech_id):
-                errors.append(f"Circular dependency detected for {tech_id}")
+        for cycle in self._sort_technologies():
+            chain = " -> ".join(cycle + cycle[:1])
+            errors.append(f"Circular dependency detected: {chain}")
         
-        # Check for invalid prerequisites
-        for tech_id, tech in self.technologies.items():
-            for prereq in tech.prerequisites:
-                if prereq not in self.technologies:
-                    errors.append(f"Invalid prerequisite {prereq} for {tech_id}")
+        technologies = self.technologies
+
+        # Check for invalid prerequisites; unknown IDs are found with set
+        # operations and only the techs that mention one are revisited
+        missing = set().union(
+            *(tech.prerequisites for tech in technologies.values())
+        ) - technologies.keys()
+        if missing:
+            for tech_id, tech in technologies.items():
+                if missing.isdisjoint(tech.prerequisites):
+                    continue
+                for prereq in tech.prerequisites:
+                    if prereq in missing:
+                        errors.append(f"Invalid prerequisite {prereq} for {tech_id}")
         
         # Check for invalid unlocks
-        for tech_id, tech in self.technologies.items():
-            for unlock in tech.unlocks:
-                if unlock not in self.technologies:
-                    logger.warning(f"Technology {tech_id} unlocks unknown tech: {unlock}")
+        missing = set().union(
+            *(tech.unlocks for tech in technologies.values())
+        ) - technologies.keys()
+        if missing:
+            for tech_id, tech in technologies.items():
+                if missing.isdisjoint(tech.unlocks):
+                    continue
+                for unlock in tech.unlocks:
+                    if unlock in missing:
+                        logger.warning(f"Technology {tech_id} unlocks unknown tech: {unlock}")
         
         if errors:
             logger.error("Tech tree validation errors:")
@@ -141,235 +483,234 @@ class TechTreeManager:
         else:
             logger.info("Tech tree validation passed")
     
-    def _has_circular_dependency(self, tech_id: str, visited: Optional[Set[str]] = None) -> bool:
-        """Check if a technology has circular dependencies."""
-        if visited is None:
-            visited = set()
-        
-        if tech_id in visited:
-            return True
-        
-        tech = self.technologies.get(tech_id)
-        if not tech:
-            return False
-        
-        visited.add(tech_id)
-        
-        for prereq in tech.prerequisites:
-            if self._has_circular_dependency(prereq, visited.copy()):
-                return True
-        
-        return False
+    def _sort_technologies(self) -> List[List[str]]:
+        """
+        Order technologies so every prerequisite precedes its dependents.
+
+        A single pass of Tarjan's strongly connected components algorithm
+        stores the order in self._topo_order. Components come out
+        prerequisites-first, and any component with more than one member,
+        or a tech that requires itself, is a circular dependency.
+
+        Returns:
+            One cycle per circular dependency, starting at its
+            lexicographically smallest technology ID
+        """
+        technologies = self.technologies
+        order: List[str] = []
+        cycles: List[List[str]] = []
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+
+        for root in technologies:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(technologies[root].prerequisites))]
+            while work:
+                tech_id, prereqs = work[-1]
+                for prereq in prereqs:
+                    if prereq not in technologies:
+                        continue
+                    if prereq not in index:
+                        index[prereq] = lowlink[prereq] = len(index)
+                        stack.append(prereq)
+                        on_stack.add(prereq)
+                        work.append((prereq, iter(technologies[prereq].prerequisites)))
+                        break
+                    if prereq in on_stack and index[prereq] < lowlink[tech_id]:
+                        lowlink[tech_id] = index[prereq]
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        if lowlink[tech_id] < lowlink[parent]:
+                            lowlink[parent] = lowlink[tech_id]
+                    if lowlink[tech_id] != index[tech_id]:
+                        continue
+
+                    # tech_id roots a component; everything above it on the
+                    # stack belongs to the same one
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == tech_id:
+                            break
+                    order.extend(component)
+                    if len(component) > 1 or tech_id in technologies[tech_id].prerequisites:
+                        cycles.append(self._find_cycle(min(component), set(component)))
+
+        self._topo_order = order
+        return cycles
+
+    def _find_cycle(self, start: str, members: Set[str]) -> List[str]:
+        """Shortest prerequisite cycle through ``start`` within ``members``."""
+        came_from: Dict[str, str] = {}
+        frontier = [start]
+        while frontier:
+            next_frontier = []
+            for tech_id in frontier:
+                for prereq in self.technologies[tech_id].prerequisites:
+                    if prereq == start:
+                        cycle = [tech_id]
+                        while cycle[-1] != start:
+                            cycle.append(came_from[cycle[-1]])
+                        cycle.reverse()
+                        return cycle
+                    if prereq in members and prereq not in came_from:
+                        came_from[prereq] = tech_id
+                        next_frontier.append(prereq)
+            frontier = next_frontier
+        return [start]  # pragma: no cover - members always form a cycle
+    
+    def _index_technologies(self) -> None:
+        """Rebuild lookup tables derived from the validated tree."""
+        technologies = self.technologies
+
+        # Prerequisites come first in the order, so their ancestors are
+        # complete by the time a dependent needs them. Each entry lists a
+        # prerequisite's own ancestors before it, prerequisites in the order
+        # they are declared, as a depth-first walk would visit them.
+        ancestors: Dict[str, Tuple[str, ...]] = {}
+        for tech_id in self._topo_order:
+            found: Dict[str, None] = {}
+            for prereq in technologies[tech_id].prerequisites:
+                if prereq in ancestors:
+                    found.update(dict.fromkeys(ancestors[prereq]))
+                    found[prereq] = None
+            found.pop(tech_id, None)
+            ancestors[tech_id] = tuple(found)
+        self._ancestors = ancestors
+
+        by_type: Dict[TechnologyType, List[Technology]] = defaultdict(list)
+        for tech in technologies.values():
+            by_type[tech.tech_type].append(tech)
+        self._by_type = dict(by_type)
+
+        self._prereq_sets = {
+            tech_id: frozenset(tech.prerequisites)
+            for tech_id, tech in technologies.items()
+        }
+
+        dependents: Dict[str, List[str]] = defaultdict(list)
+        for tech_id, prereqs in self._prereq_sets.items():
+            for prereq in prereqs:
+                dependents[prereq].append(tech_id)
+        self._dependents = dict(dependents)
+        self._positions = {tech_id: i for i, tech_id in enumerate(technologies)}
+        self._frontiers = {}
+        self._summary_cache = None
     
     def _create_default_tech_tree(self) -> None:
         """Create a default technology tree."""
         logger.info("Creating default technology tree")
         
-        default_techs = [
-            {
-                "id": "basic_propulsion",
-                "name": "Basic Propulsion",
-                "description": "Chemical rockets and basic thrust systems for interplanetary travel.",
-                "type": "propulsion",
-                "research_cost": 100,
-                "prerequisites": [],
-                "unlocks": ["advanced_propulsion", "fuel_efficiency"]
-            },
-            {
-                "id": "advanced_propulsion",
-                "name": "Advanced Propulsion",
-                "description": "Ion drives and nuclear thermal propulsion systems.",
-                "type": "propulsion",
-                "research_cost": 250,
-                "prerequisites": ["basic_propulsion", "basic_energy"],
-                "unlocks": ["fusion_drive"]
-            },
-            {
-                "id": "fusion_drive",
-                "name": "Fusion Drive",
-                "description": "Fusion-powered spacecraft propulsion systems.",
-                "type": "propulsion",
-                "research_cost": 500,
-                "prerequisites": ["advanced_propulsion", "fusion_power"],
-                "unlocks": ["antimatter_drive"]
-            },
-            {
-                "id": "basic_energy",
-                "name": "Basic Energy Systems",
-                "description": "Solar panels and chemical batteries for power generation.",
-                "type": "energy",
-                "research_cost": 80,
-                "prerequisites": [],
-                "unlocks": ["nuclear_power", "energy_storage"]
-            },
-            {
-                "id": "nuclear_power",
-                "name": "Nuclear Power",
-                "description": "Fission reactors for high-output power generation.",
-                "type": "energy",
-                "research_cost": 200,
-                "prerequisites": ["basic_energy"],
-                "unlocks": ["fusion_power"]
-            },
-            {
-                "id": "fusion_power",
-                "name": "Fusion Power",
-                "description": "Fusion reactors for clean, high-efficiency power.",
-                "type": "energy",
-                "research_cost": 400,
-                "prerequisites": ["nuclear_power", "magnetic_confinement"],
-                "unlocks": ["zero_point_energy"]
-            },
-            {
-                "id": "basic_sensors",
-                "name": "Basic Sensors",
-                "description": "Optical and radio telescopes for basic detection.",
-                "type": "sensors",
-                "research_cost": 75,
-                "prerequisites": [],
-                "unlocks": ["advanced_sensors", "deep_space_tracking"]
-            },
-            {
-                "id": "advanced_sensors",
-                "name": "Advanced Sensors",
-                "description": "Gravitational wave detectors and advanced imaging systems.",
-                "type": "sensors",
-                "research_cost": 180,
-                "prerequisites": ["basic_sensors", "basic_computing"],
-                "unlocks": ["quantum_sensors"]
-            },
-            {
-                "id": "basic_computing",
-                "name": "Basic Computing",
-                "description": "Digital computers and basic AI systems.",
-                "type": "computing",
-                "research_cost": 90,
-                "prerequisites": [],
-                "unlocks": ["advanced_computing", "ai_systems"]
-            },
-            {
-                "id": "advanced_computing",
-                "name": "Advanced Computing",
-                "description": "Quantum computers and neural networks.",
-                "type": "computing",
-                "research_cost": 220,
-                "prerequisites": ["basic_computing"],
-                "unlocks": ["quantum_computing"]
-            },
-            {
-                "id": "basic_weapons",
-                "name": "Basic Weapons",
-                "description": "Kinetic projectiles and basic laser systems.",
-                "type": "weapons",
-                "research_cost": 120,
-                "prerequisites": ["basic_energy"],
-                "unlocks": ["missile_systems", "beam_weapons"]
-            },
-            {
-                "id": "missile_systems",
-                "name": "Missile Systems",
-                "description": "Guided missiles and torpedo systems.",
-                "type": "weapons",
-                "research_cost": 200,
-                "prerequisites": ["basic_weapons", "basic_sensors"],
-                "unlocks": ["smart_missiles"]
-            },
-            {
-                "id": "basic_shields",
-                "name": "Basic Shields",
-                "description": "Electromagnetic field generators for deflection.",
-                "type": "shields",
-                "research_cost": 150,
-                "prerequisites": ["basic_energy", "magnetic_confinement"],
-                "unlocks": ["advanced_shields"]
-            },
-            {
-                "id": "magnetic_confinement",
-                "name": "Magnetic Confinement",
-                "description": "Magnetic field manipulation and control systems.",
-                "type": "physics",
-                "research_cost": 160,
-                "prerequisites": ["basic_energy"],
-                "unlocks": ["fusion_power", "basic_shields"]
-            },
-            {
-                "id": "basic_construction",
-                "name": "Basic Construction",
-                "description": "Space-based manufacturing and assembly systems.",
-                "type": "construction",
-                "research_cost": 110,
-                "prerequisites": [],
-                "unlocks": ["automated_construction", "orbital_shipyards"]
-            },
-            {
-                "id": "automated_construction",
-                "name": "Automated Construction",
-                "description": "Robotic construction systems and 3D printing.",
-                "type": "construction",
-                "research_cost": 240,
-                "prerequisites": ["basic_construction", "basic_computing"],
-                "unlocks": ["self_replicating_systems"]
-            }
-        ]
-        
-        # Convert to Technology objects
-        for tech_data in default_techs:
-            tech_type = self._parse_tech_type(tech_data["type"])
-            technology = Technology(
-                id=tech_data["id"],
-                name=tech_data["name"],
-                description=tech_data["description"],
-                tech_type=tech_type,
-                research_cost=tech_data["research_cost"],
-                prerequisites=tech_data["prerequisites"],
-                unlocks=tech_data["unlocks"],
-                is_researched=False
-            )
-            self.technologies[tech_data["id"]] = technology
+        # Research progress is tracked on Technology objects, so each
+        # manager gets its own copies of the shared defaults
+        self.technologies.clear()
+        for technology in _build_default_technologies():
+            self.technologies[technology.id] = technology.model_copy()
         
         # Validate the default tree
         self._validate_tech_tree()
+        self._index_technologies()
     
     def get_technology(self, tech_id: str) -> Optional[Technology]:
         """Get a technology by ID."""
         return self.technologies.get(tech_id)
     
-    def get_all_technologies(self) -> Dict[str, Technology]:
-        """Get all technologies."""
+    def get_all_technologies(self) -> Mapping[str, Technology]:
+        """Get a read-only view of all technologies."""
+        return MappingProxyType(self.technologies)
+
+    def get_all_technologies_copy(self) -> Dict[str, Technology]:
+        """Get a new dict of all technologies that the caller may modify."""
         return self.technologies.copy()
     
     def get_technologies_by_type(self, tech_type: TechnologyType) -> List[Technology]:
         """Get all technologies of a specific type."""
-        return [tech for tech in self.technologies.values() if tech.tech_type == tech_type]
+        self._ensure_indexed()
+        return list(self._by_type.get(tech_type, ()))
     
-    def get_available_technologies(self, researched_techs: Set[str]) -> List[Technology]:
+    def get_available_technologies(
+        self, researched_techs: Set[str], empire_id: Optional[str] = None
+    ) -> List[Technology]:
         """
         Get technologies that can be researched based on current knowledge.
+
+        The result for each empire is kept between calls. When the researched
+        set has only grown since the last call, just the dependents of the
+        newly researched technologies are re-checked.
         
         Args:
             researched_techs: Set of already researched technology IDs
+            empire_id: Optional key to keep availability state under, so
+                several empires can query without evicting each other
             
         Returns:
             List of available technologies
         """
-        available = []
-        
-        for tech in self.technologies.values():
-            if tech.id in researched_techs:
-                continue  # Already researched
-            
-            # Check if prerequisites are met
-            if self._are_prerequisites_met(tech, researched_techs):
-                available.append(tech)
-        
-        return available
+        self._ensure_indexed()
+        if not isinstance(researched_techs, AbstractSet):
+            researched_techs = frozenset(researched_techs)
+
+        frontier = self._frontiers.get(empire_id)
+        if frontier is None or not frontier.researched.issubset(researched_techs):
+            frontier = self._build_frontier(researched_techs)
+            self._frontiers[empire_id] = frontier
+        elif len(frontier.researched) != len(researched_techs):
+            self._advance_frontier(frontier, researched_techs - frontier.researched)
+
+        if frontier.ordered is None:
+            technologies = self.technologies
+            frontier.ordered = [
+                technologies[tech_id]
+                for tech_id in sorted(frontier.available, key=self._positions.__getitem__)
+            ]
+        return frontier.ordered.copy()
+
+    def _build_frontier(self, researched_techs: AbstractSet[str]) -> _ResearchFrontier:
+        """Compute availability from scratch for a researched set."""
+        remaining = {
+            tech_id: len(prereqs - researched_techs)
+            for tech_id, prereqs in self._prereq_sets.items()
+        }
+        available = {
+            tech_id
+            for tech_id, count in remaining.items()
+            if count == 0 and tech_id not in researched_techs
+        }
+        return _ResearchFrontier(set(researched_techs), remaining, available)
+
+    def _advance_frontier(
+        self, frontier: _ResearchFrontier, newly_researched: Iterable[str]
+    ) -> None:
+        """Update availability after ``newly_researched`` completes."""
+        researched = frontier.researched
+        remaining = frontier.remaining
+        available = frontier.available
+        frontier.ordered = None
+        for tech_id in newly_researched:
+            researched.add(tech_id)
+            available.discard(tech_id)
+            for dependent in self._dependents.get(tech_id, ()):
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0 and dependent not in researched:
+                    available.add(dependent)
     
     def _are_prerequisites_met(self, technology: Technology, researched_techs: Set[str]) -> bool:
         """Check if technology prerequisites are satisfied."""
-        for prereq in technology.prerequisites:
-            if prereq not in researched_techs:
-                return False
-        return True
+        self._ensure_indexed()
+        prereqs = self._prereq_sets.get(technology.id)
+        if prereqs is None:
+            prereqs = frozenset(technology.prerequisites)
+        return prereqs.issubset(researched_techs)
     
     def get_research_path(self, target_tech_id: str, researched_techs: Set[str]) -> List[str]:
         """
@@ -385,85 +726,99 @@ class TechTreeManager:
         if target_tech_id in researched_techs:
             return []  # Already researched
         
-        target_tech = self.technologies.get(target_tech_id)
-        if not target_tech:
+        self._ensure_indexed()
+        ancestors = self._ancestors.get(target_tech_id)
+        if ancestors is None:
             return []  # Invalid technology
         
-        path = []
-        to_research = set()
-        
-        def collect_prerequisites(tech_id: str):
-            if tech_id in researched_techs:
-                return  # Already have it
-            
-            tech = self.technologies.get(tech_id)
-            if not tech:
-                return
-            
-            # First collect prerequisites
-            for prereq in tech.prerequisites:
-                collect_prerequisites(prereq)
-            
-            # Then add this technology
-            if tech_id not in to_research:
-                to_research.add(tech_id)
+        if researched_techs.isdisjoint(ancestors):
+            return [*ancestors, target_tech_id]
+
+        # Researched technologies end the walk: their own prerequisites are
+        # not needed even when some of those are unresearched
+        technologies = self.technologies
+        path: List[str] = []
+        visited = {target_tech_id}
+        stack = [(target_tech_id, iter(technologies[target_tech_id].prerequisites))]
+        while stack:
+            tech_id, prereqs = stack[-1]
+            for prereq in prereqs:
+                if (prereq not in visited and prereq not in researched_techs
+                        and prereq in technologies):
+                    visited.add(prereq)
+                    stack.append((prereq, iter(technologies[prereq].prerequisites)))
+                    break
+            else:
+                stack.pop()
                 path.append(tech_id)
-        
-        collect_prerequisites(target_tech_id)
         return path
     
     def get_technology_tree_summary(self) -> Dict[str, any]:
-        """Get a summary of the technology tree."""
-        summary = {
-            "total_technologies": len(self.technologies),
-            "by_type": {},
+        """
+        Get a summary of the technology tree.
+
+        The summary is computed once per loaded tree and the same dict is
+        returned until the tree is reloaded or replaced, so callers should
+        not modify it.
+        """
+        self._ensure_indexed()
+        if self._summary_cache is None:
+            self._summary_cache = self._summarize_tree()
+        return self._summary_cache
+
+    def _summarize_tree(self) -> Dict[str, Any]:
+        """Compute the statistics returned by get_technology_tree_summary."""
+        # Gather every statistic in a single pass over the technologies
+        by_type: Dict[str, int] = defaultdict(int)
+        total_cost = 0
+        min_cost = float('inf')
+        max_cost = 0
+        max_prerequisites = 0
+        no_prerequisites = 0
+        no_unlocks = 0
+        for tech in self.technologies.values():
+            by_type[tech.tech_type.value] += 1
+
+            cost = tech.research_cost
+            total_cost += cost
+            if cost < min_cost:
+                min_cost = cost
+            if cost > max_cost:
+                max_cost = cost
+
+            prereq_count = len(tech.prerequisites)
+            if prereq_count > max_prerequisites:
+                max_prerequisites = prereq_count
+            if prereq_count == 0:
+                no_prerequisites += 1
+            if not tech.unlocks:
+                no_unlocks += 1
+
+        count = len(self.technologies)
+        return {
+            "total_technologies": count,
+            "by_type": dict(by_type),
             "research_costs": {
-                "total": sum(tech.research_cost for tech in self.technologies.values()),
-                "average": 0,
-                "min": float('inf'),
-                "max": 0
+                "total": total_cost,
+                "average": total_cost / count if count else 0,
+                "min": min_cost,
+                "max": max_cost
             },
             "complexity": {
-                "max_prerequisites": 0,
-                "technologies_with_no_prerequisites": 0,
-                "technologies_with_no_unlocks": 0
+                "max_prerequisites": max_prerequisites,
+                "technologies_with_no_prerequisites": no_prerequisites,
+                "technologies_with_no_unlocks": no_unlocks
             }
         }
-        
-        # Count by type
-        for tech in self.technologies.values():
-            tech_type = tech.tech_type.value if hasattr(tech.tech_type, 'value') else str(tech.tech_type)
-            summary["by_type"][tech_type] = summary["by_type"].get(tech_type, 0) + 1
-        
-        # Calculate research cost statistics
-        if self.technologies:
-            costs = [tech.research_cost for tech in self.technologies.values()]
-            summary["research_costs"]["average"] = sum(costs) / len(costs)
-            summary["research_costs"]["min"] = min(costs)
-            summary["research_costs"]["max"] = max(costs)
-        
-        # Calculate complexity statistics
-        for tech in self.technologies.values():
-            prereq_count = len(tech.prerequisites)
-            summary["complexity"]["max_prerequisites"] = max(
-                summary["complexity"]["max_prerequisites"], 
-                prereq_count
-            )
-            
-            if prereq_count == 0:
-                summary["complexity"]["technologies_with_no_prerequisites"] += 1
-            
-            if not tech.unlocks:
-                summary["complexity"]["technologies_with_no_unlocks"] += 1
-        
-        return summary
     
-    def save_tech_tree(self, file_path: Optional[str] = None) -> str:
+    def save_tech_tree(self, file_path: Optional[str] = None, pretty: bool = False) -> str:
         """
         Save the current technology tree to a file.
         
         Args:
             file_path: Optional custom file path
+            pretty: Indent the JSON for hand editing instead of writing it
+                compactly
             
         Returns:
             Path to saved file
@@ -481,11 +836,10 @@ class TechTreeManager:
         }
         
         for tech_id, tech in self.technologies.items():
-            tech_type = tech.tech_type.value if hasattr(tech.tech_type, 'value') else str(tech.tech_type)
             tech_data["technologies"][tech_id] = {
                 "name": tech.name,
                 "description": tech.description,
-                "type": tech_type,
+                "type": tech.tech_type.value,
                 "research_cost": tech.research_cost,
                 "prerequisites": tech.prerequisites,
                 "unlocks": tech.unlocks
@@ -495,8 +849,8 @@ class TechTreeManager:
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Save file
-        with open(file_path, 'w') as f:
-            json.dump(tech_data, f, indent=2)
+        with open(file_path, 'wb') as f:
+            f.write(_json_dumps(tech_data, pretty))
         
         logger.info(f"Technology tree saved to: {file_path}")
         return str(file_path)
@@ -5,11 +5,23 @@ Centralized management of fleet operations, order processing, combat resolution,
 formation control, and tactical coordination for advanced fleet command.
 """
 
+import bisect
+from collections import defaultdict
 import logging
-import math
-from typing import Dict, List, Optional, Tuple, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Any
 import uuid
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
 from pyaurora4x.core.models import Fleet, Ship, Empire, Vector3D
 from pyaurora4x.core.enums import (
     OrderType, OrderPriority, OrderStatus, FleetStatus, FleetFormation,
@@ -23,6 +35,47 @@ from pyaurora4x.core.fleet_command import (
 
 logger = logging.getLogger(__name__)
 
+# Below this many fleets the scalar paths are faster than NumPy
+_MOVE_BATCH_MIN = 16
+_FORMATION_BATCH_MIN = 16
+
+# Speed used for fleets without a known maximum speed (m/s)
+_DEFAULT_FLEET_SPEED = 1000.0
+
+# Fleet status while an order of each type is being carried out
+_ORDER_ACTIVE_STATUS = MappingProxyType({
+    OrderType.MOVE_TO: FleetStatus.MOVING,
+    OrderType.ATTACK: FleetStatus.IN_COMBAT,
+    OrderType.DEFEND: FleetStatus.IDLE,  # Defensive posture
+    OrderType.PATROL: FleetStatus.PATROLLING,
+    OrderType.ESCORT: FleetStatus.ESCORTING,
+    OrderType.FORM_UP: FleetStatus.FORMING_UP,
+    OrderType.CHANGE_FORMATION: FleetStatus.FORMING_UP,
+    OrderType.SURVEY: FleetStatus.SURVEYING,
+    OrderType.REFUEL: FleetStatus.REFUELING,
+    OrderType.REPAIR: FleetStatus.REPAIRING,
+    OrderType.RESUPPLY: FleetStatus.RESUPPLYING,
+})
+
+# Fleet status once an order completes; other order types return to idle
+_ORDER_COMPLETE_STATUS = MappingProxyType({
+    OrderType.ESCORT: FleetStatus.ESCORTING,
+    OrderType.FORM_UP: FleetStatus.IN_FORMATION,
+    OrderType.CHANGE_FORMATION: FleetStatus.IN_FORMATION,
+})
+
+# Order statuses after which an order leaves the queue
+_TERMINAL_STATUSES = frozenset({OrderStatus.COMPLETED, OrderStatus.FAILED, OrderStatus.CANCELLED})
+
+# Queue position of each order priority; lower ranks run first
+_PRIORITY_RANK = MappingProxyType({
+    OrderPriority.EMERGENCY: 0,
+    OrderPriority.HIGH: 1,
+    OrderPriority.NORMAL: 2,
+    OrderPriority.LOW: 3,
+    OrderPriority.BACKGROUND: 4,
+})
+
 
 class FleetCommandManager:
     """Central manager for all fleet command operations."""
@@ -33,9 +86,35 @@ class FleetCommandManager:
         self.fleet_orders: Dict[str, FleetOrder] = {}  # order_id -> order
         self.combat_engagements: Dict[str, CombatEngagement] = {}  # engagement_id -> engagement
         self.formation_states: Dict[str, FleetFormationState] = {}  # fleet_id -> formation_state
+
+        # Fleets with at least one order still in their command state
+        self._fleets_with_orders: set[str] = set()
+        
+        # Spatial index of commanded fleets: system_id -> fleet IDs, plus
+        # the system each fleet is currently indexed under. Jumps change
+        # fleet.system_id without telling this manager, so the commanded
+        # fleets are kept to re-check their system before the index is read.
+        self._fleets: Dict[str, Fleet] = {}
+        self._fleets_by_system: Dict[str, set[str]] = defaultdict(set)
+        self._fleet_systems: Dict[str, str] = {}
+        
+        # Move-to results computed in one batch for the current tick:
+        # order_id -> (x, y, z, reached, progress)
+        self._planned_moves: Dict[str, Tuple[float, float, float, bool, float]] = {}
         
         # Command processing
         self.order_processors = self._initialize_order_processors()
+        # Processors with their active and completed fleet statuses, keyed
+        # by the raw enum value: str hashes are cached, while hashing an Enum
+        # member calls Enum.__hash__ in Python
+        self._processor_dispatch = {
+            order_type._value_: (
+                processor,
+                _ORDER_ACTIVE_STATUS.get(order_type),
+                _ORDER_COMPLETE_STATUS.get(order_type, FleetStatus.IDLE),
+            )
+            for order_type, processor in self.order_processors.items()
+        }
         self.combat_resolver = CombatResolver()
         self.formation_manager = FormationManager(self.formation_templates)
     
@@ -48,16 +127,14 @@ class FleetCommandManager:
             fleet_id=fleet.id,
             flagship_id=fleet.ships[0] if fleet.ships else None,
             commanding_officer_id=fleet.commander_id,
-            formation_templates=self.formation_templates.copy()
         )
         
-        # Initialize combat capabilities from fleet composition
-        self._calculate_fleet_combat_capabilities(fleet, command_state)
-        
-        # Initialize logistics requirements
-        self._calculate_fleet_logistics_requirements(fleet, command_state)
+        # Initialize combat capabilities and logistics from fleet composition
+        self._calculate_fleet_derived_stats(fleet, command_state)
         
         self.fleet_command_states[fleet.id] = command_state
+        self._fleets[fleet.id] = fleet
+        self.update_fleet_system(fleet)
         logger.info("Initialized fleet command for %s", fleet.name)
         return command_state
     
@@ -67,12 +144,17 @@ class FleetCommandManager:
         if fleet_id not in self.fleet_command_states:
             return False, "Fleet command not initialized"
         
+        parameters = parameters or {}
+        # Promote the formation template from the generic parameters
+        if "formation_template_id" in parameters:
+            kwargs.setdefault("formation_template_id", parameters["formation_template_id"])
+        
         # Create the order
         order = FleetOrder(
             fleet_id=fleet_id,
             order_type=order_type,
             priority=priority,
-            parameters=parameters or {},
+            parameters=parameters,
             **kwargs
         )
         
@@ -87,10 +169,8 @@ class FleetCommandManager:
         # Add to fleet command state
         command_state = self.fleet_command_states[fleet_id]
         command_state.current_orders[order.id] = order
-        command_state.order_queue.append(order.id)
-        
-        # Sort order queue by priority
-        self._sort_order_queue(fleet_id)
+        self._enqueue_order(command_state, order)
+        self._fleets_with_orders.add(fleet_id)
         
         logger.info("Issued %s order to fleet %s (Priority: %s)", 
                    order_type.value, fleet_id, priority.value)
@@ -106,63 +186,95 @@ class FleetCommandManager:
         if order_id not in command_state.current_orders:
             return False
         
-        # Remove from queue and current orders
-        if order_id in command_state.order_queue:
-            command_state.order_queue.remove(order_id)
-        
+        # Drop from current orders; the queue entry is left behind as a
+        # tombstone and skipped until the next pass compacts the queue
         order = command_state.current_orders[order_id]
         order.status = OrderStatus.CANCELLED
         
         del command_state.current_orders[order_id]
+        if not command_state.current_orders:
+            # Nothing left to process, so drop the tombstones right away
+            command_state.order_queue.clear()
+            self._fleets_with_orders.discard(fleet_id)
         
         logger.info("Cancelled order %s for fleet %s", order.order_type.value, fleet_id)
         return True
     
+    def process_all_fleet_orders(self, fleets: Dict[str, Fleet], empires: Dict[str, Empire],
+                                 delta_seconds: float) -> None:
+        """
+        Process pending orders for many fleets in one tick.
+
+        Only fleets that have orders are visited. The movement of every
+        fleet with an active move-to order is computed together in a single
+        NumPy step before the fleets' queues are processed as usual by
+        process_fleet_orders.
+
+        Args:
+            fleets: Fleets to process by ID
+            empires: Empires by ID, looked up from each fleet's empire_id
+            delta_seconds: Time elapsed this tick
+        """
+        active = [fleets[fleet_id] for fleet_id in self._fleets_with_orders if fleet_id in fleets]
+        self._plan_moves(active, delta_seconds)
+        try:
+            for fleet in active:
+                self.process_fleet_orders(fleet, empires.get(fleet.empire_id), delta_seconds)
+        finally:
+            self._planned_moves.clear()
+
     def process_fleet_orders(self, fleet: Fleet, empire: Empire, delta_seconds: float) -> None:
         """Process all pending orders for a fleet."""
-        if fleet.id not in self.fleet_command_states:
+        if fleet.id not in self._fleets_with_orders:
             return
         
         command_state = self.fleet_command_states[fleet.id]
-        
-        # Process orders in priority order
-        for order_id in command_state.order_queue[:]:  # Copy list to avoid modification during iteration
-            if order_id not in command_state.current_orders:
+        current_orders = command_state.current_orders
+        
+        # Process orders in priority order, rebuilding the queue in the same
+        # pass so cancelled and finished orders are dropped without shifting
+        # the list once per removal
+        remaining = []
+        for order_id in command_state.order_queue:
+            order = current_orders.get(order_id)
+            if order is None:
                 continue
             
-            order = command_state.current_orders[order_id]
-            
             # Skip if order is not ready to execute
             if not self._check_order_preconditions(order, fleet, empire):
+                remaining.append(order_id)
                 continue
             
             # Process the order
-            self._process_order(order, fleet, empire, delta_seconds)
+            self._process_order(order, fleet, command_state, empire, delta_seconds)
             
             # Remove completed orders
-            if order.status in [OrderStatus.COMPLETED, OrderStatus.FAILED, OrderStatus.CANCELLED]:
-                command_state.order_queue.remove(order_id)
-                del command_state.current_orders[order_id]
+            if order.status not in _TERMINAL_STATUSES:
+                remaining.append(order_id)
+            else:
+                del current_orders[order_id]
                 command_state.completed_orders.append(order_id)
                 
                 if order.status == OrderStatus.COMPLETED:
-                    command_state.total_missions += 1
-                    if order.status == OrderStatus.COMPLETED:
-                        command_state.mission_success_rate = (
-                            (command_state.mission_success_rate * (command_state.total_missions - 1) + 1.0)
-                            / command_state.total_missions
-                        )
+                    missions = command_state.total_missions + 1
+                    command_state.total_missions = missions
+                    command_state.mission_success_rate = (
+                        (command_state.mission_success_rate * (missions - 1) + 1.0) / missions
+                    )
+        
+        command_state.order_queue = remaining
+        if not current_orders:
+            self._fleets_with_orders.discard(fleet.id)
     
     def set_fleet_formation(self, fleet_id: str, formation_template_id: str) -> Tuple[bool, str]:
         """Set a formation for a fleet."""
         if fleet_id not in self.fleet_command_states:
             return False, "Fleet command not initialized"
         
-        if formation_template_id not in self.formation_templates:
-            return False, f"Formation template {formation_template_id} not found"
-        
-        template = self.formation_templates[formation_template_id]
         command_state = self.fleet_command_states[fleet_id]
+        template = self._fleet_templates(command_state).get(formation_template_id)
+        if template is None:
+            return False, f"Formation template {formation_template_id} not found"
         
         # Create or update formation state
         formation_state = FleetFormationState(
@@ -179,13 +291,114 @@ class FleetCommandManager:
         return self.issue_order(
             fleet_id=fleet_id,
             order_type=OrderType.FORM_UP,
-            parameters={"formation_template_id": formation_template_id},
-            priority=OrderPriority.HIGH
+            priority=OrderPriority.HIGH,
+            formation_template_id=formation_template_id
         )
     
+    def update_fleet_system(self, fleet: Fleet) -> None:
+        """
+        Re-index a fleet under the system it is currently in.
+
+        Call after moving a fleet between systems outside of its orders,
+        e.g. when a jump completes.
+        """
+        system_id = fleet.system_id
+        previous = self._fleet_systems.get(fleet.id)
+        if previous == system_id:
+            return
+        
+        if previous is not None:
+            fleets_in_previous = self._fleets_by_system[previous]
+            fleets_in_previous.discard(fleet.id)
+            if not fleets_in_previous:
+                del self._fleets_by_system[previous]
+        self._fleets_by_system[system_id].add(fleet.id)
+        self._fleet_systems[fleet.id] = system_id
+    
+    def get_fleets_in_system(self, system_id: str) -> frozenset:
+        """Get the IDs of commanded fleets in a system."""
+        for fleet in self._fleets.values():
+            self.update_fleet_system(fleet)
+        return frozenset(self._fleets_by_system.get(system_id, ()))
+    
+    def get_fleet_formation_templates(self, fleet_id: str) -> Mapping[str, FormationTemplate]:
+        """
+        Get a read-only view of the formation templates a fleet uses.
+
+        Fleets share the manager's templates until one of them is
+        customized with customize_template.
+        """
+        command_state = self.fleet_command_states.get(fleet_id)
+        if command_state is None:
+            return MappingProxyType({})
+        return MappingProxyType(self._fleet_templates(command_state))
+    
+    def customize_template(self, fleet_id: str, template_id: str,
+                           **changes: Any) -> Optional[FormationTemplate]:
+        """
+        Change a formation template for a single fleet.
+
+        The first customization gives the fleet its own copy of the
+        template table; the shared templates are never modified.
+
+        Args:
+            fleet_id: Fleet whose template to change
+            template_id: ID of the template to change
+            **changes: FormationTemplate fields to update
+
+        Returns:
+            The fleet's customized template, or None if the fleet or
+            template is unknown
+        """
+        command_state = self.fleet_command_states.get(fleet_id)
+        if command_state is None:
+            return None
+        
+        templates = command_state.formation_templates
+        if not templates:
+            templates = dict(self.formation_templates)
+        
+        base = templates.get(template_id)
+        if base is None:
+            return None
+        
+        template = base.model_copy(update=changes)
+        templates[template_id] = template
+        command_state.formation_templates = templates
+        return template
+    
+    def _fleet_templates(self, command_state: FleetCommandState) -> Dict[str, FormationTemplate]:
+        """Formation templates for a fleet: its own copy, or the shared table."""
+        return command_state.formation_templates or self.formation_templates
+    
     def start_combat_engagement(self, attacking_fleet_ids: List[str], defending_fleet_ids: List[str],
                               system_id: str) -> str:
-        """Start a combat engagement between fleets."""
+        """
+        Start a combat engagement between fleets.
+
+        Commanded fleets in another system are left out of the engagement.
+        Each fleet's current system_id is checked, so fleets that jumped
+        since the index was last updated are judged by where they are now.
+        """
+        fleets = self._fleets
+        
+        def in_system(fleet_id: str) -> bool:
+            fleet = fleets.get(fleet_id)
+            if fleet is None:
+                return True
+            self.update_fleet_system(fleet)
+            return fleet.system_id == system_id
+        
+        def present(fleet_ids: List[str]) -> List[str]:
+            kept = [fid for fid in fleet_ids if in_system(fid)]
+            if len(kept) != len(fleet_ids):
+                logger.warning("Fleets %s are not in system %s and cannot engage",
+                               sorted(set(fleet_ids) - set(kept)), system_id)
+            return kept
+        
+        attacking_fleet_ids = present(attacking_fleet_ids)
+        defending_fleet_ids = present(defending_fleet_ids)
+        
         engagement = CombatEngagement(
             attacking_fleets=attacking_fleet_ids,
             defending_fleets=defending_fleet_ids,
@@ -205,12 +418,13 @@ class FleetCommandManager:
     
     def process_combat_engagements(self, fleets: Dict[str, Fleet], delta_seconds: float) -> None:
         """Process all active combat engagements."""
-        for engagement_id, engagement in list(self.combat_engagements.items()):
+        finished = []
+        for engagement_id, engagement in self.combat_engagements.items():
             result = self.combat_resolver.process_engagement(engagement, fleets, delta_seconds)
             
             if result.get("completed", False):
-                # Remove completed engagements
-                del self.combat_engagements[engagement_id]
+                # Remove completed engagements once the loop is done
+                finished.append(engagement_id)
                 
                 # Update fleet states
                 all_fleet_ids = engagement.attacking_fleets + engagement.defending_fleets
@@ -221,20 +435,31 @@ class FleetCommandManager:
                         # Update combat experience
                         command_state = self.fleet_command_states[fleet_id]
                         command_state.combat_experience += result.get("experience_gained", 1.0)
+        
+        for engagement_id in finished:
+            del self.combat_engagements[engagement_id]
     
     def process_formation_updates(self, fleets: Dict[str, Fleet], delta_seconds: float) -> None:
         """Update fleet formations."""
+        updates = []
+        command_states = self.fleet_command_states
         for fleet_id, formation_state in self.formation_states.items():
             if fleet_id not in fleets:
                 continue
-                
-            fleet = fleets[fleet_id]
-            template = self.formation_templates.get(formation_state.formation_template_id)
+            
+            command_state = command_states.get(fleet_id)
+            templates = (
+                self._fleet_templates(command_state) if command_state is not None
+                else self.formation_templates
+            )
+            template = templates.get(formation_state.formation_template_id)
             
             if not template:
                 continue
             
-            self.formation_manager.update_formation(fleet, formation_state, template, delta_seconds)
+            updates.append((fleets[fleet_id], formation_state, template))
+        
+        self.formation_manager.update_formations(updates, delta_seconds)
     
     def get_fleet_tactical_status(self, fleet_id: str) -> Dict[str, Any]:
         """Get comprehensive tactical status for a fleet."""
@@ -248,7 +473,7 @@ class FleetCommandManager:
             "fleet_id": fleet_id,
             "command_effectiveness": command_state.command_effectiveness,
             "current_orders": len(command_state.current_orders),
-            "pending_orders": len(command_state.order_queue),
+            "pending_orders": len(command_state.current_orders),
             "formation": {
                 "active": formation_state is not None and formation_state.is_formed,
                 "template": formation_state.formation_template_id if formation_state else None,
@@ -308,29 +533,96 @@ class FleetCommandManager:
             return False, "Attack order requires target fleet"
         
         if order.order_type == OrderType.FORM_UP:
-            formation_id = order.parameters.get("formation_template_id")
+            formation_id = order.formation_template_id
             if not formation_id or formation_id not in self.formation_templates:
                 return False, "Formation order requires valid formation template"
         
         return True, "Order is valid"
     
-    def _sort_order_queue(self, fleet_id: str) -> None:
-        """Sort the order queue by priority."""
-        command_state = self.fleet_command_states[fleet_id]
-        priority_order = {
-            OrderPriority.EMERGENCY: 0,
-            OrderPriority.HIGH: 1,
-            OrderPriority.NORMAL: 2,
-            OrderPriority.LOW: 3,
-            OrderPriority.BACKGROUND: 4,
-        }
-        
-        command_state.order_queue.sort(
-            key=lambda order_id: priority_order.get(
-                command_state.current_orders[order_id].priority, 5
-            )
+    def _enqueue_order(self, command_state: FleetCommandState, order: FleetOrder) -> None:
+        """
+        Insert an order into the fleet's queue, keeping it in priority order.
+
+        The queue is always sorted, so a binary search finds the slot after
+        every order of equal or higher priority; orders of the same
+        priority run in the order they were issued.
+        """
+        # Cancelled orders may still sit in the queue, so ranks are looked
+        # up in fleet_orders, which keeps every order issued
+        fleet_orders = self.fleet_orders
+        
+        bisect.insort_right(
+            command_state.order_queue,
+            order.id,
+            key=lambda order_id: _PRIORITY_RANK[fleet_orders[order_id].priority],
         )
     
+    def _plan_moves(self, fleets, delta_seconds: float) -> None:
+        """
+        Compute this tick's move-to results for many fleets at once.
+
+        Only each fleet's first queued move-to order is planned; it is the
+        one processed from the fleet's position at the start of the tick.
+        Results are stored in self._planned_moves for the move-to processor.
+        """
+        moves = []
+        for fleet in fleets:
+            command_state = self.fleet_command_states.get(fleet.id)
+            if command_state is None:
+                continue
+            for order_id in command_state.order_queue:
+                order = command_state.current_orders.get(order_id)
+                if order is not None and order.order_type == OrderType.MOVE_TO:
+                    if order.target_position:
+                        moves.append((order, fleet))
+                    break
+        if len(moves) < _MOVE_BATCH_MIN:
+            return
+
+        # Gather positions, targets and speeds in one pass into a single
+        # (N, 7) block; the kernel works on column views of it
+        count = len(moves)
+        state = np.fromiter(
+            self._iter_move_state(moves), dtype=np.float64, count=count * 7
+        ).reshape(count, 7)
+        current = state[:, 0:3]
+        target = state[:, 3:6]
+        step = state[:, 6]
+        step *= delta_seconds
+
+        if NUMBA_AVAILABLE:
+            new_position = np.empty((count, 3), dtype=np.float64)
+            fraction = np.empty(count, dtype=np.float64)
+            reached = np.empty(count, dtype=np.bool_)
+            _move_kernel(current, target, step, new_position, fraction, reached)
+        else:
+            new_position, fraction, reached = _move_arrays(current, target, step)
+
+        for (order, _), (x, y, z), done, progress in zip(
+            moves, new_position.tolist(), reached.tolist(), fraction.tolist()
+        ):
+            self._planned_moves[order.id] = (x, y, z, done, progress)
+
+    @classmethod
+    def _iter_move_state(cls, moves):
+        """Yield x, y, z, target x, y, z and speed for each planned move."""
+        fleet_speed = cls._fleet_speed
+        for order, fleet in moves:
+            position = fleet.position
+            target = order.target_position
+            yield position.x
+            yield position.y
+            yield position.z
+            yield target.x
+            yield target.y
+            yield target.z
+            yield fleet_speed(fleet)
+
+    @staticmethod
+    def _fleet_speed(fleet: Fleet) -> float:
+        """Fleet speed in m/s, falling back to a default when unknown."""
+        return fleet.max_speed if fleet.max_speed > 0 else _DEFAULT_FLEET_SPEED
+    
     def _check_order_preconditions(self, order: FleetOrder, fleet: Fleet, empire: Empire) -> bool:
         """Check if an order's preconditions are met."""
         if not order.preconditions:
@@ -340,46 +632,53 @@ class FleetCommandManager:
         # For now, return True
         return True
     
-    def _process_order(self, order: FleetOrder, fleet: Fleet, empire: Empire, delta_seconds: float) -> None:
+    def _process_order(self, order: FleetOrder, fleet: Fleet, command_state: FleetCommandState,
+                       empire: Empire, delta_seconds: float) -> None:
         """Process a single order."""
         if order.status == OrderStatus.PENDING:
             order.status = OrderStatus.ACTIVE
             order.start_time = 0.0  # Would use current game time
         
         # Get the appropriate processor
-        processor = self.order_processors.get(order.order_type)
-        if processor:
+        dispatch = self._processor_dispatch.get(order.order_type._value_)
+        if dispatch:
+            processor, active_status, complete_status = dispatch
             try:
-                processor(order, fleet, empire, delta_seconds)
+                processor(order, fleet, command_state, empire, delta_seconds)
             except Exception as e:
                 logger.error("Error processing order %s: %s", order.order_type.value, e)
                 order.status = OrderStatus.FAILED
                 order.failure_reason = str(e)
+            
+            # Processors only advance the order; the fleet status follows
+            # from the order's outcome. Failed orders leave it unchanged.
+            if order.status == OrderStatus.COMPLETED:
+                fleet.status = complete_status
+            elif order.status != OrderStatus.FAILED and order.status != OrderStatus.CANCELLED:
+                if active_status is not None:
+                    fleet.status = active_status
         else:
             logger.warning("No processor found for order type %s", order.order_type.value)
             order.status = OrderStatus.FAILED
             order.failure_reason = "No processor available"
     
-    def _calculate_fleet_combat_capabilities(self, fleet: Fleet, command_state: FleetCommandState) -> None:
-        """Calculate combat capabilities for a fleet."""
-        # Simplified combat capability calculation
+    def _calculate_fleet_derived_stats(self, fleet: Fleet, command_state: FleetCommandState) -> None:
+        """Calculate combat capabilities and logistics requirements for a fleet."""
+        # Simplified calculations from ship count
         # In a full implementation, this would examine individual ships and their loadouts
         ship_count = len(fleet.ships)
         
-        command_state.combat_capabilities.total_firepower = ship_count * 10.0
-        command_state.combat_capabilities.total_defense = ship_count * 8.0
-        command_state.combat_capabilities.combat_rating = ship_count * 9.0
-        command_state.combat_capabilities.max_engagement_range = 15000.0
-    
-    def _calculate_fleet_logistics_requirements(self, fleet: Fleet, command_state: FleetCommandState) -> None:
-        """Calculate logistics requirements for a fleet."""
-        ship_count = len(fleet.ships)
+        combat = command_state.combat_capabilities
+        combat.total_firepower = ship_count * 10.0
+        combat.total_defense = ship_count * 8.0
+        combat.combat_rating = ship_count * 9.0
+        combat.max_engagement_range = 15000.0
         
-        # Simplified logistics calculation
-        command_state.logistics_requirements.fuel_capacity = ship_count * 1000.0
-        command_state.logistics_requirements.current_fuel = ship_count * 1000.0
-        command_state.logistics_requirements.fuel_consumption_rate = ship_count * 2.0
-        command_state.logistics_requirements.crew_requirements = ship_count * 50
+        logistics = command_state.logistics_requirements
+        logistics.fuel_capacity = ship_count * 1000.0
+        logistics.current_fuel = ship_count * 1000.0
+        logistics.fuel_consumption_rate = ship_count * 2.0
+        logistics.crew_requirements = ship_count * 50
     
     def _calculate_maintenance_status(self, command_state: FleetCommandState) -> float:
         """Calculate maintenance status (0.0 = no maintenance needed, 1.0 = urgent maintenance)."""
@@ -390,65 +689,77 @@ class FleetCommandManager:
     
     # Order processors
     
-    def _process_move_to_order(self, order: FleetOrder, fleet: Fleet, empire: Empire, delta_seconds: float):
+    def _process_move_to_order(self, order: FleetOrder, fleet: Fleet,
+                               command_state: FleetCommandState, empire: Empire, delta_seconds: float):
         """Process a move-to order."""
         if not order.target_position:
             order.status = OrderStatus.FAILED
             order.failure_reason = "No target position specified"
             return
         
-        # Calculate distance to target
         current_pos = fleet.position
         target_pos = order.target_position
+
+        # Use the result computed for this tick's batch when there is one
+        planned = self._planned_moves.pop(order.id, None)
+        if planned is not None:
+            x, y, z, reached, progress = planned
+            if reached:
+                fleet.position = target_pos
+                self.update_fleet_system(fleet)
+                order.status = OrderStatus.COMPLETED
+                order.completion_time = 0.0  # Would use current game time
+                order.progress = 1.0
+            else:
+                current_pos.x = x
+                current_pos.y = y
+                current_pos.z = z
+                order.progress = progress
+            return
         
-        distance = math.sqrt(
-            (target_pos.x - current_pos.x) ** 2 +
-            (target_pos.y - current_pos.y) ** 2 +
-            (target_pos.z - current_pos.z) ** 2
-        )
+        # Calculate distance to target
+        dx = target_pos.x - current_pos.x
+        dy = target_pos.y - current_pos.y
+        dz = target_pos.z - current_pos.z
+        distance = (dx * dx + dy * dy + dz * dz) ** 0.5
         
         # Simple movement calculation
-        speed = fleet.max_speed if fleet.max_speed > 0 else 1000.0  # m/s
-        movement_distance = speed * delta_seconds
+        movement_distance = self._fleet_speed(fleet) * delta_seconds
         
         if distance <= movement_distance:
             # Reached destination
             fleet.position = target_pos
-            fleet.status = FleetStatus.IDLE
+            self.update_fleet_system(fleet)
             order.status = OrderStatus.COMPLETED
             order.completion_time = 0.0  # Would use current game time
             order.progress = 1.0
         else:
-            # Move toward target
-            direction_x = (target_pos.x - current_pos.x) / distance
-            direction_y = (target_pos.y - current_pos.y) / distance
-            direction_z = (target_pos.z - current_pos.z) / distance
-            
-            fleet.position.x += direction_x * movement_distance
-            fleet.position.y += direction_y * movement_distance
-            fleet.position.z += direction_z * movement_distance
+            # Move toward target; distance > movement_distance >= 0 here,
+            # so one division gives both the step scale and the progress
+            scale = movement_distance / distance
+            current_pos.x += dx * scale
+            current_pos.y += dy * scale
+            current_pos.z += dz * scale
             
-            fleet.status = FleetStatus.MOVING
-            order.progress = 1.0 - (distance - movement_distance) / distance
+            order.progress = scale
     
-    def _process_attack_order(self, order: FleetOrder, fleet: Fleet, empire: Empire, delta_seconds: float):
+    def _process_attack_order(self, order: FleetOrder, fleet: Fleet,
+                              command_state: FleetCommandState, empire: Empire, delta_seconds: float):
         """Process an attack order."""
         # Simplified attack order processing
-        fleet.status = FleetStatus.IN_COMBAT
         order.progress = min(1.0, order.progress + delta_seconds / 100.0)  # 100 second combat
         
         if order.progress >= 1.0:
             order.status = OrderStatus.COMPLETED
-            fleet.status = FleetStatus.IDLE
     
-    def _process_defend_order(self, order: FleetOrder, fleet: Fleet, empire: Empire, delta_seconds: float):
+    def _process_defend_order(self, order: FleetOrder, fleet: Fleet,
+                              command_state: FleetCommandState, empire: Empire, delta_seconds: float):
         """Process a defend order."""
-        fleet.status = FleetStatus.IDLE  # Defensive posture
         order.status = OrderStatus.COMPLETED  # Instant defensive posture
     
-    def _process_patrol_order(self, order: FleetOrder, fleet: Fleet, empire: Empire, delta_seconds: float):
+    def _process_patrol_order(self, order: FleetOrder, fleet: Fleet,
+                              command_state: FleetCommandState, empire: Empire, delta_seconds: float):
         """Process a patrol order."""
-        fleet.status = FleetStatus.PATROLLING
         # Patrol orders are typically continuous
         order.progress = min(1.0, order.progress + delta_seconds / 3600.0)  # 1 hour patrol
         
@@ -458,85 +769,135 @@ class FleetCommandManager:
             
             if order.max_repeats and order.repeat_count >= order.max_repeats:
                 order.status = OrderStatus.COMPLETED
-                fleet.status = FleetStatus.IDLE
     
-    def _process_escort_order(self, order: FleetOrder, fleet: Fleet, empire: Empire, delta_seconds: float):
+    def _process_escort_order(self, order: FleetOrder, fleet: Fleet,
+                              command_state: FleetCommandState, empire: Empire, delta_seconds: float):
         """Process an escort order."""
-        fleet.status = FleetStatus.ESCORTING
         order.status = OrderStatus.COMPLETED  # Instant escort assignment
     
-    def _process_form_up_order(self, order: FleetOrder, fleet: Fleet, empire: Empire, delta_seconds: float):
+    def _process_form_up_order(self, order: FleetOrder, fleet: Fleet,
+                               command_state: FleetCommandState, empire: Empire, delta_seconds: float):
         """Process a formation order."""
-        formation_id = order.parameters.get("formation_template_id")
-        if not formation_id:
+        if not order.formation_template_id:
             order.status = OrderStatus.FAILED
             return
         
-        fleet.status = FleetStatus.FORMING_UP
         order.progress = min(1.0, order.progress + delta_seconds / 30.0)  # 30 second formation
         
         if order.progress >= 1.0:
-            fleet.status = FleetStatus.IN_FORMATION
             order.status = OrderStatus.COMPLETED
             
             # Update formation state
             if fleet.id in self.formation_states:
                 self.formation_states[fleet.id].is_formed = True
     
-    def _process_change_formation_order(self, order: FleetOrder, fleet: Fleet, empire: Empire, delta_seconds: float):
+    def _process_change_formation_order(self, order: FleetOrder, fleet: Fleet,
+                                        command_state: FleetCommandState, empire: Empire, delta_seconds: float):
         """Process a change formation order."""
-        self._process_form_up_order(order, fleet, empire, delta_seconds)
+        self._process_form_up_order(order, fleet, command_state, empire, delta_seconds)
     
-    def _process_survey_order(self, order: FleetOrder, fleet: Fleet, empire: Empire, delta_seconds: float):
+    def _process_survey_order(self, order: FleetOrder, fleet: Fleet,
+                              command_state: FleetCommandState, empire: Empire, delta_seconds: float):
         """Process a survey order."""
-        fleet.status = FleetStatus.SURVEYING
         order.progress = min(1.0, order.progress + delta_seconds / 300.0)  # 5 minute survey
         
         if order.progress >= 1.0:
             order.status = OrderStatus.COMPLETED
-            fleet.status = FleetStatus.IDLE
     
-    def _process_refuel_order(self, order: FleetOrder, fleet: Fleet, empire: Empire, delta_seconds: float):
+    def _process_refuel_order(self, order: FleetOrder, fleet: Fleet,
+                              command_state: FleetCommandState, empire: Empire, delta_seconds: float):
         """Process a refuel order."""
-        fleet.status = FleetStatus.REFUELING
-        
         # Simple refueling logic
-        command_state = self.fleet_command_states.get(fleet.id)
-        if command_state:
-            logistics = command_state.logistics_requirements
-            refuel_rate = logistics.fuel_capacity * 0.1  # 10% per update
-            fuel_needed = logistics.fuel_capacity - logistics.current_fuel
-            
-            if fuel_needed <= 0:
-                order.status = OrderStatus.COMPLETED
-                fleet.status = FleetStatus.IDLE
-            else:
-                refuel_amount = min(refuel_rate * delta_seconds, fuel_needed)
-                logistics.current_fuel += refuel_amount
-                order.progress = logistics.current_fuel / logistics.fuel_capacity
+        logistics = command_state.logistics_requirements
+        refuel_rate = logistics.fuel_capacity * 0.1  # 10% per update
+        fuel_needed = logistics.fuel_capacity - logistics.current_fuel
+        
+        if fuel_needed <= 0:
+            order.status = OrderStatus.COMPLETED
+        else:
+            refuel_amount = min(refuel_rate * delta_seconds, fuel_needed)
+            logistics.current_fuel += refuel_amount
+            order.progress = logistics.current_fuel / logistics.fuel_capacity
     
-    def _process_repair_order(self, order: FleetOrder, fleet: Fleet, empire: Empire, delta_seconds: float):
+    def _process_repair_order(self, order: FleetOrder, fleet: Fleet,
+                              command_state: FleetCommandState, empire: Empire, delta_seconds: float):
         """Process a repair order."""
-        fleet.status = FleetStatus.REPAIRING
         order.progress = min(1.0, order.progress + delta_seconds / 600.0)  # 10 minute repair
         
         if order.progress >= 1.0:
             order.status = OrderStatus.COMPLETED
-            fleet.status = FleetStatus.IDLE
     
-    def _process_resupply_order(self, order: FleetOrder, fleet: Fleet, empire: Empire, delta_seconds: float):
+    def _process_resupply_order(self, order: FleetOrder, fleet: Fleet,
+                                command_state: FleetCommandState, empire: Empire, delta_seconds: float):
         """Process a resupply order."""
-        fleet.status = FleetStatus.RESUPPLYING
         order.progress = min(1.0, order.progress + delta_seconds / 180.0)  # 3 minute resupply
         
         if order.progress >= 1.0:
             order.status = OrderStatus.COMPLETED
-            fleet.status = FleetStatus.IDLE
+
+
+def _move_arrays(current: np.ndarray, target: np.ndarray,
+                 step: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Advance positions toward their targets with NumPy array operations.
+
+    Args:
+        current: (N, 3) current positions
+        target: (N, 3) target positions
+        step: (N,) distance each fleet can travel this tick
+
+    Returns:
+        New positions, the fraction of the remaining distance covered
+        (1.0 on arrival) and a mask of fleets that reached their targets
+    """
+    offset = target - current
+    distance = np.sqrt(np.einsum("ij,ij->i", offset, offset))
+    reached = distance <= step
+    # Arrived fleets may have zero distance; their fraction is set to 1
+    fraction = np.ones_like(distance)
+    moving = ~reached
+    np.reciprocal(distance, out=fraction, where=moving)
+    np.multiply(fraction, step, out=fraction, where=moving)
+    return current + offset * fraction[:, None], fraction, reached
+
+
+def _move_kernel(current, target, step, out_position, out_fraction, out_reached):
+    """
+    Advance positions toward their targets in a single fused loop.
+
+    Computes the same results as _move_arrays into the output arrays. It is
+    compiled with Numba when available and only used in that case; the
+    plain Python version is kept for testing.
+    """
+    for i in prange(current.shape[0]):
+        dx = target[i, 0] - current[i, 0]
+        dy = target[i, 1] - current[i, 1]
+        dz = target[i, 2] - current[i, 2]
+        distance = (dx * dx + dy * dy + dz * dz) ** 0.5
+        if distance <= step[i]:
+            out_position[i, 0] = current[i, 0] + dx
+            out_position[i, 1] = current[i, 1] + dy
+            out_position[i, 2] = current[i, 2] + dz
+            out_fraction[i] = 1.0
+            out_reached[i] = True
+        else:
+            scale = step[i] / distance
+            out_position[i, 0] = current[i, 0] + dx * scale
+            out_position[i, 1] = current[i, 1] + dy * scale
+            out_position[i, 2] = current[i, 2] + dz * scale
+            out_fraction[i] = scale
+            out_reached[i] = False
+
+
+if NUMBA_AVAILABLE:
+    _move_kernel = njit(parallel=True, cache=True)(_move_kernel)
 
 
 class CombatResolver:
     """Handles combat engagement resolution."""
     
+    __slots__ = ()
+    
     def process_engagement(self, engagement: CombatEngagement, fleets: Dict[str, Fleet], 
                           delta_seconds: float) -> Dict[str, Any]:
         """Process a combat engagement."""
@@ -558,21 +919,65 @@ class CombatResolver:
 class FormationManager:
     """Manages fleet formations and ship positioning."""
     
+    __slots__ = ("formation_templates",)
+    
     def __init__(self, formation_templates: Dict[str, FormationTemplate]):
         self.formation_templates = formation_templates
     
     def update_formation(self, fleet: Fleet, formation_state: FleetFormationState, 
                         template: FormationTemplate, delta_seconds: float) -> None:
         """Update fleet formation positioning."""
-        if not formation_state.is_formed:
+        self.update_formations([(fleet, formation_state, template)], delta_seconds)
+    
+    def update_formations(self, updates: List[Tuple[Fleet, FleetFormationState, FormationTemplate]],
+                          delta_seconds: float) -> None:
+        """
+        Update many fleet formations in one tick.
+
+        Integrity and cohesion recover linearly up to 1.0. Formations that
+        are already fully recovered skip that step; with enough recovering
+        fleets it is computed for all of them in two NumPy operations.
+
+        Args:
+            updates: (fleet, formation state, template) for each fleet to update
+            delta_seconds: Time elapsed this tick
+        """
+        integrity_step = delta_seconds / 10.0
+        cohesion_step = delta_seconds / 15.0
+        
+        recovering = []
+        for fleet, formation_state, _ in updates:
+            if not formation_state.is_formed:
+                continue
+            
+            if formation_state.formation_integrity != 1.0 or formation_state.formation_cohesion != 1.0:
+                recovering.append(formation_state)
+            
+            # Update formation center to fleet position
+            formation_state.formation_center = fleet.position.copy()
+            formation_state.last_formation_update = 0.0  # Would use current game time
+        
+        if len(recovering) < _FORMATION_BATCH_MIN:
+            for formation_state in recovering:
+                formation_state.formation_integrity = min(1.0,
+                    formation_state.formation_integrity + integrity_step)
+                formation_state.formation_cohesion = min(1.0,
+                    formation_state.formation_cohesion + cohesion_step)
             return
         
-        # Simple formation maintenance
-        formation_state.formation_integrity = min(1.0, 
-            formation_state.formation_integrity + delta_seconds / 10.0)
-        formation_state.formation_cohesion = min(1.0,
-            formation_state.formation_cohesion + delta_seconds / 15.0)
-        
-        # Update formation center to fleet position
-        formation_state.formation_center = fleet.position.copy()
-        formation_state.last_formation_update = 0.0  # Would use current game time
+        integrity = np.fromiter(
+            (state.formation_integrity for state in recovering), dtype=np.float64, count=len(recovering)
+        )
+        cohesion = np.fromiter(
+            (state.formation_cohesion for state in recovering), dtype=np.float64, count=len(recovering)
+        )
+        integrity += integrity_step
+        np.minimum(integrity, 1.0, out=integrity)
+        cohesion += cohesion_step
+        np.minimum(cohesion, 1.0, out=cohesion)
+        
+        for formation_state, new_integrity, new_cohesion in zip(
+            recovering, integrity.tolist(), cohesion.tolist()
+        ):
+            formation_state.formation_integrity = new_integrity
+            formation_state.formation_cohesion = new_cohesion
@@ -5,7 +5,10 @@ Manages building construction, resource production, and infrastructure effects
 for all colonies in the game.
 """
 
+import bisect
+from collections import defaultdict
 import logging
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple, Any
 import uuid
 
@@ -21,6 +24,9 @@ from pyaurora4x.core.infrastructure import (
 
 logger = logging.getLogger(__name__)
 
+# Technology types by their value, for empires that key techs by type name
+_TECH_TYPES_BY_VALUE = MappingProxyType({tech_type.value: tech_type for tech_type in TechnologyType})
+
 
 class ColonyInfrastructureManager:
     """Manages colony infrastructure, buildings, and construction."""
@@ -30,6 +36,14 @@ class ColonyInfrastructureManager:
         self.colony_states: Dict[str, ColonyInfrastructureState] = {}  # colony_id -> state
         self.buildings: Dict[str, Building] = {}  # building_id -> building
         self.construction_projects: Dict[str, ConstructionProject] = {}  # project_id -> project
+        
+        # Priority of every ID still in a construction queue, including
+        # cancelled projects left there until the queue reaches them
+        self._queued_priorities: Dict[str, int] = {}
+        
+        # Last available-building list per empire, with the researched
+        # technology types it was computed for
+        self._available_cache: Dict[str, Tuple[frozenset, Tuple[BuildingTemplate, ...]]] = {}
     
     def initialize_colony_infrastructure(self, colony: Colony) -> ColonyInfrastructureState:
         """Initialize infrastructure state for a new colony."""
@@ -60,53 +74,94 @@ class ColonyInfrastructureManager:
         return self.colony_states.get(colony_id)
     
     def get_available_buildings(self, empire: Empire) -> List[BuildingTemplate]:
-        """Get buildings available for construction by an empire."""
-        available = []
+        """
+        Get buildings available for construction by an empire.
+
+        The result is cached per empire until its set of researched
+        technology types changes.
+        """
+        researched = self._researched_tech_types(empire)
+        cached = self._available_cache.get(empire.id)
+        if cached is not None and cached[0] == researched:
+            return list(cached[1])
+        
+        available = tuple(
+            template for template in self.building_templates.values()
+            if researched.issuperset(template.tech_requirements)
+        )
+        self._available_cache[empire.id] = (researched, available)
+        return list(available)
+    
+    def can_build(self, colony: Colony, empire: Empire, template_id: str) -> Tuple[bool, str]:
+        """Check if a building can be constructed in a colony."""
+        if self.can_build_fast(colony, empire, template_id):
+            return True, "Can build"
+        return False, self._build_failure_reason(colony, empire, template_id)
+    
+    def can_build_fast(self, colony: Colony, empire: Empire, template_id: str) -> bool:
+        """
+        Check if a building can be constructed without explaining why not.
+
+        Runs the same checks as can_build, cheapest first, and skips
+        formatting a reason; use it when only the answer is needed.
 
-        for template in self.building_templates.values():
-            # Check technology requirements
-            can_build = True
-            for tech_req in template.tech_requirements:
-                if not self._has_required_technology(empire, tech_req):
-                    can_build = False
-                    break
+        Args:
+            colony: Colony to build in
+            empire: Empire owning the colony
+            template_id: Building template to check
 
-            if can_build:
-                available.append(template)
+        Returns:
+            True if construction could start now
+        """
+        template = self.building_templates.get(template_id)
+        if template is None:
+            return False
+        
+        for tech_req in template.tech_requirements:
+            if not self._has_required_technology(empire, tech_req):
+                return False
         
-        return available
+        if (template.population_requirement > 0
+                and self._available_population(colony) < template.population_requirement):
+            return False
+        
+        stockpiles = colony.stockpiles
+        for resource, cost in template.construction_cost.items():
+            if stockpiles.get(resource, 0) < cost:
+                return False
+        
+        return True
     
-    def can_build(self, colony: Colony, empire: Empire, template_id: str) -> Tuple[bool, str]:
-        """Check if a building can be constructed in a colony."""
+    def _build_failure_reason(self, colony: Colony, empire: Empire, template_id: str) -> str:
+        """Describe the first check can_build_fast fails, in the same order."""
         template = self.building_templates.get(template_id)
         if not template:
-            return False, f"Unknown building template: {template_id}"
+            return f"Unknown building template: {template_id}"
         
         # Check technology requirements
         for tech_req in template.tech_requirements:
             if not self._has_required_technology(empire, tech_req):
-                return False, f"Missing technology: {tech_req.value}"
-        
-        # Check resource requirements
-        for resource, cost in template.construction_cost.items():
-            if colony.stockpiles.get(resource, 0) < cost:
-                return False, f"Insufficient {resource}: need {cost}, have {colony.stockpiles.get(resource, 0)}"
+                return f"Missing technology: {tech_req.value}"
         
         # Check population requirements
         if template.population_requirement > 0:
-            available_pop = colony.population
-            # Subtract population already assigned to buildings
-            state = self.get_colony_state(colony.id)
-            if state:
-                for building_id, building in state.buildings.items():
-                    building_template = self.building_templates.get(self.buildings[building_id].template_id)
-                    if building_template:
-                        available_pop -= building_template.population_requirement
-            
+            available_pop = self._available_population(colony)
             if available_pop < template.population_requirement:
-                return False, f"Insufficient population: need {template.population_requirement}, have {available_pop} available"
+                return f"Insufficient population: need {template.population_requirement}, have {available_pop} available"
+        
+        # Check resource requirements
+        for resource, cost in template.construction_cost.items():
+            if colony.stockpiles.get(resource, 0) < cost:
+                return f"Insufficient {resource}: need {cost}, have {colony.stockpiles.get(resource, 0)}"
         
-        return True, "Can build"
+        return "Can build"
+    
+    def _available_population(self, colony: Colony) -> int:
+        """Population not already assigned to buildings."""
+        state = self.colony_states.get(colony.id)
+        if state is None:
+            return colony.population
+        return colony.population - state.assigned_population
     
     def start_construction(self, colony: Colony, empire: Empire, template_id: str, priority: int = 5) -> Tuple[bool, str]:
         """Start construction of a building."""
@@ -132,14 +187,8 @@ class ColonyInfrastructureManager:
             state = self.initialize_colony_infrastructure(colony)
         
         state.construction_projects[project.id] = project
-        state.construction_queue.append(project.id)
         self.construction_projects[project.id] = project
-        
-        # Sort queue by priority
-        state.construction_queue.sort(
-            key=lambda pid: state.construction_projects[pid].priority,
-            reverse=True
-        )
+        self._enqueue_project(state, project)
 
         # Record whether we had enough resources at queue time to start construction
         project.initial_resources_reserved = self._reserve_initial_resources(colony, template)
@@ -158,11 +207,12 @@ class ColonyInfrastructureManager:
         # Refund invested resources (partial refund based on progress)
         refund_rate = 0.5 if project.status == ConstructionStatus.IN_PROGRESS else 1.0
         
-        # Remove from queue and projects
-        if project_id in state.construction_queue:
-            state.construction_queue.remove(project_id)
+        # Remove from projects; the queue entry is skipped and dropped once
+        # it reaches the front of the queue
         del state.construction_projects[project_id]
         del self.construction_projects[project_id]
+        if not state.construction_projects:
+            self._clear_queue(state)
         
         logger.info("Cancelled construction project %s", project_id)
         return True
@@ -179,12 +229,12 @@ class ColonyInfrastructureManager:
             project_id = state.construction_queue[0]
             project = state.construction_projects.get(project_id)
             if not project:
-                state.construction_queue.pop(0)
+                self._pop_queue_front(state)
                 continue
 
             template = self.building_templates.get(project.building_template_id)
             if not template:
-                state.construction_queue.pop(0)
+                self._pop_queue_front(state)
                 continue
 
             self._ensure_project_started(colony, project, template)
@@ -196,22 +246,22 @@ class ColonyInfrastructureManager:
             time_slice = min(remaining_time, time_to_completion)
             progress_increment = time_slice / template.construction_time
 
-            resource_needed = {
-                resource: cost * progress_increment
-                for resource, cost in template.construction_cost.items()
-            }
-
+            # Check every resource before consuming any
+            stockpiles = colony.stockpiles
+            construction_cost = template.construction_cost
             can_continue = all(
-                colony.stockpiles.get(resource, 0) >= needed
-                for resource, needed in resource_needed.items()
+                stockpiles.get(resource, 0) >= cost * progress_increment
+                for resource, cost in construction_cost.items()
             )
 
             if not can_continue:
                 break
 
-            for resource, needed in resource_needed.items():
-                colony.stockpiles[resource] = colony.stockpiles.get(resource, 0) - needed
-                project.resources_invested[resource] = project.resources_invested.get(resource, 0) + needed
+            invested = project.resources_invested
+            for resource, cost in construction_cost.items():
+                needed = cost * progress_increment
+                stockpiles[resource] = stockpiles.get(resource, 0) - needed
+                invested[resource] = invested.get(resource, 0) + needed
 
             project.progress = min(1.0, project.progress + progress_increment)
             remaining_time -= time_slice
@@ -233,9 +283,13 @@ class ColonyInfrastructureManager:
         if state:
             state.buildings[building.id] = building
             
-            # Remove project from queue
-            if project.id in state.construction_queue:
-                state.construction_queue.remove(project.id)
+            # Remove project from queue; it is normally at the front
+            queue = state.construction_queue
+            if queue and queue[0] == project.id:
+                self._pop_queue_front(state)
+            elif project.id in queue:
+                queue.remove(project.id)
+                self._queued_priorities.pop(project.id, None)
             if project.id in state.construction_projects:
                 del state.construction_projects[project.id]
         
@@ -249,11 +303,40 @@ class ColonyInfrastructureManager:
         if project.id in self.construction_projects:
             del self.construction_projects[project.id]
         
-        # Update production
-        self._update_colony_production(colony, state)
+        # Add the new building's output to the colony totals
+        if state:
+            self._apply_building_delta(colony, state, template, building.efficiency, 1)
         
         logger.info("Completed construction of %s in colony %s", template.name, colony.name)
 
+    def _enqueue_project(self, state: ColonyInfrastructureState, project: ConstructionProject) -> None:
+        """
+        Insert a project into the colony's queue, keeping it in priority order.
+
+        The queue is always sorted, highest priority first, so a binary
+        search finds the slot after every project of equal or higher
+        priority; projects of the same priority are built in the order
+        they were started.
+        """
+        priorities = self._queued_priorities
+        priorities[project.id] = project.priority
+        bisect.insort_right(
+            state.construction_queue,
+            project.id,
+            key=lambda project_id: -priorities[project_id],
+        )
+
+    def _pop_queue_front(self, state: ColonyInfrastructureState) -> None:
+        """Remove the project at the front of a colony's queue."""
+        project_id = state.construction_queue.pop(0)
+        self._queued_priorities.pop(project_id, None)
+
+    def _clear_queue(self, state: ColonyInfrastructureState) -> None:
+        """Drop every entry, live or cancelled, from a colony's queue."""
+        for project_id in state.construction_queue:
+            self._queued_priorities.pop(project_id, None)
+        state.construction_queue.clear()
+
     def _ensure_project_started(
         self, colony: Colony, project: ConstructionProject, template: BuildingTemplate
     ) -> None:
@@ -285,6 +368,29 @@ class ColonyInfrastructureManager:
 
         return False
 
+    def _researched_tech_types(self, empire: Empire) -> frozenset:
+        """
+        Get the technology types an empire has researched.
+
+        Matches _has_required_technology: a technology counts through its
+        tech_type or through a key naming the type.
+        """
+        researched = set()
+        for key, tech in (empire.technologies or {}).items():
+            if not getattr(tech, "is_researched", False):
+                continue
+            
+            tech_type = getattr(tech, "tech_type", None)
+            if isinstance(tech_type, TechnologyType):
+                researched.add(tech_type)
+            
+            if isinstance(key, str):
+                named_type = _TECH_TYPES_BY_VALUE.get(key.lower())
+                if named_type is not None:
+                    researched.add(named_type)
+        
+        return frozenset(researched)
+
     def _reserve_initial_resources(self, colony: Colony, template: BuildingTemplate) -> bool:
         """Determine if a colony had the minimum resources to initiate construction."""
         if not template.construction_cost:
@@ -315,50 +421,131 @@ class ColonyInfrastructureManager:
         state.total_power_consumption = 0.0
         state.total_population_capacity = max(colony.max_population, colony.population, 1000)
         state.total_defense_value = 0.0
-        
-        # Process each building
-        for building_id, building in state.buildings.items():
-            template = self.building_templates.get(building.template_id)
+        state.assigned_population = 0
+        
+        # Group buildings by template: production scales with the summed
+        # efficiency of a template's buildings, fixed effects with their count
+        template_counts: Dict[str, int] = defaultdict(int)
+        template_efficiency: Dict[str, float] = defaultdict(float)
+        for building in state.buildings.values():
+            template_id = building.template_id
+            template_counts[template_id] += 1
+            template_efficiency[template_id] += building.efficiency
+        
+        # Accumulate locally, then merge into the stored dicts once per resource
+        production: Dict[str, float] = defaultdict(float)
+        consumption: Dict[str, float] = defaultdict(float)
+        
+        for template_id, count in template_counts.items():
+            template = self.building_templates.get(template_id)
             if not template:
                 continue
             
-            efficiency = building.efficiency * state.overall_efficiency
+            efficiency = template_efficiency[template_id] * state.overall_efficiency
             
             # Production
             for resource, amount in template.resource_production.items():
-                daily_amount = amount * efficiency
-                state.daily_production[resource] = state.daily_production.get(resource, 0) + daily_amount
-                colony.production[resource] = colony.production.get(resource, 0) + daily_amount
+                production[resource] += amount * efficiency
             
             # Consumption
             for resource, amount in template.resource_consumption.items():
-                daily_amount = amount * efficiency
-                state.daily_consumption[resource] = state.daily_consumption.get(resource, 0) + daily_amount
-                colony.consumption[resource] = colony.consumption.get(resource, 0) + daily_amount
+                consumption[resource] += amount * efficiency
             
             # Infrastructure effects
             if template.power_requirement > 0:
-                state.total_power_consumption += template.power_requirement
-                colony.power_consumption += template.power_requirement
-            
-            for resource, amount in template.resource_production.items():
-                if resource == "energy":
-                    state.total_power_generation += amount * efficiency
-                    colony.power_generation += amount * efficiency
+                power = template.power_requirement * count
+                state.total_power_consumption += power
+                colony.power_consumption += power
             
             # Population capacity
-            state.total_population_capacity += template.population_capacity
+            state.total_population_capacity += template.population_capacity * count
             colony.max_population = state.total_population_capacity
+            state.assigned_population += template.population_requirement * count
             
             # Defense value
-            state.total_defense_value += template.defense_value
-            colony.defense_rating += template.defense_value
+            defense = template.defense_value * count
+            state.total_defense_value += defense
+            colony.defense_rating += defense
+        
+        state.daily_production.update(production)
+        state.daily_consumption.update(consumption)
+        for resource, amount in production.items():
+            colony.production[resource] = colony.production.get(resource, 0) + amount
+        for resource, amount in consumption.items():
+            colony.consumption[resource] = colony.consumption.get(resource, 0) + amount
+        
+        energy = production.get("energy", 0.0)
+        state.total_power_generation += energy
+        colony.power_generation += energy
         
         # Calculate net production
-        for resource in set(list(state.daily_production.keys()) + list(state.daily_consumption.keys())):
-            production = state.daily_production.get(resource, 0)
-            consumption = state.daily_consumption.get(resource, 0)
-            state.net_production[resource] = production - consumption
+        net_production = state.net_production
+        for resource in production.keys() | consumption.keys():
+            net_production[resource] = production.get(resource, 0) - consumption.get(resource, 0)
+        
+        state.last_updated = 0.0  # Would use current game time
+    
+    def _apply_building_delta(self, colony: Colony, state: ColonyInfrastructureState,
+                              template: BuildingTemplate, building_efficiency: float,
+                              sign: int) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) one building's effects on the totals.
+
+        Gives the same totals as _update_colony_production for a single
+        building change while only touching that template's resources.
+        Efficiency changes still need the full recalculation.
+        """
+        efficiency = building_efficiency * state.overall_efficiency * sign
+        daily_production = state.daily_production
+        daily_consumption = state.daily_consumption
+        net_production = state.net_production
+        touched = []
+        
+        # Production
+        for resource, amount in template.resource_production.items():
+            daily_amount = amount * efficiency
+            daily_production[resource] = daily_production.get(resource, 0) + daily_amount
+            colony.production[resource] = colony.production.get(resource, 0) + daily_amount
+            if resource == "energy":
+                state.total_power_generation += daily_amount
+                colony.power_generation += daily_amount
+            touched.append(resource)
+        
+        # Consumption
+        for resource, amount in template.resource_consumption.items():
+            daily_amount = amount * efficiency
+            daily_consumption[resource] = daily_consumption.get(resource, 0) + daily_amount
+            colony.consumption[resource] = colony.consumption.get(resource, 0) + daily_amount
+            touched.append(resource)
+        
+        for resource in touched:
+            # Drop resources no remaining building produces, or consumes;
+            # the full recalculation never creates those entries
+            if sign < 0:
+                if abs(daily_production.get(resource, 1.0)) < 1e-9:
+                    del daily_production[resource]
+                if abs(daily_consumption.get(resource, 1.0)) < 1e-9:
+                    del daily_consumption[resource]
+            if resource in daily_production or resource in daily_consumption:
+                net_production[resource] = (
+                    daily_production.get(resource, 0) - daily_consumption.get(resource, 0)
+                )
+            else:
+                net_production.pop(resource, None)
+        
+        # Infrastructure effects
+        if template.power_requirement > 0:
+            state.total_power_consumption += template.power_requirement * sign
+            colony.power_consumption += template.power_requirement * sign
+        
+        # Population capacity
+        state.total_population_capacity += template.population_capacity * sign
+        colony.max_population = state.total_population_capacity
+        state.assigned_population += template.population_requirement * sign
+        
+        # Defense value
+        state.total_defense_value += template.defense_value * sign
+        colony.defense_rating += template.defense_value * sign
         
         state.last_updated = 0.0  # Would use current game time
     
@@ -428,7 +615,8 @@ class ColonyInfrastructureManager:
         
         # Remove from colony state
         state = self.get_colony_state(colony.id)
-        if state and building_id in state.buildings:
+        counted = state is not None and building_id in state.buildings
+        if counted:
             del state.buildings[building_id]
         
         # Remove from colony buildings dict
@@ -445,9 +633,9 @@ class ColonyInfrastructureManager:
             refund = cost * refund_rate
             colony.stockpiles[resource] = colony.stockpiles.get(resource, 0) + refund
         
-        # Update production
-        if state:
-            self._update_colony_production(colony, state)
+        # Take the building's output out of the colony totals
+        if counted:
+            self._apply_building_delta(colony, state, template, building.efficiency, -1)
         
         logger.info("Demolished %s in colony %s", template.name, colony.name)
         return True
@@ -98,6 +98,7 @@ class OrbitalMechanics:
             planet_data = {
                 "orbital_distance": planet.orbital_distance,
                 "orbital_period": planet.orbital_period,
+                "mean_motion": 2 * np.pi / planet.orbital_period,
                 "eccentricity": planet.eccentricity,
                 "inclination": planet.inclination,
                 "initial_position": planet.position.copy(),
@@ -163,11 +164,9 @@ class OrbitalMechanics:
                 planet_data = system_data['planets'][i]
                 
 
-                # Calculate mean motion (radians per second)
-                period_seconds = planet_data['orbital_period']
-                mean_motion = 2 * np.pi / period_seconds
+                # Mean motion (radians per second) is fixed per orbit
+                mean_motion = planet_data["mean_motion"]
 
-                
                 # Calculate mean anomaly at current time
                 mean_anomaly = (mean_motion * current_time) % (2 * np.pi)
                 
@@ -87,7 +87,7 @@ class GameSimulation:
         """Create a fresh copy of all technologies for a new empire."""
         techs = {}
         for tech_id, tech in self.tech_manager.get_all_technologies().items():
-            techs[tech_id] = Technology(**tech.model_dump())
+            techs[tech_id] = tech.model_copy()
         return techs
     
     def initialize_new_game(self, num_systems: int = 3, num_empires: int = 2) -> None:
@@ -527,7 +527,7 @@ class GameSimulation:
             ]
             if available:
                 chosen = random.choice(available)
-                empire.technologies[chosen.id] = chosen
+                empire.technologies[chosen.id] = chosen.model_copy()
                 if not empire.current_research:
                     empire.current_research = chosen.id
                     empire.research_points = 0.0
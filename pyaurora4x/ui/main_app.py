@@ -814,6 +814,7 @@ class PyAurora4XApp(App):
                 self.action_save_game()
             except Exception as e:
                 logger.error(f"Error auto-saving on quit: {e}")
+        self.save_manager.close()
         
         logger.info("PyAurora 4X application ending")
         self.exit()
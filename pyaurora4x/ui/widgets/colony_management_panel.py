@@ -302,9 +302,9 @@ class ColonyManagementPanel(Static):
             requirements_text = ", ".join(requirements) if requirements else "None"
             
             # Check if can build
-            can_build, reason = self.infrastructure_manager.can_build(
+            can_build = self.infrastructure_manager.can_build_fast(
                 self.current_colony, self.current_empire, template.id
-            ) if self.current_colony else (False, "No colony")
+            ) if self.current_colony else False
             
             # Add styling based on buildability
             building_name = template.name
@@ -470,8 +470,7 @@ class ShipDesignPanel(Static):
             
             if design:
                 # Remove from component manager
-                if str(design_id) in self.component_manager.designs:
-                    del self.component_manager.designs[str(design_id)]
+                self.component_manager.delete_design(str(design_id))
                 
                 # Remove from empire if applicable
                 if self.empire and design.id in self.empire.ship_designs:
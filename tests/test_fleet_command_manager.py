@@ -0,0 +1,416 @@
+"""Unit tests for the FleetCommandManager."""
+
+import numpy as np
+import pytest
+
+from pyaurora4x.core.enums import FleetStatus, OrderPriority, OrderStatus, OrderType, StarType
+from pyaurora4x.core.models import Empire, Fleet, StarSystem, Vector3D
+import pyaurora4x.engine.fleet_command_manager as fcm
+from pyaurora4x.engine.fleet_command_manager import FleetCommandManager
+from pyaurora4x.engine.jump_travel_system import FleetJumpTravelSystem, JumpOperation
+
+
+@pytest.fixture
+def empire():
+    return Empire(name="Test Empire", home_system_id="sol", home_planet_id="earth")
+
+
+@pytest.fixture
+def fleet(empire):
+    return Fleet(
+        id="fleet1",
+        name="Alpha",
+        empire_id=empire.id,
+        system_id="sol",
+        position=Vector3D(),
+        ships=["s1", "s2", "s3"],
+        max_speed=100.0,
+    )
+
+
+@pytest.fixture
+def manager(fleet, empire):
+    manager = FleetCommandManager()
+    manager.initialize_fleet_command(fleet, empire)
+    return manager
+
+
+def issue(manager, order_type, priority=OrderPriority.NORMAL, **kwargs):
+    """Issue an order to fleet1 and return its ID."""
+    before = set(manager.fleet_orders)
+    success, message = manager.issue_order("fleet1", order_type, priority=priority, **kwargs)
+    assert success, message
+    (order_id,) = set(manager.fleet_orders) - before
+    return order_id
+
+
+class TestInitialization:
+    """Test fleet command setup."""
+
+    def test_derived_stats_scale_with_ship_count(self, manager):
+        """Combat and logistics figures come from the fleet's ship count."""
+        state = manager.fleet_command_states["fleet1"]
+        assert state.combat_capabilities.total_firepower == 30.0
+        assert state.combat_capabilities.combat_rating == 27.0
+        assert state.logistics_requirements.fuel_capacity == 3000.0
+        assert state.logistics_requirements.current_fuel == 3000.0
+        assert state.logistics_requirements.crew_requirements == 150
+
+
+class TestOrderQueue:
+    """Test order queueing and processing."""
+
+    def test_queue_kept_in_priority_order(self, manager):
+        """Orders sort by priority and keep issue order within a priority."""
+        survey = issue(manager, OrderType.SURVEY, OrderPriority.LOW)
+        repair = issue(manager, OrderType.REPAIR)
+        defend = issue(manager, OrderType.DEFEND, OrderPriority.EMERGENCY)
+        resupply = issue(manager, OrderType.RESUPPLY)
+        patrol = issue(manager, OrderType.PATROL, OrderPriority.BACKGROUND)
+
+        queue = manager.fleet_command_states["fleet1"].order_queue
+        assert queue == [defend, repair, resupply, survey, patrol]
+
+    def test_order_ids_are_sequential(self, manager):
+        """Orders get unique IDs counting up within a run."""
+        first = issue(manager, OrderType.SURVEY)
+        second = issue(manager, OrderType.SURVEY)
+
+        prefix, _, number = first.rpartition("-")
+        assert second == f"{prefix}-{int(number) + 1}"
+
+    def test_completed_orders_leave_queue(self, manager, fleet, empire):
+        """Finished orders are removed and counted as successful missions."""
+        defend = issue(manager, OrderType.DEFEND)
+        survey = issue(manager, OrderType.SURVEY)
+
+        manager.process_fleet_orders(fleet, empire, 1.0)
+
+        state = manager.fleet_command_states["fleet1"]
+        assert state.order_queue == [survey]
+        assert state.completed_orders == [defend]
+        assert state.total_missions == 1
+        assert state.mission_success_rate == 1.0
+        assert manager.fleet_orders[defend].status == OrderStatus.COMPLETED
+
+    def test_cancelled_orders_are_not_processed(self, manager, fleet, empire):
+        """Cancelled orders drop out of the queue."""
+        survey = issue(manager, OrderType.SURVEY)
+        assert manager.cancel_order("fleet1", survey)
+
+        manager.process_fleet_orders(fleet, empire, 1.0)
+
+        state = manager.fleet_command_states["fleet1"]
+        assert state.order_queue == []
+        assert manager.fleet_orders[survey].status == OrderStatus.CANCELLED
+        assert manager.fleet_orders[survey].progress == 0.0
+
+    def test_cancelled_orders_are_compacted_lazily(self, manager, fleet, empire):
+        """Cancelling leaves a tombstone that the next pass removes."""
+        survey = issue(manager, OrderType.SURVEY, OrderPriority.HIGH)
+        patrol = issue(manager, OrderType.PATROL, OrderPriority.LOW)
+        assert manager.cancel_order("fleet1", survey)
+
+        state = manager.fleet_command_states["fleet1"]
+        assert state.order_queue == [survey, patrol]
+        assert manager.get_fleet_tactical_status("fleet1")["pending_orders"] == 1
+
+        # Orders issued after a cancellation still land in priority order
+        defend = issue(manager, OrderType.DEFEND, OrderPriority.NORMAL)
+        assert state.order_queue == [survey, defend, patrol]
+
+        manager.process_fleet_orders(fleet, empire, 1.0)
+        assert state.order_queue == [patrol]
+
+    def test_only_fleets_with_orders_are_active(self, manager, fleet, empire):
+        """Fleets leave the active set once their last order is gone."""
+        assert "fleet1" not in manager._fleets_with_orders
+        defend = issue(manager, OrderType.DEFEND)
+        survey = issue(manager, OrderType.SURVEY)
+        assert "fleet1" in manager._fleets_with_orders
+
+        manager.cancel_order("fleet1", survey)
+        assert "fleet1" in manager._fleets_with_orders
+        manager.process_all_fleet_orders({fleet.id: fleet}, {empire.id: empire}, 1.0)
+
+        assert manager.fleet_orders[defend].status == OrderStatus.COMPLETED
+        assert "fleet1" not in manager._fleets_with_orders
+
+
+class TestFleetStatus:
+    """Test the fleet status set while carrying out orders."""
+
+    def test_status_follows_order_progress(self, manager, fleet, empire):
+        """Fleets show the active status, then the completed one."""
+        issue(manager, OrderType.SURVEY)
+        manager.process_fleet_orders(fleet, empire, 100.0)
+        assert fleet.status == FleetStatus.SURVEYING
+
+        manager.process_fleet_orders(fleet, empire, 200.0)
+        assert fleet.status == FleetStatus.IDLE
+
+    def test_escort_keeps_escorting_status(self, manager, fleet, empire):
+        """Escort orders complete at once and leave the fleet escorting."""
+        issue(manager, OrderType.ESCORT)
+        manager.process_fleet_orders(fleet, empire, 1.0)
+        assert fleet.status == FleetStatus.ESCORTING
+
+    def test_refuel_tops_up_fleet_logistics(self, manager, fleet, empire):
+        """Refuelling fills the fleet's own tanks, then completes."""
+        logistics = manager.fleet_command_states["fleet1"].logistics_requirements
+        logistics.fuel_capacity = 1000.0
+        logistics.current_fuel = 400.0
+        order_id = issue(manager, OrderType.REFUEL)
+
+        manager.process_fleet_orders(fleet, empire, 5.0)
+        assert logistics.current_fuel == 900.0
+        assert fleet.status == FleetStatus.REFUELING
+
+        manager.process_fleet_orders(fleet, empire, 5.0)
+        manager.process_fleet_orders(fleet, empire, 5.0)
+        assert logistics.current_fuel == 1000.0
+        assert manager.fleet_orders[order_id].status == OrderStatus.COMPLETED
+        assert fleet.status == FleetStatus.IDLE
+
+    def test_failed_order_leaves_status(self, manager, fleet, empire):
+        """A failing order does not change the fleet's status."""
+        fleet.status = FleetStatus.ORBITING
+        order_id = issue(manager, OrderType.PATROL)
+        manager.fleet_orders[order_id].order_type = OrderType.MOVE_TO
+        manager.process_fleet_orders(fleet, empire, 1.0)
+
+        assert manager.fleet_orders[order_id].status == OrderStatus.FAILED
+        assert fleet.status == FleetStatus.ORBITING
+
+
+class TestMovement:
+    """Test move-to order processing."""
+
+    def _fleets(self, empire, count):
+        return {
+            f"f{i}": Fleet(
+                id=f"f{i}",
+                name=f"Fleet {i}",
+                empire_id=empire.id,
+                system_id="sol",
+                position=Vector3D(x=float(i), y=0.0, z=0.0),
+                max_speed=10.0 * (i + 1),
+            )
+            for i in range(count)
+        }
+
+    def _issue_moves(self, manager, empire, fleets):
+        for i, fleet in enumerate(fleets.values()):
+            manager.initialize_fleet_command(fleet, empire)
+            target = Vector3D(x=float(i), y=100.0 + i, z=-50.0)
+            manager.issue_order(fleet.id, OrderType.MOVE_TO, target_position=target)
+
+    @pytest.mark.parametrize("batch_min", [0, 10_000])
+    def test_batched_moves_match_scalar_moves(self, empire, monkeypatch, batch_min):
+        """Moving many fleets at once gives the per-fleet results."""
+        monkeypatch.setattr(fcm, "_MOVE_BATCH_MIN", batch_min)
+        batched = self._fleets(empire, 20)
+        single = self._fleets(empire, 20)
+        batch_manager = FleetCommandManager()
+        single_manager = FleetCommandManager()
+        self._issue_moves(batch_manager, empire, batched)
+        self._issue_moves(single_manager, empire, single)
+
+        for _ in range(3):
+            batch_manager.process_all_fleet_orders(batched, {empire.id: empire}, 1.0)
+            for fleet in single.values():
+                single_manager.process_fleet_orders(fleet, empire, 1.0)
+
+        for fleet_id, fleet in batched.items():
+            other = single[fleet_id]
+            assert fleet.position.x == pytest.approx(other.position.x)
+            assert fleet.position.y == pytest.approx(other.position.y)
+            assert fleet.position.z == pytest.approx(other.position.z)
+            assert fleet.status == other.status
+        assert batch_manager._planned_moves == {}
+
+        # The fastest fleets have arrived and finished their orders
+        arrived = batched["f19"]
+        assert (arrived.position.x, arrived.position.y, arrived.position.z) == (19.0, 119.0, -50.0)
+        assert batch_manager.fleet_command_states["f19"].order_queue == []
+        assert batch_manager.fleet_command_states["f0"].order_queue
+
+    def test_move_kernel_matches_array_moves(self):
+        """The loop kernel computes the same moves as the NumPy version."""
+        rng = np.random.default_rng(7)
+        current = rng.uniform(-100.0, 100.0, (12, 3))
+        target = rng.uniform(-100.0, 100.0, (12, 3))
+        target[0] = current[0]
+        step = rng.uniform(0.0, 200.0, 12)
+
+        expected = fcm._move_arrays(current, target, step)
+        position = np.empty((12, 3))
+        fraction = np.empty(12)
+        reached = np.empty(12, dtype=bool)
+        fcm._move_kernel(current, target, step, position, fraction, reached)
+
+        assert position == pytest.approx(expected[0])
+        assert fraction == pytest.approx(expected[1])
+        assert (reached == expected[2]).all()
+        assert reached[0]
+
+
+class TestFormationUpdates:
+    """Test per-tick formation maintenance."""
+
+    @pytest.mark.parametrize("batch_min", [0, 10_000])
+    def test_integrity_and_cohesion_recover(self, empire, monkeypatch, batch_min):
+        """Batched and per-fleet updates give the same capped values."""
+        monkeypatch.setattr(fcm, "_FORMATION_BATCH_MIN", batch_min)
+        manager = FleetCommandManager()
+        template_id = next(iter(manager.formation_templates))
+        fleets = {}
+        for i in range(4):
+            fleet = Fleet(
+                id=f"f{i}", name=f"Fleet {i}", empire_id=empire.id, system_id="sol",
+                position=Vector3D(x=float(i)), ships=["s1"],
+            )
+            fleets[fleet.id] = fleet
+            manager.initialize_fleet_command(fleet, empire)
+            manager.set_fleet_formation(fleet.id, template_id)
+            state = manager.formation_states[fleet.id]
+            state.is_formed = i != 3
+            state.formation_integrity = 0.2 * i
+            state.formation_cohesion = 0.25 * i
+
+        manager.process_formation_updates(fleets, 3.0)
+
+        states = manager.formation_states
+        assert states["f0"].formation_integrity == pytest.approx(0.3)
+        assert states["f0"].formation_cohesion == pytest.approx(0.2)
+        assert states["f2"].formation_integrity == pytest.approx(0.7)
+        assert states["f2"].formation_cohesion == pytest.approx(0.7)
+        assert states["f1"].formation_center.x == 1.0
+        # Unformed fleets are left alone
+        assert states["f3"].formation_integrity == pytest.approx(0.6)
+        assert states["f3"].formation_center.x == 0.0
+
+    def test_recovered_formation_follows_fleet(self, manager, fleet, empire):
+        """Fully recovered formations still track the fleet's position."""
+        template_id = next(iter(manager.formation_templates))
+        manager.set_fleet_formation("fleet1", template_id)
+        state = manager.formation_states["fleet1"]
+        state.is_formed = True
+        fleet.position = Vector3D(x=5.0, y=6.0, z=7.0)
+
+        manager.process_formation_updates({fleet.id: fleet}, 1.0)
+
+        assert state.formation_integrity == 1.0
+        assert state.formation_cohesion == 1.0
+        assert (state.formation_center.x, state.formation_center.y) == (5.0, 6.0)
+
+
+class TestCombatEngagements:
+    """Test combat engagement processing."""
+
+    def test_finished_engagements_are_removed(self, manager, fleet):
+        """Engagements end after two minutes and release their fleets."""
+        first = manager.start_combat_engagement(["fleet1"], [], "sol")
+        manager.process_combat_engagements({fleet.id: fleet}, 60.0)
+        second = manager.start_combat_engagement([], ["fleet1"], "sol")
+
+        manager.process_combat_engagements({fleet.id: fleet}, 60.0)
+
+        assert list(manager.combat_engagements) == [second]
+        state = manager.fleet_command_states["fleet1"]
+        assert state.current_engagement is None
+        assert state.combat_experience == 2.0
+        assert first not in manager.combat_engagements
+
+    def test_fleets_in_other_systems_do_not_engage(self, manager, fleet, empire):
+        """Engagements only include fleets indexed in their system."""
+        other = Fleet(
+            id="fleet2", name="Beta", empire_id=empire.id, system_id="vega", position=Vector3D()
+        )
+        manager.initialize_fleet_command(other, empire)
+        assert manager.get_fleets_in_system("sol") == {"fleet1"}
+
+        engagement_id = manager.start_combat_engagement(["fleet1"], ["fleet2", "unknown"], "sol")
+        engagement = manager.combat_engagements[engagement_id]
+        assert engagement.defending_fleets == ["unknown"]
+        assert manager.fleet_command_states["fleet2"].current_engagement is None
+
+        other.system_id = "sol"
+        manager.update_fleet_system(other)
+        assert manager.get_fleets_in_system("sol") == {"fleet1", "fleet2"}
+        assert manager.get_fleets_in_system("vega") == frozenset()
+
+    def test_fleet_engages_after_jumping(self, manager, fleet, empire):
+        """A fleet that jumped in is judged by the system it is in now."""
+        other = Fleet(
+            id="fleet2", name="Beta", empire_id=empire.id, system_id="vega", position=Vector3D()
+        )
+        manager.initialize_fleet_command(other, empire)
+        vega = StarSystem(
+            id="vega", name="Vega", star_type=StarType.G_DWARF, star_mass=1.0, star_luminosity=1.0
+        )
+        jump = JumpOperation(
+            fleet_id="fleet1",
+            origin_system_id="sol",
+            target_system_id="vega",
+            jump_point_id="jp1",
+            start_time=0.0,
+            travel_time=0.0,
+            fuel_consumed=0.0,
+        )
+        assert FleetJumpTravelSystem()._complete_jump(fleet, jump, {"vega": vega}, 0.0)
+
+        engagement_id = manager.start_combat_engagement(["fleet1"], ["fleet2"], "vega")
+        engagement = manager.combat_engagements[engagement_id]
+        assert engagement.attacking_fleets == ["fleet1"]
+        assert engagement.defending_fleets == ["fleet2"]
+        assert manager.get_fleets_in_system("vega") == {"fleet1", "fleet2"}
+        assert manager.get_fleets_in_system("sol") == frozenset()
+
+
+class TestFormationOrders:
+    """Test formation order issuing."""
+
+    def test_formation_template_is_a_typed_field(self, manager):
+        """set_fleet_formation issues a form-up order naming its template."""
+        template_id = next(iter(manager.formation_templates))
+        success, _ = manager.set_fleet_formation("fleet1", template_id)
+        assert success
+
+        state = manager.fleet_command_states["fleet1"]
+        order = state.current_orders[state.order_queue[0]]
+        assert order.order_type == OrderType.FORM_UP
+        assert order.formation_template_id == template_id
+
+    def test_formation_template_from_parameters(self, manager):
+        """A template given in the generic parameters is still accepted."""
+        template_id = next(iter(manager.formation_templates))
+        success, _ = manager.issue_order(
+            "fleet1", OrderType.FORM_UP, parameters={"formation_template_id": template_id}
+        )
+        assert success
+        success, _ = manager.issue_order(
+            "fleet1", OrderType.FORM_UP, parameters={"formation_template_id": "missing"}
+        )
+        assert not success
+
+    def test_fleets_share_templates_until_customized(self, manager, empire):
+        """Customizing a template copies the table for that fleet only."""
+        other = Fleet(
+            id="fleet2", name="Beta", empire_id=empire.id, system_id="sol", position=Vector3D()
+        )
+        manager.initialize_fleet_command(other, empire)
+        template_id = next(iter(manager.formation_templates))
+        shared = manager.formation_templates[template_id]
+        assert manager.fleet_command_states["fleet1"].formation_templates == {}
+
+        custom = manager.customize_template("fleet1", template_id, formation_spacing=250.0)
+
+        assert custom.formation_spacing == 250.0
+        assert manager.formation_templates[template_id] is shared
+        assert manager.get_fleet_formation_templates("fleet1")[template_id] is custom
+        assert manager.get_fleet_formation_templates("fleet2")[template_id] is shared
+        assert manager.customize_template("fleet1", "missing") is None
+
+        manager.set_fleet_formation("fleet1", template_id)
+        assert manager.formation_states["fleet1"].current_spacing == 250.0
@@ -147,6 +147,21 @@ class TestInfrastructureManager:
         ]
         assert len(engineering_buildings) > 0
 
+    def test_available_buildings_follow_research(self, infrastructure_manager, empire):
+        """Newly researched technologies unlock buildings on the next call."""
+        empire.technologies = {"engineering": Mock(is_researched=False)}
+        available = {b.id for b in infrastructure_manager.get_available_buildings(empire)}
+        assert "automated_mine" not in available
+
+        # Callers get their own list
+        infrastructure_manager.get_available_buildings(empire).clear()
+        assert infrastructure_manager.get_available_buildings(empire)
+
+        empire.technologies["engineering"].is_researched = True
+        available = {b.id for b in infrastructure_manager.get_available_buildings(empire)}
+        assert "automated_mine" in available
+        assert "defense_station" not in available
+
 
 class TestBuildingConstruction:
     """Test building construction functionality."""
@@ -184,6 +199,39 @@ class TestBuildingConstruction:
         assert not can_build
         assert "Insufficient population" in reason
     
+    def test_completed_buildings_use_population(self, infrastructure_manager, colony, empire):
+        """Population required by finished buildings is not available again."""
+        state = infrastructure_manager.initialize_colony_infrastructure(colony)
+        template = infrastructure_manager.building_templates["basic_mine"]
+        colony.population = template.population_requirement * 2
+
+        infrastructure_manager.start_construction(colony, empire, "basic_mine")
+        infrastructure_manager.process_construction(colony, empire, template.construction_time)
+        assert state.assigned_population == template.population_requirement
+        assert infrastructure_manager.can_build(colony, empire, "basic_mine")[0]
+
+        infrastructure_manager.start_construction(colony, empire, "basic_mine")
+        infrastructure_manager.process_construction(colony, empire, template.construction_time)
+        can_build, reason = infrastructure_manager.can_build(colony, empire, "basic_mine")
+        assert not can_build
+        assert "Insufficient population" in reason
+
+    def test_can_build_fast_matches_can_build(self, infrastructure_manager, colony, empire):
+        """The fast check agrees with can_build and reports the cheapest failure first."""
+        infrastructure_manager.initialize_colony_infrastructure(colony)
+        for template_id in infrastructure_manager.building_templates:
+            expected = infrastructure_manager.can_build(colony, empire, template_id)[0]
+            assert infrastructure_manager.can_build_fast(colony, empire, template_id) == expected
+        assert not infrastructure_manager.can_build_fast(colony, empire, "no_such_building")
+
+        # Population is checked before resources
+        colony.stockpiles = {}
+        colony.population = 5
+        assert not infrastructure_manager.can_build_fast(colony, empire, "basic_mine")
+        can_build, reason = infrastructure_manager.can_build(colony, empire, "basic_mine")
+        assert not can_build
+        assert "Insufficient population" in reason
+
     def test_start_construction(self, infrastructure_manager, colony, empire):
         """Test starting construction of a building."""
         infrastructure_manager.initialize_colony_infrastructure(colony)
@@ -244,6 +292,27 @@ class TestBuildingConstruction:
         assert len(state.construction_projects) == 0
         assert len(state.construction_queue) == 0
 
+    def test_cancelled_projects_keep_queue_order(self, infrastructure_manager, colony, empire):
+        """Cancelled projects are skipped and later inserts stay ordered."""
+        infrastructure_manager.initialize_colony_infrastructure(colony)
+
+        infrastructure_manager.start_construction(colony, empire, "basic_mine", priority=5)
+        infrastructure_manager.start_construction(colony, empire, "power_plant", priority=5)
+        state = infrastructure_manager.get_colony_state(colony.id)
+        first, second = state.construction_queue
+
+        # Cancelled projects stay queued until they reach the front
+        assert infrastructure_manager.cancel_construction(colony.id, first)
+        assert state.construction_queue == [first, second]
+
+        infrastructure_manager.start_construction(colony, empire, "habitat", priority=5)
+        infrastructure_manager.start_construction(colony, empire, "basic_mine", priority=9)
+        *_, third = state.construction_queue
+        urgent = state.construction_queue[0]
+        assert state.construction_queue == [urgent, first, second, third]
+        assert state.construction_projects[urgent].priority == 9
+        assert state.construction_projects[third].building_template_id == "habitat"
+
 
 class TestResourceProduction:
     """Test resource production and consumption."""
@@ -264,6 +333,20 @@ class TestResourceProduction:
         assert state.net_production["minerals"] == 10.0
         assert colony.production["minerals"] == 10.0
     
+    def test_production_sums_buildings_of_a_template(self, infrastructure_manager, colony, empire):
+        """Buildings sharing a template add up by their own efficiency."""
+        state = infrastructure_manager.initialize_colony_infrastructure(colony)
+        for efficiency in (1.0, 0.5, 0.25):
+            building = infrastructure_manager._create_building(colony.id, "basic_mine")
+            building.efficiency = efficiency
+            state.buildings[building.id] = building
+
+        infrastructure_manager._update_colony_production(colony, state)
+
+        template = infrastructure_manager.building_templates["basic_mine"]
+        assert state.daily_production["minerals"] == pytest.approx(10.0 * 1.75)
+        assert state.assigned_population == template.population_requirement * 3
+
     def test_building_consumption(self, infrastructure_manager, colony, empire):
         """Test building resource consumption."""
         # Initialize and add a factory (consumes minerals, produces alloys)
@@ -422,6 +505,54 @@ class TestBuildingOperations:
         expected_refund = template.construction_cost["minerals"] * 0.25
         assert colony.stockpiles["minerals"] == initial_minerals + expected_refund
     
+    def test_incremental_totals_match_full_recalculation(self, infrastructure_manager, colony, empire):
+        """Completing and demolishing buildings keeps the totals exact."""
+        state = infrastructure_manager.initialize_colony_infrastructure(colony)
+        colony.stockpiles.update({"minerals": 10000.0, "energy": 10000.0, "alloys": 10000.0})
+        for template_id in ("power_plant", "basic_factory", "basic_mine"):
+            template = infrastructure_manager.building_templates[template_id]
+            infrastructure_manager.start_construction(colony, empire, template_id)
+            infrastructure_manager.process_construction(colony, empire, template.construction_time)
+        factory_id = next(
+            bid for bid, b in state.buildings.items() if b.template_id == "basic_factory"
+        )
+        assert infrastructure_manager.demolish_building(colony, factory_id)
+        assert len(state.buildings) == 2
+
+        incremental = state.model_copy(deep=True)
+        infrastructure_manager._update_colony_production(colony, state)
+
+        assert incremental.daily_production == pytest.approx(state.daily_production)
+        assert incremental.daily_consumption == pytest.approx(state.daily_consumption)
+        assert incremental.net_production == pytest.approx(state.net_production)
+        assert incremental.total_power_generation == pytest.approx(state.total_power_generation)
+        assert incremental.total_power_consumption == pytest.approx(state.total_power_consumption)
+        assert incremental.total_defense_value == pytest.approx(state.total_defense_value)
+        assert incremental.assigned_population == state.assigned_population
+
+    def test_removed_producer_of_consumed_resource(self, infrastructure_manager, colony, empire):
+        """Demolishing the only mine leaves minerals as consumption only."""
+        state = infrastructure_manager.initialize_colony_infrastructure(colony)
+        colony.stockpiles.update({"minerals": 10000.0, "energy": 10000.0, "alloys": 10000.0})
+        for template_id in ("basic_factory", "basic_mine"):
+            template = infrastructure_manager.building_templates[template_id]
+            infrastructure_manager.start_construction(colony, empire, template_id)
+            infrastructure_manager.process_construction(colony, empire, template.construction_time)
+        mine_id = next(
+            bid for bid, b in state.buildings.items() if b.template_id == "basic_mine"
+        )
+        assert infrastructure_manager.demolish_building(colony, mine_id)
+
+        assert "minerals" not in state.daily_production
+        assert state.daily_consumption["minerals"] == pytest.approx(8.0)
+        assert state.net_production["minerals"] == pytest.approx(-8.0)
+
+        incremental = state.model_copy(deep=True)
+        infrastructure_manager._update_colony_production(colony, state)
+        assert incremental.daily_production == pytest.approx(state.daily_production)
+        assert incremental.daily_consumption == pytest.approx(state.daily_consumption)
+        assert incremental.net_production == pytest.approx(state.net_production)
+
     def test_get_building_info(self, infrastructure_manager):
         """Test getting building information."""
         # Create a building
@@ -16,6 +16,8 @@ def test_research_completion():
 
     assert tech.is_researched
     assert empire.current_research is None
+    # Progress belongs to the empire, not the shared tech tree
+    assert not sim.tech_manager.technologies[tech_id].is_researched
 
 
 def test_multiple_research_projects():
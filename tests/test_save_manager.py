@@ -1,7 +1,11 @@
+import json
 from pathlib import Path
+from unittest.mock import patch
 
+import pytest
 
 import pyaurora4x.data.save_manager as sm
+from pyaurora4x.core.enums import FleetStatus, TechnologyType
 from pyaurora4x.data.save_manager import SaveManager
 
 
@@ -63,3 +67,372 @@ def test_environment_override(tmp_path, monkeypatch):
     manager = SaveManager()
     assert manager.save_directory == env_path
     _run_cycle(manager, "env_save")
+
+
+def test_json_backend_without_orjson(tmp_path, monkeypatch):
+    monkeypatch.setattr(sm, "ORJSON_AVAILABLE", False)
+    monkeypatch.setattr(sm, "TINYDB_AVAILABLE", False)
+    monkeypatch.setattr(sm, "DUCKDB_AVAILABLE", False)
+    manager = SaveManager(save_directory=str(tmp_path), use_duckdb=False)
+    _run_cycle(manager, "stdlib_json_save")
+
+
+def test_non_string_keys_match_across_encoders(tmp_path, monkeypatch):
+    monkeypatch.setattr(sm, "TINYDB_AVAILABLE", False)
+    monkeypatch.setattr(sm, "DUCKDB_AVAILABLE", False)
+    data = {"allocation": {TechnologyType.PROPULSION: 0.5, 3: "three"}}
+    expected = {"allocation": {"propulsion": 0.5, "3": "three"}}
+
+    for use_orjson in (True, False):
+        monkeypatch.setattr(sm, "ORJSON_AVAILABLE", use_orjson and sm.ORJSON_AVAILABLE)
+        manager = SaveManager(save_directory=str(tmp_path / str(use_orjson)))
+        manager.save_game(data, "keys")
+        assert manager.load_game("keys") == expected
+
+
+def test_tuple_keys_saved_with_both_encoders(tmp_path, monkeypatch):
+    monkeypatch.setattr(sm, "TINYDB_AVAILABLE", False)
+    monkeypatch.setattr(sm, "DUCKDB_AVAILABLE", False)
+    data = {"grid": {(1, 2): "a", 3: {(4,): "b"}}}
+    expected = {"grid": {"(1, 2)": "a", "3": {"(4,)": "b"}}}
+
+    for use_orjson in (True, False):
+        monkeypatch.setattr(sm, "ORJSON_AVAILABLE", use_orjson and sm.ORJSON_AVAILABLE)
+        manager = SaveManager(save_directory=str(tmp_path / str(use_orjson)))
+        manager.save_game(data, "tuples")
+        assert manager.load_game("tuples") == expected
+
+    if sm.MSGPACK_AVAILABLE:
+        manager = SaveManager(
+            save_directory=str(tmp_path / "msgpack"), save_format="msgpack"
+        )
+        manager.save_game(data, "tuples")
+        assert manager.load_game("tuples") == expected
+
+
+def test_normalized_state_skips_fallback_serializer(tmp_path, monkeypatch):
+    from pyaurora4x.core.models import Vector3D
+
+    monkeypatch.setattr(sm, "TINYDB_AVAILABLE", False)
+    monkeypatch.setattr(sm, "DUCKDB_AVAILABLE", False)
+
+    for use_orjson in (True, False):
+        monkeypatch.setattr(sm, "ORJSON_AVAILABLE", use_orjson and sm.ORJSON_AVAILABLE)
+        manager = SaveManager(
+            save_directory=str(tmp_path / str(use_orjson)), normalized_state=True
+        )
+        state = {"fleet": Vector3D(x=1.0).model_dump(mode="json"), "turn": 3}
+        manager.save_game(state, "plain")
+        assert manager.load_game("plain") == state
+
+        with pytest.raises(TypeError):
+            manager.save_game({"fleet": Vector3D(x=1.0)}, "model")
+
+
+def test_duckdb_batched_saves(tmp_path):
+    manager = SaveManager(
+        save_directory=str(tmp_path), use_duckdb=True, batch_duckdb_saves=True
+    )
+    for i in range(3):
+        manager.save_game({"value": i}, f"auto_{i}")
+    manager.save_game({"value": 99}, "auto_0")
+
+    # Nothing is written until the queue is flushed
+    assert not manager.duckdb_path.exists()
+
+    manager.flush()
+    names = sorted(s["save_name"] for s in manager.list_saves())
+    assert names == ["auto_0", "auto_1", "auto_2"]
+    assert manager.load_game("auto_0") == {"value": 99}
+
+    # Reads flush pending saves implicitly
+    manager.save_game({"value": 3}, "auto_3")
+    assert manager.load_game("auto_3") == {"value": 3}
+
+
+def test_duckdb_batched_saves_written_when_manager_dropped(tmp_path):
+    import gc
+
+    manager = SaveManager(
+        save_directory=str(tmp_path), use_duckdb=True, batch_duckdb_saves=True
+    )
+    manager.save_game({"value": 1}, "queued")
+    del manager
+    gc.collect()
+
+    reopened = SaveManager(save_directory=str(tmp_path), use_duckdb=True)
+    assert reopened.load_game("queued") == {"value": 1}
+    reopened.close()
+
+
+def test_duckdb_blob_and_legacy_json_columns(tmp_path):
+    import duckdb
+
+    manager = SaveManager(save_directory=str(tmp_path / "new"), use_duckdb=True)
+    manager.save_game({"value": 1}, "blob_save")
+    with duckdb.connect(str(manager.duckdb_path)) as conn:
+        stored = conn.execute("SELECT game_state FROM saves").fetchone()[0]
+    assert isinstance(stored, bytes)
+    assert manager.load_game("blob_save") == {"value": 1}
+
+    legacy_dir = tmp_path / "legacy"
+    legacy_dir.mkdir()
+    with duckdb.connect(str(legacy_dir / "saves.duckdb")) as conn:
+        conn.execute(
+            "CREATE TABLE saves (save_name TEXT, save_date TEXT, game_version TEXT, "
+            "save_format_version TEXT, game_state JSON)"
+        )
+        conn.execute(
+            "INSERT INTO saves VALUES ('old', '2024-01-01', '0.1.0', '1.0', '{\"value\": 0}')"
+        )
+    legacy = SaveManager(save_directory=str(legacy_dir), use_duckdb=True)
+    assert legacy.load_game("old") == {"value": 0}
+    legacy.save_game({"value": 2}, "new")
+    assert legacy.load_game("new") == {"value": 2}
+
+
+def test_json_save_replaces_file_atomically(tmp_path, monkeypatch):
+    monkeypatch.setattr(sm, "TINYDB_AVAILABLE", False)
+    monkeypatch.setattr(sm, "DUCKDB_AVAILABLE", False)
+    manager = SaveManager(save_directory=str(tmp_path), use_duckdb=False)
+    manager.save_game({"value": 1}, "atomic")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(sm.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        manager.save_game({"value": 2}, "atomic")
+
+    # The previous save is intact and no temporary file is left behind
+    assert manager.load_game("atomic") == {"value": 1}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["atomic.json"]
+
+
+def test_manager_reuses_and_closes_database_handles(tmp_path):
+    with SaveManager(save_directory=str(tmp_path), use_duckdb=True) as manager:
+        manager.save_game({"value": 1}, "first")
+        conn = manager._duckdb_conn
+        manager.save_game({"value": 2}, "second")
+        assert manager.load_game("first") == {"value": 1}
+        assert manager._duckdb_conn is conn
+
+    assert manager._duckdb_conn is None
+
+    # A fresh manager sees the data written through the cached connection
+    reopened = SaveManager(save_directory=str(tmp_path), use_duckdb=True)
+    assert reopened.cleanup_old_saves(keep_count=0) == 2
+    assert reopened.list_saves() == []
+    reopened.close()
+
+
+@pytest.mark.parametrize("use_ijson", [False, True])
+def test_list_json_saves_reads_metadata_header(tmp_path, monkeypatch, use_ijson):
+    if use_ijson and not sm.IJSON_AVAILABLE:
+        pytest.skip("ijson C backend not installed")
+    monkeypatch.setattr(sm, "IJSON_AVAILABLE", use_ijson)
+    monkeypatch.setattr(sm, "TINYDB_AVAILABLE", False)
+    monkeypatch.setattr(sm, "DUCKDB_AVAILABLE", False)
+    manager = SaveManager(save_directory=str(tmp_path), use_duckdb=False)
+
+    manager.save_game({"value": 1}, "normal")
+    # Metadata larger than the initial read window
+    (tmp_path / "big_meta.json").write_text(
+        json.dumps({"metadata": {"save_name": "big_meta", "note": "x" * 20000}})
+    )
+    # Only the header is decoded, so a huge or damaged body is not read
+    (tmp_path / "header_only.json").write_text(
+        '{"metadata": {"save_name": "header_only"}, "game_state": {"value": '
+    )
+    (tmp_path / "legacy.json").write_text(json.dumps({"value": 2}))
+    (tmp_path / "broken.json").write_text("not json")
+    (tmp_path / "folder.json").mkdir()
+
+    saves = {s["save_name"]: s for s in manager.list_saves()}
+    assert set(saves) == {"normal", "big_meta", "header_only", "legacy"}
+    assert saves["big_meta"]["note"] == "x" * 20000
+    assert saves["legacy"]["save_format_version"] == "legacy"
+    assert saves["normal"]["file_path"] == str(tmp_path / "normal.json")
+
+
+def test_msgpack_file_saves(tmp_path, monkeypatch):
+    pytest.importorskip("msgpack")
+    monkeypatch.setattr(sm, "TINYDB_AVAILABLE", False)
+    monkeypatch.setattr(sm, "DUCKDB_AVAILABLE", False)
+    manager = SaveManager(
+        save_directory=str(tmp_path), use_duckdb=False, save_format="msgpack"
+    )
+    data = {"value": 42, "positions": [[1.5, 2.5, 3.5]], "status": FleetStatus.IDLE}
+
+    path = manager.save_game(data, "binary")
+    assert path.endswith(".msgpack")
+    assert manager.load_game("binary") == {**data, "status": FleetStatus.IDLE.value}
+
+    saves = manager.list_saves()
+    assert [s["save_name"] for s in saves] == ["binary"]
+
+    # A JSON manager can still read the binary save, and saving the same
+    # name again replaces it rather than leaving two copies
+    json_manager = SaveManager(save_directory=str(tmp_path), use_duckdb=False)
+    assert json_manager.load_game("binary")["value"] == 42
+    json_manager.save_game({"value": 1}, "binary")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["binary.json"]
+
+    assert json_manager.delete_save("binary")
+    assert not json_manager.list_saves()
+
+
+def test_zstd_compressed_file_saves(tmp_path, monkeypatch):
+    pytest.importorskip("zstandard")
+    monkeypatch.setattr(sm, "TINYDB_AVAILABLE", False)
+    monkeypatch.setattr(sm, "DUCKDB_AVAILABLE", False)
+    manager = SaveManager(
+        save_directory=str(tmp_path), use_duckdb=False, compress_saves=True
+    )
+    data = {"value": 7, "names": ["x" * 50] * 200}
+
+    path = manager.save_game(data, "packed")
+    assert path.endswith(".json.zst")
+    assert (tmp_path / "packed.json.zst").stat().st_size < len(json.dumps(data))
+    assert manager.load_game("packed") == data
+
+    saves = manager.list_saves()
+    assert [s["save_name"] for s in saves] == ["packed"]
+    assert saves[0]["file_path"] == path
+
+    # Uncompressed managers still read the save and replace it on overwrite
+    plain_manager = SaveManager(save_directory=str(tmp_path), use_duckdb=False)
+    assert plain_manager.load_game("packed")["value"] == 7
+    plain_manager.save_game({"value": 1}, "packed")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["packed.json"]
+
+    manager.save_game(data, "packed")
+    assert manager.delete_save("packed")
+    assert not list(tmp_path.iterdir())
+
+
+def test_zstd_contexts_reused_per_thread():
+    pytest.importorskip("zstandard")
+    from concurrent.futures import ThreadPoolExecutor
+
+    assert sm._zstd_compressor() is sm._zstd_compressor()
+    assert sm._zstd_decompressor() is sm._zstd_decompressor()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        other = pool.submit(sm._zstd_compressor).result()
+    assert other is not sm._zstd_compressor()
+
+
+def test_unknown_save_format_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        SaveManager(save_directory=str(tmp_path), save_format="xml")
+
+
+def test_complex_objects_serialized_by_type(tmp_path, monkeypatch):
+    from datetime import datetime
+
+    from pyaurora4x.core.models import Vector3D
+
+    class Marker:
+        def __init__(self, label):
+            self.label = label
+
+    monkeypatch.setattr(sm, "TINYDB_AVAILABLE", False)
+    monkeypatch.setattr(sm, "DUCKDB_AVAILABLE", False)
+    monkeypatch.setattr(sm, "ORJSON_AVAILABLE", False)
+    manager = SaveManager(save_directory=str(tmp_path), use_duckdb=False)
+    data = {
+        "positions": [Vector3D(x=1.0), Vector3D(y=2.0)],
+        "markers": [Marker("a"), Marker("b")],
+        "when": datetime(2025, 1, 2, 3, 4, 5),
+        "status": FleetStatus.IDLE,
+    }
+    manager.save_game(data, "complex")
+
+    assert manager.load_game("complex") == {
+        "positions": [
+            {"x": 1.0, "y": 0.0, "z": 0.0},
+            {"x": 0.0, "y": 2.0, "z": 0.0},
+        ],
+        "markers": [{"label": "a"}, {"label": "b"}],
+        "when": "2025-01-02T03:04:05",
+        "status": "idle",
+    }
+
+
+def test_save_index_limits_backend_fan_out(tmp_path):
+    pytest.importorskip("duckdb")
+    manager = SaveManager(save_directory=str(tmp_path), use_duckdb=True)
+    manager.save_game({"value": 1}, "in_db")
+    (tmp_path / "loose.json").write_text(
+        json.dumps({"metadata": {"save_name": "loose"}, "game_state": {}})
+    )
+
+    with patch.object(
+        manager, "_list_json_saves", wraps=manager._list_json_saves
+    ) as list_json:
+        assert manager.get_save_info("in_db")["save_name"] == "in_db"
+        assert manager.get_save_info("loose")["save_name"] == "loose"
+        assert list_json.call_count == 1
+
+        # A save written by someone else triggers one refresh rather than a miss
+        (tmp_path / "late.json").write_text(
+            json.dumps({"metadata": {"save_name": "late"}, "game_state": {}})
+        )
+        assert manager.get_save_info("late")["save_name"] == "late"
+        assert list_json.call_count == 2
+
+    with patch.object(
+        manager, "_delete_from_duckdb", wraps=manager._delete_from_duckdb
+    ) as delete_from_duckdb:
+        assert manager.delete_save("loose")
+        assert delete_from_duckdb.call_count == 0
+        assert manager.delete_save("in_db")
+        delete_from_duckdb.assert_called_once_with(["in_db"])
+    assert [s["save_name"] for s in manager.list_saves()] == ["late"]
+    manager.close()
+
+
+def test_async_file_writes(tmp_path, monkeypatch):
+    import threading
+
+    monkeypatch.setattr(sm, "TINYDB_AVAILABLE", False)
+    monkeypatch.setattr(sm, "DUCKDB_AVAILABLE", False)
+    manager = SaveManager(
+        save_directory=str(tmp_path), use_duckdb=False, async_file_writes=True
+    )
+
+    release = threading.Event()
+    original_write = manager._write_file_atomic
+
+    def slow_write(path, payload):
+        release.wait(5)
+        original_write(path, payload)
+
+    monkeypatch.setattr(manager, "_write_file_atomic", slow_write)
+    state = {"turn": 1}
+    path = manager.save_game(state, "auto")
+
+    # save_game returns before the disk write, and later mutation of the
+    # game state does not leak into the queued save
+    assert not (tmp_path / "auto.json").exists()
+    state["turn"] = 2
+    release.set()
+    assert manager.load_game("auto") == {"turn": 1}
+    assert path == str(tmp_path / "auto.json")
+
+    def failing_write(path, payload):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(manager, "_write_file_atomic", failing_write)
+    manager.save_game(state, "broken")
+    with pytest.raises(OSError):
+        manager.await_pending_saves()
+
+    # Reads only log a failed write; the next explicit flush raises it
+    manager.save_game(state, "broken")
+    assert manager.load_game("auto") == {"turn": 1}
+    assert [s["save_name"] for s in manager.list_saves()] == ["auto"]
+    with pytest.raises(OSError):
+        manager.flush()
+    manager.flush()
+    manager.close()
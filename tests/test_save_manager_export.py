@@ -47,3 +47,20 @@ def test_export_import_duckdb(tmp_path):
     imported_name = manager.import_save(str(json_file), "imported_duckdb")
     assert manager.load_game(imported_name) == data
 
+
+def test_import_into_duckdb(tmp_path):
+    """Imports into a DuckDB-backed manager are parsed by DuckDB."""
+    manager = SaveManager(save_directory=str(tmp_path / "saves"), use_duckdb=True)
+
+    wrapped = tmp_path / "wrapped.json"
+    wrapped.write_text(
+        json.dumps({"metadata": {}, "game_state": {"value": 1.5, "names": ["a"]}})
+    )
+    bare = tmp_path / "bare.json"
+    bare.write_text(json.dumps({"value": 7}))
+
+    assert manager.import_save(str(wrapped), "wrapped") == "wrapped"
+    assert manager.import_save(str(bare), "bare") == "bare"
+    assert manager.load_game("wrapped") == {"value": 1.5, "names": ["a"]}
+    assert manager.load_game("bare") == {"value": 7}
+    assert sorted(s["save_name"] for s in manager.list_saves()) == ["bare", "wrapped"]
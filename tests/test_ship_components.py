@@ -0,0 +1,422 @@
+"""
+Unit tests for the ship component manager.
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+import pyaurora4x.data.ship_components as sc
+from pyaurora4x.core.enums import ShipType
+from pyaurora4x.data.ship_components import ShipComponentManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """A manager backed by the built-in default components."""
+    return ShipComponentManager(data_directory=str(tmp_path))
+
+
+class TestComponentCatalog:
+    """Test the loaded component catalog."""
+
+    def test_catalog_loaded_on_first_access(self, tmp_path):
+        """Creating a manager does not touch the data files."""
+        with patch.object(
+            ShipComponentManager,
+            "load_components",
+            autospec=True,
+            side_effect=ShipComponentManager.load_components,
+        ) as load:
+            manager = ShipComponentManager(data_directory=str(tmp_path))
+            assert load.call_count == 0
+            assert manager.get_component("cargo_bay") is not None
+            assert manager.get_components_by_type("engine")
+            assert load.call_count == 1
+        assert manager.designs == {}
+
+    def test_default_components_built_once(self, manager, tmp_path):
+        """Managers without a catalog file share the default components."""
+        other = ShipComponentManager(data_directory=str(tmp_path / "other"))
+        assert not other.components_loaded
+        assert other.get_component("cargo_bay") is manager.get_component("cargo_bay")
+        assert len(other.components) == len(sc._DEFAULT_COMPONENT_SPECS)
+
+    def test_promoted_attributes(self, manager):
+        """Frequently read attributes are available as fields."""
+        reactor = manager.get_component("nuclear_reactor")
+        assert reactor.power_output == reactor.attributes["power_output"] == 1000.0
+        assert reactor.fuel_consumption == 1.0
+        assert manager.get_component("basic_crew_quarters").crew_capacity == 10
+        assert manager.get_component("basic_fuel_tank").fuel_type == "chemical"
+
+        cargo = manager.get_component("cargo_bay")
+        assert (cargo.power_output, cargo.crew_capacity, cargo.fuel_type) == (
+            0.0,
+            0,
+            None,
+        )
+
+    def test_promoted_attributes_accept_modded_values(self):
+        """Loosely typed attribute values do not reject the component."""
+        quarters = sc._build_component(
+            "bunks",
+            {
+                "type": "crew_quarters",
+                "attributes": {"crew_capacity": 12.5, "fuel_type": 3},
+            },
+        )
+        assert quarters.crew_capacity == 12.5
+        assert quarters.fuel_type == "3"
+        assert quarters.attributes == {"crew_capacity": 12.5, "fuel_type": 3}
+
+        odd = sc._build_component(
+            "odd",
+            {"type": "power_plant", "attributes": {"power_output": "50", "crew_capacity": "many"}},
+        )
+        assert odd.power_output == 50.0
+        assert odd.crew_capacity == 0
+
+    def test_components_are_immutable(self, manager):
+        """Shared catalog entries cannot be modified in place."""
+        engine = manager.get_component("chemical_engine")
+        with pytest.raises(ValidationError):
+            engine.mass = 1.0
+
+    def test_available_components_match_requirements(self, manager):
+        """The bitmask filter agrees with checking each requirement."""
+        tech_sets = [
+            [],
+            ["basic_propulsion", "basic_energy"],
+            ["basic_energy", "nuclear_power", "unknown_tech"],
+            sorted({t for c in manager.components.values() for t in c.tech_requirements}),
+        ]
+        for researched in tech_sets:
+            expected = [
+                c
+                for c in manager.components.values()
+                if all(t in researched for t in c.tech_requirements)
+            ]
+            assert manager.get_available_components(researched) == expected
+
+        assert len(manager.get_available_components(tech_sets[-1])) == len(
+            manager.components
+        )
+
+    def test_repeated_strings_are_shared(self, manager, tmp_path):
+        """Components parsed from JSON share their type and tech ID strings."""
+        manager.save_components()
+        loaded = ShipComponentManager(data_directory=str(tmp_path))
+        loaded.load_components()
+
+        engine, other_engine = loaded.get_components_by_type("engine")[:2]
+        assert engine.component_type is other_engine.component_type
+
+        sensors = loaded.get_component("basic_sensors")
+        assert sensors.tech_requirements[0] is sys.intern("basic_sensors")
+
+    def test_all_components_view_is_read_only(self, manager):
+        """The catalog view reflects the manager but cannot be modified."""
+        view = manager.get_all_components()
+        assert view["cargo_bay"] is manager.get_component("cargo_bay")
+        with pytest.raises(TypeError):
+            view["cargo_bay"] = None
+        with pytest.raises(TypeError):
+            manager.get_all_designs()["new"] = None
+
+    def test_batched_availability_matches_single_queries(self, manager):
+        """Batch queries agree with per-state queries, including >64 techs."""
+        all_techs = sorted(
+            {t for c in manager.components.values() for t in c.tech_requirements}
+        )
+        tech_states = [[], ["basic_energy"], all_techs[::2], all_techs]
+        expected = [manager.get_available_components(s) for s in tech_states]
+        assert manager.get_available_components_batch(tech_states) == expected
+        assert manager.get_available_components_batch([]) == []
+
+        # Requirements spanning several 64-bit words
+        many = sc._build_component(
+            "many", {"tech_requirements": [f"tech_{i}" for i in range(130)]}
+        )
+        manager.components["many"] = many
+        high_only = [f"tech_{i}" for i in range(64, 130)]
+        states = [high_only, high_only + [f"tech_{i}" for i in range(64)]]
+        batch = manager.get_available_components_batch(states)
+        assert [many in result for result in batch] == [False, True]
+
+    def test_replaced_component_is_reindexed(self, manager):
+        """Replacing a component under its ID updates designs and lookups."""
+        parts = ["chemical_engine", "solar_panels", "basic_crew_quarters"]
+        before = manager.create_ship_design("d1", "Before", ShipType.FRIGATE, parts)
+
+        old = manager.components["chemical_engine"]
+        heavy = old.model_copy(update={"mass": old.mass * 100})
+        manager.components["chemical_engine"] = heavy
+
+        after = manager.create_ship_design("d2", "After", ShipType.FRIGATE, parts)
+        assert after.total_mass == before.total_mass + heavy.mass - old.mass
+        assert heavy in manager.get_components_by_type("engine")
+        assert old not in manager.get_components_by_type("engine")
+
+    def test_components_by_type(self, manager):
+        """Type lookups return every component of that type, and copies."""
+        engines = manager.get_components_by_type("engine")
+        assert engines == [
+            c for c in manager.components.values() if c.component_type == "engine"
+        ]
+        engines.clear()
+        assert manager.get_components_by_type("engine")
+        assert manager.get_components_by_type("no_such_type") == []
+
+
+class TestDesigns:
+    """Test ship design bookkeeping."""
+
+    def test_designs_by_type_follow_changes(self, manager):
+        """The per-type view tracks created, replaced and deleted designs."""
+        parts = ["chemical_engine", "solar_panels", "basic_crew_quarters"]
+        manager.create_ship_design("a", "A", ShipType.FRIGATE, parts)
+        manager.create_ship_design("b", "B", ShipType.FRIGATE, parts)
+        assert [d.id for d in manager.get_designs_by_type(ShipType.FRIGATE)] == [
+            "a",
+            "b",
+        ]
+
+        manager.create_ship_design("a", "A2", ShipType.CORVETTE, parts)
+        assert [d.id for d in manager.get_designs_by_type(ShipType.FRIGATE)] == ["b"]
+        assert [d.name for d in manager.get_designs_by_type(ShipType.CORVETTE)] == [
+            "A2"
+        ]
+
+        assert manager.delete_design("b")
+        assert not manager.delete_design("b")
+        assert manager.get_designs_by_type(ShipType.FRIGATE) == []
+        assert set(manager.designs) == {"a"}
+
+    def test_designs_by_type_loads_designs(self, manager, tmp_path):
+        """The per-type view loads the designs file on a fresh manager."""
+        parts = ["chemical_engine", "solar_panels", "basic_crew_quarters"]
+        manager.create_ship_design("a", "A", ShipType.FRIGATE, parts)
+        manager.save_designs()
+
+        fresh = ShipComponentManager(data_directory=str(tmp_path))
+        assert [d.id for d in fresh.get_designs_by_type(ShipType.FRIGATE)] == ["a"]
+
+    def test_design_totals(self, manager):
+        """Design totals add up every listed component, repeats included."""
+        parts = [
+            "chemical_engine",
+            "nuclear_reactor",
+            "basic_crew_quarters",
+            "cargo_bay",
+            "cargo_bay",
+            "cargo_bay",
+        ]
+        design = manager.create_ship_design("hauler", "Hauler", ShipType.FREIGHTER, parts)
+        components = [manager.get_component(cid) for cid in parts]
+
+        assert design.total_mass == pytest.approx(sum(c.mass for c in components))
+        assert design.total_cost == sum(c.cost for c in components)
+        assert design.crew_requirement == sum(c.crew_requirement for c in components)
+        assert isinstance(design.total_cost, int)
+
+
+class TestDesignValidation:
+    """Test ship design validation rules."""
+
+    def _validate(self, manager, component_ids, ship_type=ShipType.FRIGATE):
+        components = [manager.get_component(cid) for cid in component_ids]
+        return manager._validate_ship_design(components, ship_type)
+
+    def test_valid_design(self, manager):
+        """A powered, crewed design with propulsion passes cleanly."""
+        result = self._validate(
+            manager, ["chemical_engine", "solar_panels", "basic_crew_quarters"]
+        )
+        assert result == {"valid": True, "errors": [], "warnings": []}
+
+    def test_errors_and_warnings(self, manager):
+        """Each rule reports its own error or warning."""
+        result = self._validate(manager, ["laser_cannon", "nuclear_reactor"])
+        assert result["errors"] == ["Insufficient crew quarters: need 7, have 0"]
+        assert result["warnings"] == ["Ship has no propulsion system"]
+
+        result = self._validate(manager, ["basic_shields", "basic_crew_quarters"])
+        assert result["errors"] == [
+            "Ship must have at least one power plant",
+            "Power deficit: need 310.0, generate 0",
+        ]
+
+        # Mining ships may go without engines
+        result = self._validate(
+            manager, ["solar_panels", "basic_crew_quarters"], ShipType.MINING_SHIP
+        )
+        assert result["warnings"] == []
+
+    def test_fuel_consuming_engine_needs_tank(self, manager):
+        """Engines that burn fuel warn when the design has no tank."""
+        engine = sc._build_component(
+            "thirsty_engine", {"type": "engine", "attributes": {"fuel_consumption": 1.0}}
+        )
+        power = manager.get_component("solar_panels")
+        quarters = manager.get_component("basic_crew_quarters")
+        tank = manager.get_component("basic_fuel_tank")
+
+        result = manager._validate_ship_design(
+            [engine, power, quarters], ShipType.FRIGATE
+        )
+        assert result["warnings"] == [
+            "Ship has fuel-consuming engines but no fuel tanks"
+        ]
+        result = manager._validate_ship_design(
+            [engine, power, quarters, tank], ShipType.FRIGATE
+        )
+        assert result["warnings"] == []
+
+    def test_repeated_designs_reuse_totals(self, manager):
+        """Identical component lists are only totalled and validated once."""
+        with patch.object(
+            manager, "_validate_ship_design", wraps=manager._validate_ship_design
+        ) as validate:
+            parts = ["chemical_engine", "solar_panels", "basic_crew_quarters"]
+
+            first = manager.create_ship_design("a", "A", ShipType.FRIGATE, parts)
+            second = manager.create_ship_design("b", "B", ShipType.FRIGATE, list(parts))
+            assert validate.call_count == 1
+            assert (first.total_mass, first.total_cost, first.crew_requirement) == (
+                second.total_mass,
+                second.total_cost,
+                second.crew_requirement,
+            )
+            assert first.total_mass == 110.0
+
+            # Reordering the same components is still a cache hit
+            reordered = manager.create_ship_design(
+                "r", "R", ShipType.FRIGATE, list(reversed(parts))
+            )
+            assert validate.call_count == 1
+            assert reordered.components == list(reversed(parts))
+
+            manager.create_ship_design("c", "C", ShipType.CORVETTE, parts)
+            assert validate.call_count == 2
+
+            # Reloading the catalog invalidates the cached totals
+            manager.load_components()
+            manager.create_ship_design("d", "D", ShipType.FRIGATE, parts)
+            assert validate.call_count == 3
+
+            assert manager.create_ship_design("e", "E", ShipType.FRIGATE, ["nope"]) is None
+            assert (
+                manager.create_ship_design("f", "F", ShipType.FRIGATE, parts + [None, 3])
+                is None
+            )
+
+    def test_repeated_components_scale_totals(self, manager):
+        """Duplicate IDs count once per occurrence in totals and validation."""
+        parts = ["chemical_engine", "solar_panels"] + ["basic_crew_quarters"] * 3
+        distinct = ["chemical_engine", "solar_panels", "basic_crew_quarters"]
+        design = manager.create_ship_design("dup", "Dup", ShipType.FRIGATE, parts)
+
+        expected_mass = sum(manager.get_component(cid).mass for cid in parts)
+        expected_cost = sum(manager.get_component(cid).cost for cid in parts)
+        assert design.total_mass == pytest.approx(expected_mass)
+        assert design.total_cost == expected_cost
+        assert design.components == parts
+
+        components = [manager.get_component(cid) for cid in distinct]
+        assert manager._validate_ship_design(
+            components, ShipType.FRIGATE, [1, 1, 3]
+        ) == manager._validate_ship_design(
+            [manager.get_component(cid) for cid in parts], ShipType.FRIGATE
+        )
+
+        # Stacked weapons scale their crew and power needs
+        heavy = ["solar_panels"] + ["laser_cannon"] * 4
+        result = manager._validate_ship_design(
+            [manager.get_component(cid) for cid in ["solar_panels", "laser_cannon"]],
+            ShipType.FRIGATE,
+            [1, 4],
+        )
+        assert result == manager._validate_ship_design(
+            [manager.get_component(cid) for cid in heavy], ShipType.FRIGATE
+        )
+
+
+class TestComponentPersistence:
+    """Test saving and loading component catalogs."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_components_round_trip(self, manager, tmp_path, monkeypatch, use_orjson):
+        """Saved components load back identically with either JSON encoder."""
+        monkeypatch.setattr(sc, "ORJSON_AVAILABLE", use_orjson and sc.ORJSON_AVAILABLE)
+        manager.save_components()
+
+        reloaded = ShipComponentManager(data_directory=str(tmp_path))
+        assert reloaded.components_loaded
+        assert reloaded.get_all_components() == manager.get_all_components()
+
+    def test_stream_parsed_catalog_matches(self, manager, tmp_path, monkeypatch):
+        """Large files streamed through ijson load the same components."""
+        if not sc.IJSON_AVAILABLE:
+            pytest.skip("ijson C backend not installed")
+        manager.save_components()
+        monkeypatch.setattr(sc, "_STREAM_PARSE_THRESHOLD", 0)
+
+        def no_full_parse(data):
+            raise AssertionError("file should be streamed")
+
+        monkeypatch.setattr(sc, "_json_loads", no_full_parse)
+        streamed = ShipComponentManager(data_directory=str(tmp_path))
+        assert streamed.components_loaded
+        assert streamed.get_all_components() == manager.get_all_components()
+
+    def test_failed_save_keeps_previous_file(self, manager, tmp_path, monkeypatch):
+        """An interrupted write leaves the existing catalog untouched."""
+        path = manager.save_components()
+        original = (tmp_path / "ship_components.json").read_bytes()
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(sc.os, "replace", fail)
+        with pytest.raises(OSError):
+            manager.save_components()
+        assert (tmp_path / "ship_components.json").read_bytes() == original
+        assert sorted(p.name for p in tmp_path.iterdir()) == [os.path.basename(path)]
+
+    def test_malformed_entries_skipped(self, tmp_path):
+        """Entries with unusable values are dropped, the rest still load."""
+        (tmp_path / "ship_components.json").write_text(
+            '{"components": {"good": {"type": "engine", "mass": 5, "cost": "7"},'
+            ' "bad": {"type": "engine", "mass": "heavy"}}}'
+        )
+        manager = ShipComponentManager(data_directory=str(tmp_path))
+
+        assert list(manager.components) == ["good"]
+        good = manager.get_component("good")
+        assert (good.name, good.mass, good.cost) == ("Good", 5.0, 7)
+        assert isinstance(good.mass, float)
+
+    def test_pickle_cache_used_until_json_changes(self, manager, tmp_path):
+        """Warm starts skip parsing until the JSON file is modified."""
+        path = manager.save_components()
+        ShipComponentManager(data_directory=str(tmp_path)).load_components()
+        assert (tmp_path / "ship_components.json.pkl").exists()
+
+        with patch.object(
+            ShipComponentManager,
+            "_load_components_from_data",
+            autospec=True,
+            side_effect=ShipComponentManager._load_components_from_data,
+        ) as parse:
+            cached = ShipComponentManager(data_directory=str(tmp_path))
+            assert cached.get_all_components() == manager.get_all_components()
+            assert parse.call_count == 0
+
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            ShipComponentManager(data_directory=str(tmp_path)).load_components()
+            assert parse.call_count == 1
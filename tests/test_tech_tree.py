@@ -1,12 +1,29 @@
 """Unit tests for the TechTreeManager."""
 
 import logging
+import sys
+from unittest.mock import patch
 
+import pytest
+
+import pyaurora4x.data.tech_tree as tt
 from pyaurora4x.data.tech_tree import TechTreeManager
 from pyaurora4x.core.models import Technology
 from pyaurora4x.core.enums import TechnologyType
 
 
+def tech(tech_id, *prereqs, tech_type=TechnologyType.PHYSICS):
+    """Build a minimal technology with the given prerequisites."""
+    return Technology(
+        id=tech_id,
+        name=tech_id,
+        description="",
+        tech_type=tech_type,
+        research_cost=1,
+        prerequisites=list(prereqs),
+    )
+
+
 class TestTechTreeManager:
     """Tests for the TechTreeManager."""
 
@@ -17,6 +34,39 @@ class TestTechTreeManager:
         assert manager.tech_tree_loaded
         assert "basic_propulsion" in manager.technologies
 
+    def test_tree_loaded_on_first_use(self):
+        """Creating a manager does not touch the tech file."""
+        with patch.object(
+            TechTreeManager,
+            "load_tech_tree",
+            autospec=True,
+            side_effect=TechTreeManager.load_tech_tree,
+        ) as load:
+            manager = TechTreeManager(data_directory="data")
+            assert load.call_count == 0
+            assert manager.get_research_path("nuclear_power", set()) == [
+                "basic_energy",
+                "nuclear_power",
+            ]
+            assert manager.get_technology("basic_energy") is not None
+            assert load.call_count == 1
+
+    def test_fallback_tree_built_once(self, tmp_path):
+        """Managers without a tech file share one build of the defaults."""
+        tt._build_default_technologies.cache_clear()
+        first = TechTreeManager(data_directory=str(tmp_path))
+        second = TechTreeManager(data_directory=str(tmp_path))
+
+        assert not first.tech_tree_loaded
+        assert "basic_propulsion" in first.technologies
+        assert first.technologies == second.technologies
+        assert tt._build_default_technologies.cache_info().misses == 1
+
+        # Research progress on one manager's tree stays there
+        first.technologies["basic_energy"].is_researched = True
+        assert not second.technologies["basic_energy"].is_researched
+        assert not tt._build_default_technologies()[3].is_researched
+
     def test_validate_default_prerequisites(self, caplog):
         """Validation should report any invalid prerequisites."""
         manager = TechTreeManager(data_directory="data")
@@ -25,12 +75,37 @@ class TestTechTreeManager:
             manager._validate_tech_tree()
 
         # No circular dependencies expected in default tree
-        for tech in manager.technologies.values():
-            assert not manager._has_circular_dependency(tech.id)
+        assert not any("Circular dependency" in r.message for r in caplog.records)
 
         # Some technologies intentionally reference unknown prerequisites
         assert any("Invalid prerequisite" in r.message for r in caplog.records)
 
+    def test_unknown_references_reported_per_tech(self, caplog):
+        """Each unknown prerequisite or unlock is reported against its tech."""
+        manager = TechTreeManager(data_directory="data")
+        technologies = manager.technologies
+        caplog.clear()
+
+        with caplog.at_level(logging.WARNING):
+            manager._validate_tech_tree()
+
+        messages = [r.message.strip() for r in caplog.records]
+        expected_errors = [
+            f"Invalid prerequisite {prereq} for {tech.id}"
+            for tech in technologies.values()
+            for prereq in tech.prerequisites
+            if prereq not in technologies
+        ]
+        expected_warnings = [
+            f"Technology {tech.id} unlocks unknown tech: {unlock}"
+            for tech in technologies.values()
+            for unlock in tech.unlocks
+            if unlock not in technologies
+        ]
+        assert expected_errors and expected_warnings
+        assert [m for m in messages if m.startswith("Invalid")] == expected_errors
+        assert [m for m in messages if "unlocks unknown" in m] == expected_warnings
+
     def test_get_research_path(self):
         """Research path should include all prerequisites in order."""
         manager = TechTreeManager(data_directory="data")
@@ -51,6 +126,199 @@ class TestTechTreeManager:
 
         assert path == expected
 
+    def test_technologies_by_type(self):
+        """Type lookups return every technology of that type."""
+        manager = TechTreeManager(data_directory="data")
+
+        for tech_type in TechnologyType:
+            expected = [
+                tech for tech in manager.technologies.values()
+                if tech.tech_type == tech_type
+            ]
+            assert manager.get_technologies_by_type(tech_type) == expected
+
+        # Callers get their own list
+        manager.get_technologies_by_type(TechnologyType.ENERGY).clear()
+        assert manager.get_technologies_by_type(TechnologyType.ENERGY)
+
+    def test_all_technologies_view_is_read_only(self):
+        """The shared view cannot change the tree; the copy is independent."""
+        manager = TechTreeManager(data_directory="data")
+
+        view = manager.get_all_technologies()
+        assert dict(view) == manager.technologies
+        with pytest.raises(TypeError):
+            view["basic_energy"] = None
+
+        copy = manager.get_all_technologies_copy()
+        copy.pop("basic_energy")
+        assert "basic_energy" in manager.technologies
+
+    def test_available_technologies(self):
+        """Only unresearched techs with every prerequisite known are offered."""
+        manager = TechTreeManager(data_directory="data")
+        researched = ["basic_energy", "basic_propulsion"]
+
+        available = manager.get_available_technologies(researched)
+
+        expected = [
+            tech for tech in manager.technologies.values()
+            if tech.id not in researched
+            and all(prereq in researched for prereq in tech.prerequisites)
+        ]
+        assert available == expected
+        assert "advanced_propulsion" in [tech.id for tech in available]
+        assert manager.get_available_technologies(set(researched)) == expected
+
+    def test_available_technologies_follow_progress(self):
+        """Growing and shrinking researched sets give fresh answers."""
+        manager = TechTreeManager(data_directory="data")
+
+        def expected(researched):
+            return [
+                tech for tech in manager.technologies.values()
+                if tech.id not in researched
+                and all(prereq in researched for prereq in tech.prerequisites)
+            ]
+
+        researched = set()
+        steps = ["basic_energy", "basic_propulsion", "nuclear_power",
+                 "magnetic_confinement", "fusion_power", "advanced_propulsion"]
+        for tech_id in steps:
+            researched.add(tech_id)
+            assert manager.get_available_technologies(researched, "e1") == expected(researched)
+            # Another empire does not disturb the first one's state
+            assert manager.get_available_technologies({"basic_sensors"}, "e2") == expected(
+                {"basic_sensors"}
+            )
+
+        # Asking again without progress reuses the result in a new list
+        repeat = manager.get_available_technologies(researched, "e1")
+        assert repeat == expected(researched)
+        repeat.clear()
+        assert manager.get_available_technologies(researched, "e1") == expected(researched)
+
+        # Losing a technology falls back to a full recomputation
+        researched.discard("basic_energy")
+        assert manager.get_available_technologies(researched, "e1") == expected(researched)
+
+    def test_indexes_follow_replaced_tree(self):
+        """Replacing or extending the technology dict refreshes every index."""
+        manager = TechTreeManager(data_directory="data")
+        assert manager.get_available_technologies(set(), "e1")
+
+        manager.technologies = {t.id: t for t in [tech("root"), tech("leaf", "root")]}
+
+        assert [t.id for t in manager.get_technologies_by_type(TechnologyType.PHYSICS)] == [
+            "root",
+            "leaf",
+        ]
+        assert manager.get_technologies_by_type(TechnologyType.PROPULSION) == []
+        assert manager.get_research_path("leaf", set()) == ["root", "leaf"]
+        assert [t.id for t in manager.get_available_technologies(set())] == ["root"]
+        assert [t.id for t in manager.get_available_technologies(set(), "e1")] == ["root"]
+        assert [t.id for t in manager.get_available_technologies(set(), "e2")] == ["root"]
+
+        # Technologies added to the dict directly are picked up as well
+        manager.technologies["extra"] = tech("extra")
+        assert [t.id for t in manager.get_available_technologies(set(), "e1")] == [
+            "root",
+            "extra",
+        ]
+        assert manager.get_research_path("extra", set()) == ["extra"]
+
+    def test_tree_summary(self):
+        """The summary reports counts, cost statistics and complexity."""
+        manager = TechTreeManager(data_directory="data")
+        techs = list(manager.technologies.values())
+        costs = [tech.research_cost for tech in techs]
+
+        summary = manager.get_technology_tree_summary()
+
+        assert summary["total_technologies"] == len(techs)
+        assert sum(summary["by_type"].values()) == len(techs)
+        assert summary["by_type"]["propulsion"] == len(
+            manager.get_technologies_by_type(TechnologyType.PROPULSION)
+        )
+        assert summary["research_costs"] == {
+            "total": sum(costs),
+            "average": sum(costs) / len(costs),
+            "min": min(costs),
+            "max": max(costs),
+        }
+        assert summary["complexity"] == {
+            "max_prerequisites": max(len(t.prerequisites) for t in techs),
+            "technologies_with_no_prerequisites": sum(not t.prerequisites for t in techs),
+            "technologies_with_no_unlocks": sum(not t.unlocks for t in techs),
+        }
+
+    def test_parse_tech_type(self):
+        """Type names are case-insensitive and unknown ones fall back."""
+        manager = TechTreeManager(data_directory="data")
+
+        assert manager._parse_tech_type("Energy") is TechnologyType.ENERGY
+        assert manager._parse_tech_type("WEAPONS") is TechnologyType.WEAPONS
+        assert manager._parse_tech_type("psionics") is TechnologyType.ENGINEERING
+
+    def test_tech_ids_are_interned(self):
+        """IDs in the tree and its prerequisite lists share one string each."""
+        manager = TechTreeManager(data_directory="data")
+
+        energy = manager.get_technology("basic_energy")
+        nuclear = manager.get_technology("nuclear_power")
+        assert energy.id is sys.intern("basic_energy")
+        assert nuclear.prerequisites[0] is energy.id
+        key = next(k for k in manager.technologies if k == "basic_energy")
+        assert key is energy.id
+
+    def test_tree_summary_cached_until_tree_changes(self):
+        """The summary is computed once per tree."""
+        manager = TechTreeManager(data_directory="data")
+        with patch.object(
+            manager, "_summarize_tree", wraps=manager._summarize_tree
+        ) as summarize:
+            first = manager.get_technology_tree_summary()
+            assert manager.get_technology_tree_summary() is first
+            assert summarize.call_count == 1
+
+            manager.load_tech_tree()
+            assert manager.get_technology_tree_summary() == first
+            assert summarize.call_count == 2
+
+            manager.technologies = {"solo": manager.technologies["basic_energy"]}
+            assert manager.get_technology_tree_summary()["total_technologies"] == 1
+            assert summarize.call_count == 3
+
+    def test_research_path_skips_researched(self):
+        """Known technologies are left out of the research path."""
+        manager = TechTreeManager(data_directory="data")
+        researched = {"basic_propulsion", "basic_energy", "nuclear_power"}
+
+        path = manager.get_research_path("fusion_drive", researched)
+
+        assert path == [
+            "advanced_propulsion",
+            "magnetic_confinement",
+            "fusion_power",
+            "fusion_drive",
+        ]
+        assert manager.get_research_path("fusion_drive", {"fusion_drive"}) == []
+        assert manager.get_research_path("no_such_tech", set()) == []
+
+    def test_research_path_stops_at_researched(self):
+        """Prerequisites of a researched technology are not needed again."""
+        manager = TechTreeManager(data_directory="data")
+
+        path = manager.get_research_path("zero_point_energy", {"quantum_physics"})
+
+        assert path == [
+            "basic_energy",
+            "nuclear_power",
+            "magnetic_confinement",
+            "fusion_power",
+            "zero_point_energy",
+        ]
+
     def test_validation_edge_cases(self, caplog):
         """Validation should detect missing and circular prerequisites."""
         manager = TechTreeManager(data_directory="data")
@@ -90,3 +358,98 @@ class TestTechTreeManager:
         messages = "\n".join(record.message for record in caplog.records)
         assert "Circular dependency detected" in messages
         assert "Invalid prerequisite missing" in messages
+        # The cycle is reported once, starting from its smallest ID
+        assert messages.count("Circular dependency detected") == 1
+        assert "Circular dependency detected: a -> b -> a" in messages
+
+    def test_cycles_reported_once_each(self, caplog):
+        """Each cycle is reported once, however many techs lead into it."""
+        manager = TechTreeManager(data_directory="data")
+
+        manager.technologies = {
+            t.id: t
+            for t in [
+                tech("z", "y"),
+                tech("y", "x"),
+                tech("x", "z"),
+                tech("after", "x"),
+                tech("self", "self"),
+                tech("root"),
+            ]
+        }
+
+        with caplog.at_level(logging.ERROR):
+            manager._validate_tech_tree()
+
+        cycles = [r.message.strip() for r in caplog.records if "Circular" in r.message]
+        assert cycles == [
+            "Circular dependency detected: x -> z -> y -> x",
+            "Circular dependency detected: self -> self",
+        ]
+        assert sorted(manager._topo_order) == sorted(manager.technologies)
+        assert manager._topo_order.index("x") < manager._topo_order.index("after")
+
+    def test_topological_order(self):
+        """Every technology appears after all of its prerequisites."""
+        manager = TechTreeManager(data_directory="data")
+
+        technologies = manager.technologies
+        order = manager._topo_order
+        assert sorted(order) == sorted(technologies)
+        position = {tech_id: i for i, tech_id in enumerate(order)}
+        for tech in manager.technologies.values():
+            for prereq in tech.prerequisites:
+                if prereq in position:
+                    assert position[prereq] < position[tech.id]
+
+    @pytest.mark.parametrize("pretty", [False, True])
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_round_trip(self, tmp_path, monkeypatch, use_orjson, pretty):
+        """A saved tree loads back identically with either JSON encoder."""
+        monkeypatch.setattr(tt, "ORJSON_AVAILABLE", use_orjson and tt.ORJSON_AVAILABLE)
+        manager = TechTreeManager(data_directory="data")
+        manager.save_tech_tree(str(tmp_path / "techs.json"), pretty=pretty)
+        text = (tmp_path / "techs.json").read_text()
+        assert ("\n" in text) == pretty
+
+        reloaded = TechTreeManager(data_directory=str(tmp_path))
+        assert reloaded.tech_tree_loaded
+        assert reloaded.technologies == manager.technologies
+
+    def test_stream_parsed_tree_matches(self, tmp_path, monkeypatch):
+        """Large files streamed through ijson load the same technologies."""
+        if not tt.IJSON_AVAILABLE:
+            pytest.skip("ijson C backend not installed")
+        manager = TechTreeManager(data_directory="data")
+        manager.save_tech_tree(str(tmp_path / "techs.json"))
+        monkeypatch.setattr(tt, "_STREAM_PARSE_THRESHOLD", 0)
+
+        def no_full_parse(data):
+            raise AssertionError("file should be streamed")
+
+        monkeypatch.setattr(tt, "_json_loads", no_full_parse)
+        streamed = TechTreeManager(data_directory=str(tmp_path))
+        assert streamed.tech_tree_loaded
+        assert streamed.technologies == manager.technologies
+
+    def test_invalid_entries_skipped(self, tmp_path, monkeypatch, caplog):
+        """Bad entries are logged and dropped while the rest still load."""
+        monkeypatch.setattr(tt, "_VALIDATION_BATCH_SIZE", 2)
+        (tmp_path / "techs.json").write_text(
+            """{"technologies": {
+                "good": {"type": "energy", "research_cost": 5},
+                "bad_cost": {"research_cost": "lots"},
+                "bad_entry": [],
+                "also_good": {"prerequisites": ["good"]},
+                "last": {}
+            }}"""
+        )
+
+        manager = TechTreeManager(data_directory=str(tmp_path))
+
+        assert manager.tech_tree_loaded
+        assert list(manager.technologies) == ["good", "also_good", "last"]
+        assert manager.get_technology("good").tech_type is TechnologyType.ENERGY
+        assert manager.get_technology("also_good").name == "Also Good"
+        errors = [r.message for r in caplog.records if "Error loading technology" in r.message]
+        assert len(errors) == 2
@@ -0,0 +1,129 @@
+"""
+Unit tests for PyAurora 4X core utility functions.
+"""
+
+import math
+
+import pytest
+
+from pyaurora4x.core.models import Vector3D
+from pyaurora4x.core.utils import (
+    StarKepler,
+    angle_between_vectors,
+    calculate_travel_time,
+    calculate_travel_times,
+    cross_product,
+    cross_product_raw,
+    exponential_decay,
+    exponential_decay_arr,
+    format_distance,
+    format_mass,
+    format_time,
+    lerp,
+    lerp_arr,
+    orbital_period,
+    sigmoid,
+    sigmoid_arr,
+    within_angle,
+)
+
+
+class TestFormatters:
+    """Test the human-readable unit formatters."""
+
+    def test_format_time_boundaries(self):
+        """Each threshold switches to the next unit."""
+        assert format_time(59.95) == "60.0s"
+        assert format_time(60) == "1.0m"
+        assert format_time(3600) == "1.0h"
+        assert format_time(86400) == "1.0d"
+        assert format_time(31536000 * 2.5) == "2.5y"
+
+    def test_format_distance_boundaries(self):
+        """Distances scale from km up to AU."""
+        assert format_distance(12.34) == "12.3 km"
+        assert format_distance(1000) == "1.0 Mm"
+        assert format_distance(2.5e6) == "2.5 Gm"
+        assert format_distance(1.496e8) == "1.00 AU"
+
+    def test_format_mass_ranges(self):
+        """Masses use Earth masses until they approach stellar scale."""
+        assert format_mass(5.972e23) == "0.10 M⊕"
+        assert format_mass(5.972e25) == "10.0 M⊕"
+        assert format_mass(1.989e30) == "1.00 M☉"
+
+
+class TestKepler:
+    """Test orbital period helpers."""
+
+    def test_star_kepler_matches_orbital_period(self):
+        """The per-star specialisation agrees with the generic formula."""
+        sun = StarKepler(1.989e30)
+        for a in (5.79e10, 1.496e11, 7.785e11):
+            assert sun.period(a) == pytest.approx(orbital_period(a, 1.989e30))
+
+        periods = sun.periods([1.496e11, 2.279e11])
+        assert periods[0] == pytest.approx(sun.period(1.496e11))
+        assert periods[1] == pytest.approx(sun.period(2.279e11))
+
+
+class TestVectorizedHelpers:
+    """Test the array variants of the scalar helpers."""
+
+    def test_array_variants_match_scalars(self):
+        """Each array helper agrees element-wise with its scalar version."""
+        values = [0.0, 1.5, 10.0]
+        decayed = exponential_decay_arr(values, 0.3, 2.0)
+        squashed = sigmoid_arr(values, steepness=2.0, midpoint=1.0)
+        blended = lerp_arr(values, 20.0, 0.25)
+
+        for i, v in enumerate(values):
+            assert decayed[i] == pytest.approx(exponential_decay(v, 0.3, 2.0))
+            assert squashed[i] == pytest.approx(sigmoid(v, 2.0, 1.0))
+            assert blended[i] == pytest.approx(lerp(v, 20.0, 0.25))
+
+    def test_sigmoid_arr_saturates_without_overflow(self):
+        """Extreme inputs clamp to the sigmoid's asymptotes."""
+        result = sigmoid_arr([-1e6, 1e6])
+        assert result[0] == 0.0
+        assert result[1] == 1.0
+
+    def test_calculate_travel_times_matches_scalar(self):
+        """Batched travel times agree with per-target calls."""
+        distances = [0.0, 10.0, 25.0, 1000.0]
+        for max_speed, acceleration in ((10.0, 2.0), (10.0, None), (0.0, None)):
+            times = calculate_travel_times(distances, max_speed, acceleration)
+            for i, d in enumerate(distances):
+                assert times[i] == pytest.approx(
+                    calculate_travel_time(d, max_speed, acceleration)
+                )
+
+
+class TestVectorHelpers:
+    """Test vector arithmetic helpers."""
+
+    def test_cross_product_raw_matches_cross_product(self):
+        """The tuple form returns the same components as the model form."""
+        v1 = Vector3D(x=1.0, y=2.0, z=3.0)
+        v2 = Vector3D(x=-4.0, y=0.5, z=2.0)
+        result = cross_product(v1, v2)
+
+        assert cross_product_raw(1.0, 2.0, 3.0, -4.0, 0.5, 2.0) == (
+            result.x,
+            result.y,
+            result.z,
+        )
+        assert cross_product_raw(1.0, 0.0, 0.0, 0.0, 1.0, 0.0) == (0.0, 0.0, 1.0)
+
+    def test_within_angle_agrees_with_angle_between_vectors(self):
+        """The sqrt-free threshold check matches the explicit angle."""
+        forward = Vector3D(x=1.0, y=0.0, z=0.0)
+        diagonal = Vector3D(x=1.0, y=1.0, z=0.0)
+        backward = Vector3D(x=-1.0, y=0.1, z=0.0)
+
+        assert angle_between_vectors(forward, diagonal) == pytest.approx(math.pi / 4)
+        assert within_angle(forward, diagonal, math.pi / 3)
+        assert not within_angle(forward, diagonal, math.pi / 6)
+        assert not within_angle(forward, backward, 2.0)
+        assert within_angle(forward, backward, 3.1)
+        assert within_angle(forward, Vector3D(), 0.0)